@@ -1,5 +1,7 @@
 from django.contrib import admin
-from core.models import UserConfig, GithubRepository, Commit, Report, DeliveryLog
+from core.models import (
+    UserConfig, GithubRepository, CommitFilterRule, Commit, UserCommit, DailyRepoStats, Report, DeliveryLog
+)
 
 
 @admin.register(UserConfig)
@@ -18,15 +20,39 @@ class GithubRepositoryAdmin(admin.ModelAdmin):
     readonly_fields = ['created_at']
 
 
+@admin.register(CommitFilterRule)
+class CommitFilterRuleAdmin(admin.ModelAdmin):
+    list_display = ['pattern', 'user_config', 'repository', 'created_at']
+    search_fields = ['pattern', 'user_config__user__username', 'repository__repo_name']
+    readonly_fields = ['created_at']
+
+
 @admin.register(Commit)
 class CommitAdmin(admin.ModelAdmin):
-    list_display = ['author', 'repository', 'message', 'commit_date', 'files_changed', 'is_processed']
-    list_filter = ['is_processed', 'commit_date', 'repository']
-    search_fields = ['author', 'message', 'commit_sha']
+    list_display = ['author', 'repo_name', 'message', 'category', 'commit_date', 'files_changed']
+    list_filter = ['category', 'stats_fetched', 'commit_date']
+    search_fields = ['author', 'message', 'commit_sha', 'repo_name']
     readonly_fields = ['commit_sha', 'fetched_at']
     ordering = ['-commit_date']
 
 
+@admin.register(UserCommit)
+class UserCommitAdmin(admin.ModelAdmin):
+    list_display = ['commit', 'user_config', 'repository', 'is_processed', 'created_at']
+    list_filter = ['is_processed', 'created_at']
+    search_fields = ['commit__commit_sha', 'user_config__user__username', 'repository__repo_name']
+    readonly_fields = ['created_at']
+    raw_id_fields = ['commit']
+
+
+@admin.register(DailyRepoStats)
+class DailyRepoStatsAdmin(admin.ModelAdmin):
+    list_display = ['user_config', 'repo_name', 'date', 'commit_count', 'additions', 'deletions']
+    list_filter = ['date']
+    search_fields = ['user_config__user__username', 'repo_name']
+    readonly_fields = ['updated_at']
+
+
 @admin.register(Report)
 class ReportAdmin(admin.ModelAdmin):
     list_display = ['user_config', 'report_date', 'status', 'commit_count', 'sent_at']
@@ -0,0 +1,83 @@
+"""
+Custom model fields
+"""
+import zlib
+from functools import lru_cache
+from pathlib import Path
+from django.db import models
+
+DICTIONARY_DIR = Path(__file__).resolve().parent / 'compression'
+
+# Preset zlib dictionaries by id. Stored values name the dictionary they
+# were compressed with, so a file listed here must never change: add a new
+# id instead and point the field at it.
+DICTIONARIES = {
+    1: 'report_layouts_v1.txt',  # Daily report layouts as of the compressed-storage migration
+}
+
+
+@lru_cache(maxsize=None)
+def _dictionary(dictionary_id: int) -> bytes:
+    """Load a preset dictionary once per process (id 0 is no dictionary)"""
+    if dictionary_id == 0:
+        return b''
+    return (DICTIONARY_DIR / DICTIONARIES[dictionary_id]).read_bytes()
+
+
+def compress_text(text: str, dictionary_id: int = 0) -> bytes:
+    """Compress text into a blob whose first byte is the dictionary id"""
+    dictionary = _dictionary(dictionary_id)
+    compressor = zlib.compressobj(9, zdict=dictionary) if dictionary else zlib.compressobj(9)
+    return bytes([dictionary_id]) + compressor.compress(text.encode('utf-8')) + compressor.flush()
+
+
+def decompress_text(blob: bytes) -> str:
+    """Decompress a blob from compress_text"""
+    blob = bytes(blob)  # memoryview on PostgreSQL
+    dictionary = _dictionary(blob[0])
+    decompressor = zlib.decompressobj(zdict=dictionary) if dictionary else zlib.decompressobj()
+    return (decompressor.decompress(blob[1:]) + decompressor.flush()).decode('utf-8')
+
+
+class CompressedTextField(models.BinaryField):
+    """
+    Text stored as a zlib blob and read back as str
+
+    Values are compressed on save and decompressed on load, so the model
+    attribute is always a str. A preset dictionary holding text the values
+    share (e.g. a layout's inline stylesheet) lets even short values skip
+    storing it; the first byte of each blob names the dictionary used.
+    """
+
+    def __init__(self, *args, dictionary_id: int = 0, **kwargs):
+        self.dictionary_id = dictionary_id
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.dictionary_id:
+            kwargs['dictionary_id'] = self.dictionary_id
+        return name, path, args, kwargs
+
+    def get_default(self):
+        if self.has_default():
+            return super().get_default()
+        return None if self.null else ''
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return decompress_text(value)
+
+    def to_python(self, value):
+        if value is None or isinstance(value, str):
+            return value
+        return decompress_text(value)
+
+    def get_prep_value(self, value):
+        if value is None:
+            return value
+        return compress_text(str(value), self.dictionary_id)
+
+    def value_to_string(self, obj):
+        return self.value_from_object(obj)
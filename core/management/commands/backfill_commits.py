@@ -0,0 +1,42 @@
+"""Management command to backfill commits for a range of days"""
+from datetime import date
+from django.core.management.base import BaseCommand, CommandError
+from core.models import UserConfig
+from core.tasks import backfill_commits
+
+
+class Command(BaseCommand):
+    help = 'Fetch commits for a range of days, resuming interrupted backfills'
+
+    def add_arguments(self, parser):
+        parser.add_argument('start_date', type=date.fromisoformat, help='First day to fetch (YYYY-MM-DD)')
+        parser.add_argument('end_date', type=date.fromisoformat, nargs='?', help='Last day to fetch (default: today)')
+        parser.add_argument('--user', help='Only backfill this username (default: all active users)')
+        parser.add_argument('--reports', action='store_true', help='Generate missing reports for each day')
+        parser.add_argument('--async', dest='run_async', action='store_true', help='Queue Celery tasks instead of running here')
+
+    def handle(self, *args, **options):
+        start_date = options['start_date']
+        end_date = options['end_date'] or date.today()
+        if start_date > end_date:
+            raise CommandError('start_date must not be after end_date')
+
+        user_configs = UserConfig.objects.filter(is_active=True).select_related('user')
+        if options['user']:
+            user_configs = user_configs.filter(user__username=options['user'])
+            if not user_configs.exists():
+                raise CommandError(f"No active user {options['user']}")
+
+        for user_config in user_configs:
+            task_args = [user_config.id, start_date.isoformat(), end_date.isoformat(), options['reports']]
+
+            if options['run_async']:
+                backfill_commits.delay(*task_args)
+                self.stdout.write(f'Queued backfill for {user_config.user.username}')
+                continue
+
+            result = backfill_commits.apply(args=task_args).get()
+            self.stdout.write(self.style.SUCCESS(
+                f"✓ {user_config.user.username}: {result['backfilled_commits']} commits, "
+                f"{result['reports_generated']} reports"
+            ))
@@ -0,0 +1,96 @@
+"""Management command to benchmark commit analytics"""
+import random
+import time
+from collections import Counter, defaultdict
+from datetime import date, datetime, time as day_start, timedelta, timezone
+from django.core.management.base import BaseCommand, CommandError
+from pytz import timezone as pytz_timezone
+from core.models import UserConfig
+from core.services.commit_analytics import CommitAnalytics
+
+
+def _reference_aggregate(rows: list, user_tz, start_date: date) -> tuple:
+    """Row-by-row aggregation, kept to check results"""
+    heatmap = Counter()
+    repos = defaultdict(lambda: [0, 0, 0])
+    daily = Counter()
+
+    for commit_date, repository, additions, deletions in rows:
+        local = commit_date.astimezone(user_tz)
+        heatmap[(local.weekday(), local.hour)] += 1
+        totals = repos[repository]
+        totals[0] += 1
+        totals[1] += additions
+        totals[2] += deletions
+        daily[(local.date() - start_date).days] += 1
+
+    return heatmap, repos, daily
+
+
+class Command(BaseCommand):
+    help = 'Time commit analytics over a synthetic dataset against a row-by-row loop'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--commits', type=int, default=1000000, help='Number of synthetic commits')
+        parser.add_argument('--repos', type=int, default=50, help='Number of synthetic repositories')
+        parser.add_argument('--days', type=int, default=365, help='Days covered by the dataset')
+        parser.add_argument('--timezone', default='America/New_York', help='Timezone the activity is bucketed in')
+        parser.add_argument('--seed', type=int, default=0, help='Random seed')
+        parser.add_argument('--user', help='Also time the endpoint query for this username over --days')
+
+    def handle(self, *args, **options):
+        analytics = CommitAnalytics()
+        rng = random.Random(options['seed'])
+        end_date = date.today()
+        start_date = end_date - timedelta(days=options['days'] - 1)
+        user_tz = pytz_timezone(options['timezone'])
+        first = user_tz.localize(datetime.combine(start_date, day_start.min)).timestamp()
+        last = user_tz.localize(datetime.combine(end_date + timedelta(days=1), day_start.min)).timestamp()
+        repos = [f"owner/repo-{i}" for i in range(options['repos'])]
+
+        # Rows shaped like the values_list the endpoint loads (aware UTC datetimes, as Django returns them)
+        rows = [
+            (datetime.fromtimestamp(rng.uniform(first, last - 1), timezone.utc), rng.choice(repos),
+             rng.randint(0, 500), rng.randint(0, 200))
+            for _ in range(options['commits'])
+        ]
+
+        start = time.perf_counter()
+        heatmap, repo_totals, daily = _reference_aggregate(rows, user_tz, start_date)
+        reference_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        columns = analytics.to_columns(rows, user_tz)
+        load_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = analytics.compute(columns, start_date, end_date, window=7)
+        compute_time = time.perf_counter() - start
+
+        expected_heatmap = [[heatmap[(weekday, hour)] for hour in range(24)] for weekday in range(7)]
+        expected_repos = {repo: tuple(totals) for repo, totals in repo_totals.items()}
+        actual_repos = {
+            repo['repository']: (repo['commit_count'], repo['additions'], repo['deletions'])
+            for repo in result['repositories']
+        }
+        expected_daily = [daily[i] for i in range(options['days'])]
+        if (result['heatmap'], actual_repos, result['daily']['commit_count']) != (
+            expected_heatmap, expected_repos, expected_daily
+        ):
+            raise CommandError('Vectorized analytics disagree with the row-by-row aggregation')
+
+        self.stdout.write(f"Commits: {len(rows)} over {options['days']} days, {len(repos)} repos")
+        self.stdout.write(f"Row-by-row: {reference_time * 1000:.0f}ms")
+        self.stdout.write(f"Vectorized: {(load_time + compute_time) * 1000:.0f}ms "
+                          f"({load_time * 1000:.0f}ms to arrays, {compute_time * 1000:.0f}ms to aggregate)")
+        self.stdout.write(self.style.SUCCESS(
+            f"✓ Same results, {reference_time / (load_time + compute_time):.1f}x faster"
+        ))
+
+        if options['user']:
+            user_config = UserConfig.objects.get(user__username=options['user'])
+            start = time.perf_counter()
+            summary = analytics.summarize(user_config, start_date, end_date)
+            self.stdout.write(
+                f"{options['user']}: {summary['commit_count']} commits in {(time.perf_counter() - start) * 1000:.0f}ms"
+            )
@@ -0,0 +1,64 @@
+"""Management command to benchmark commit classification"""
+import random
+import time
+from django.core.management.base import BaseCommand, CommandError
+from core.services.report_generator import ReportGenerator
+
+WORDS = [
+    'user', 'login', 'page', 'api', 'cache', 'parser', 'layout', 'handle', 'null', 'value',
+    'in', 'for', 'the', 'of', 'css', 'tweak', 'wip', 'endpoint', 'query', 'timeout',
+]
+PREFIXES = ['', '', '', 'feat: ', 'fix: ', 'chore: ', 'docs: ', 'Refactor: ']
+
+
+def _reference_classify(generator: ReportGenerator, message: str) -> tuple:
+    """The original keyword-by-keyword classification, kept to check results"""
+    message_lower = message.lower()
+    category = 'general'
+    for name, keywords in generator.action_verbs.items():
+        if any(keyword in message_lower for keyword in keywords):
+            category = name
+            break
+
+    for prefix in generator.prefixes:
+        if message.lower().startswith(prefix):
+            message = message[len(prefix):].strip()
+    if message and message[0].islower():
+        message = message[0].upper() + message[1:]
+
+    return category, message
+
+
+class Command(BaseCommand):
+    help = 'Time commit classification over synthetic messages against the original algorithm'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--messages', type=int, default=100000, help='Number of synthetic messages')
+        parser.add_argument('--seed', type=int, default=0, help='Random seed')
+
+    def handle(self, *args, **options):
+        generator = ReportGenerator()
+        rng = random.Random(options['seed'])
+        keywords = [keyword for words in generator.action_verbs.values() for keyword in words]
+        vocabulary = WORDS * 3 + keywords
+
+        messages = [
+            rng.choice(PREFIXES) + ' '.join(rng.choice(vocabulary) for _ in range(rng.randint(2, 9)))
+            for _ in range(options['messages'])
+        ]
+
+        start = time.perf_counter()
+        expected = [_reference_classify(generator, message) for message in messages]
+        reference_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        actual = [generator.classify_message(message) for message in messages]
+        compiled_time = time.perf_counter() - start
+
+        if actual != expected:
+            raise CommandError('Compiled classifier disagrees with the original algorithm')
+
+        self.stdout.write(f'Messages: {len(messages)}')
+        self.stdout.write(f'Original: {reference_time:.3f}s')
+        self.stdout.write(f'Compiled: {compiled_time:.3f}s')
+        self.stdout.write(self.style.SUCCESS(f'✓ Same results, {reference_time / compiled_time:.1f}x faster'))
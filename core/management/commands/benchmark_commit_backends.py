@@ -0,0 +1,194 @@
+"""Management command to compare the REST and GraphQL commit backends on recorded responses"""
+import hashlib
+import json
+import time
+from datetime import date, datetime
+from pathlib import Path
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from core.models import UserConfig
+from core.services.github_cache import ETagCache
+from core.services.github_graphql_service import GitHubGraphQLService
+from core.services.github_service import GitHubService
+
+DEFAULT_FIXTURE = Path(__file__).resolve().parents[2] / 'fixtures' / 'github_api' / 'commit_backends.json'
+
+
+def _exchange_key(method: str, url: str, body: bytes | None) -> str:
+    """Identity of a request: method, URL relative to the API base and a digest of the body"""
+    path = url[len(settings.GITHUB_API_BASE):] if url.startswith(settings.GITHUB_API_BASE) else url
+    digest = hashlib.sha256(body).hexdigest()[:16] if body else '-'
+    return f"{method} {path} {digest}"
+
+
+class _NoETagCache(ETagCache):
+    """Send every request unconditionally, so each one is recorded and replayed in full"""
+
+    def get(self, key: str):
+        return None
+
+    def set(self, *args):
+        pass
+
+    def record_hit(self):
+        pass
+
+    def record_miss(self):
+        pass
+
+
+class _Unlimited:
+    """Rate limiter stand-in for replays, which use no GitHub budget"""
+
+    def acquire(self, *args):
+        pass
+
+    def release(self, *args):
+        pass
+
+    def update_from_headers(self, *args):
+        pass
+
+
+class _RecordingAdapter(HTTPAdapter):
+    """Send requests to GitHub and keep each answer under its exchange key"""
+
+    def __init__(self, exchanges: dict):
+        super().__init__()
+        self.exchanges = exchanges
+        self.requests = 0
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        self.requests += 1
+        next_url = response.links.get('next', {}).get('url', '')
+        self.exchanges[_exchange_key(request.method, request.url, request.body)] = {
+            'status': response.status_code,
+            'next': next_url[len(settings.GITHUB_API_BASE):] if next_url.startswith(settings.GITHUB_API_BASE) else next_url,
+            'json': response.json(),
+        }
+        return response
+
+
+class _ReplayAdapter(BaseAdapter):
+    """Answer requests from recorded exchanges, counting them"""
+
+    def __init__(self, exchanges: dict):
+        super().__init__()
+        self.exchanges = exchanges
+        self.requests = 0
+
+    def send(self, request, **kwargs):
+        key = _exchange_key(request.method, request.url, request.body)
+        if key not in self.exchanges:
+            raise CommandError(f"No recorded response for {key}; re-record the fixture")
+
+        recorded = self.exchanges[key]
+        self.requests += 1
+
+        response = requests.Response()
+        response.status_code = recorded['status']
+        response.headers['Content-Type'] = 'application/json'
+        if recorded['next']:
+            response.headers['Link'] = f"<{settings.GITHUB_API_BASE}{recorded['next']}>; rel=\"next\""
+        response._content = json.dumps(recorded['json']).encode()
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+class Command(BaseCommand):
+    help = (
+        'Count the requests the REST and GraphQL commit backends make for the same day of commits, '
+        'replayed from a recorded fixture'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--fixture', default=str(DEFAULT_FIXTURE), help='Recorded responses to replay')
+        parser.add_argument(
+            '--record',
+            metavar='USERNAME',
+            help='First record the fixture from GitHub with this user\'s token and monitored repositories '
+                 '(the fixture then holds their commit messages and author emails)'
+        )
+        parser.add_argument('--date', help='Day to record (YYYY-MM-DD, default today)')
+
+    def handle(self, *args, **options):
+        fixture_path = Path(options['fixture'])
+        if options['record']:
+            self._record(options['record'], options['date'], fixture_path)
+
+        fixture = json.loads(fixture_path.read_text())
+        since = datetime.fromisoformat(fixture['since'])
+        repos = fixture['repositories']
+
+        rest = GitHubService('benchmark')
+        graphql = GitHubGraphQLService('benchmark')
+        graphql.batch_size = fixture['graphql_batch_size']
+
+        results = {}
+        for label, service in (('REST', rest), ('GraphQL', graphql)):
+            adapter = _ReplayAdapter(fixture['exchanges'])
+            service.rate_limiter = _Unlimited()
+            start = time.perf_counter()
+            shas = self._fetch(service, adapter, repos, since)
+            results[label] = (adapter.requests, time.perf_counter() - start, shas)
+
+        if results['REST'][2] != results['GraphQL'][2]:
+            raise CommandError('The GraphQL backend returned different commits than the REST backend')
+
+        commit_count = sum(len(shas) for shas in results['REST'][2].values())
+        self.stdout.write(f"Fixture: {fixture_path.name}, {len(repos)} repos, {commit_count} commits on {since.date()}")
+        for label, (request_count, elapsed, _) in results.items():
+            self.stdout.write(f"{label}: {request_count} requests ({elapsed * 1000:.0f}ms replayed)")
+
+        rest_requests, graphql_requests = results['REST'][0], results['GraphQL'][0]
+        self.stdout.write(self.style.SUCCESS(
+            f"✓ Same commits, {rest_requests / graphql_requests:.1f}x fewer requests with GraphQL "
+            f"(batches of {graphql.batch_size})"
+        ))
+
+    def _fetch(self, service: GitHubService, adapter: BaseAdapter, repos: list, since: datetime) -> dict:
+        """Fetch the day for every repository through the adapter; returns the sorted SHAs per repository"""
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        service.session = session
+        service.etag_cache = _NoETagCache()
+
+        if isinstance(service, GitHubGraphQLService):
+            by_repo, _ = service.get_commits_for_repos(repos, since)
+        else:
+            by_repo = {repo: service.get_daily_commits(repo, since=since, raise_errors=True) for repo in repos}
+
+        return {repo: sorted(commit['sha'] for commit in commits) for repo, commits in by_repo.items()}
+
+    def _record(self, username: str, day: str | None, fixture_path: Path):
+        """Fetch a day with both backends from GitHub and write every exchange to the fixture"""
+        user_config = UserConfig.objects.get(user__username=username)
+        repos = list(
+            user_config.repositories.filter(is_monitored=True).order_by('repo_name').values_list('repo_name', flat=True)
+        )
+        target_date = date.fromisoformat(day) if day else date.today()
+        since = timezone.make_aware(datetime.combine(target_date, datetime.min.time()))
+
+        exchanges = {}
+        graphql = GitHubGraphQLService(user_config.github_token)
+        for service in (GitHubService(user_config.github_token), graphql):
+            self._fetch(service, _RecordingAdapter(exchanges), repos, since)
+
+        fixture_path.parent.mkdir(parents=True, exist_ok=True)
+        fixture_path.write_text(json.dumps({
+            'since': since.isoformat(),
+            'repositories': repos,
+            'graphql_batch_size': graphql.batch_size,
+            'exchanges': exchanges,
+        }, sort_keys=True, separators=(',', ':')))
+        self.stdout.write(f"Recorded {len(exchanges)} responses for {len(repos)} repos to {fixture_path}")
@@ -0,0 +1,138 @@
+"""Management command to benchmark the pooled GitHub HTTP session"""
+import ipaddress
+import json
+import ssl
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import requests
+from django.core.management.base import BaseCommand, CommandError
+from core.services.github_service import get_http_session
+
+# A commits page shaped like GitHub's, served for every request
+PAGE = json.dumps([
+    {
+        'sha': f"{i:040x}",
+        'html_url': f"https://github.com/owner/repo/commit/{i:040x}",
+        'commit': {
+            'message': 'fix: crash on login',
+            'author': {'name': 'Developer', 'email': 'dev@example.com', 'date': '2026-10-16T10:00:00Z'},
+        },
+    }
+    for i in range(30)
+]).encode()
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Answer every GET with the same commits page, keeping connections alive"""
+
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True  # Headers and body go out as separate writes
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+    def log_message(self, *args):
+        pass
+
+
+class _StubServer(ThreadingHTTPServer):
+    """TLS stub counting the connections (and so the handshakes) it accepts"""
+
+    daemon_threads = True
+
+    def __init__(self, context: ssl.SSLContext):
+        super().__init__(('127.0.0.1', 0), _StubHandler)
+        self.socket = context.wrap_socket(self.socket, server_side=True)
+        self.connections = 0
+
+    def get_request(self):
+        request = super().get_request()
+        self.connections += 1
+        return request
+
+
+def _write_certificate(directory: Path) -> tuple:
+    """Write a throwaway self-signed certificate for 127.0.0.1; returns (certificate, key) paths"""
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, '127.0.0.1')])
+    now = datetime.now(timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - timedelta(minutes=5))
+        .not_valid_after(now + timedelta(days=1))
+        .add_extension(x509.SubjectAlternativeName([x509.IPAddress(ipaddress.ip_address('127.0.0.1'))]), critical=False)
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .add_extension(x509.SubjectKeyIdentifier.from_public_key(key.public_key()), critical=False)
+        .sign(key, hashes.SHA256())
+    )
+
+    certificate_path, key_path = directory / 'stub.pem', directory / 'stub.key'
+    certificate_path.write_bytes(certificate.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ))
+    return certificate_path, key_path
+
+
+class Command(BaseCommand):
+    help = 'Time GET requests to a local TLS stub with requests.get against the pooled session'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=300, help='Requests per client')
+
+    def handle(self, *args, **options):
+        count = options['requests']
+
+        with tempfile.TemporaryDirectory() as directory:
+            certificate_path, key_path = _write_certificate(Path(directory))
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(certificate_path, key_path)
+
+            server = _StubServer(context)
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            url = f"https://127.0.0.1:{server.server_port}/repos/owner/repo/commits"
+            session = get_http_session()
+
+            try:
+                results = {}
+                for label, get in (
+                    ('requests.get', requests.get),
+                    ('Pooled session', session.get),
+                ):
+                    connections = server.connections
+                    start = time.perf_counter()
+                    for _ in range(count):
+                        response = get(url, params={'per_page': 30}, timeout=10, verify=str(certificate_path))
+                        if response.status_code != 200 or response.content != PAGE:
+                            raise CommandError(f"{label} got an unexpected response: {response.status_code}")
+                    results[label] = (time.perf_counter() - start, server.connections - connections)
+            finally:
+                server.shutdown()
+                server.server_close()
+
+        self.stdout.write(f"Requests: {count} per client to a local TLS stub")
+        for label, (elapsed, connections) in results.items():
+            self.stdout.write(f"{label}: {elapsed / count * 1000:.2f}ms per request, {connections} connections")
+
+        reference, pooled = results['requests.get'], results['Pooled session']
+        self.stdout.write(self.style.SUCCESS(
+            f"✓ Same responses, {reference[0] / pooled[0]:.1f}x faster, "
+            f"{reference[1] - pooled[1]} fewer TLS handshakes"
+        ))
@@ -0,0 +1,88 @@
+"""Management command to benchmark report rendering"""
+import random
+import time
+from datetime import date
+from django.core.management.base import BaseCommand
+from core.models import Report
+from core.services.render_cache import RENDER_CACHE
+from core.services.report_generator import ReportGenerator
+from core.services.report_templates import HTML_REPORT, TEXT_REPORT
+
+MESSAGES = [
+    'fix: crash on <login> when user is null', 'feat: add export page', 'update readme',
+    'refactor parser & lexer', 'add tests for cache', 'docs: api reference', 'tweak layout',
+]
+
+
+class Command(BaseCommand):
+    help = 'Render synthetic daily reports on one core and report the throughput'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reports', type=int, default=10000, help='Number of reports to render')
+        parser.add_argument('--commits', type=int, default=15, help='Commits per report')
+        parser.add_argument('--seed', type=int, default=0, help='Random seed')
+
+    def handle(self, *args, **options):
+        generator = ReportGenerator()
+        rng = random.Random(options['seed'])
+        report_date = date.today()
+
+        # Commits as read from the database: classified at ingest
+        commits = []
+        for i in range(options['commits']):
+            message = rng.choice(MESSAGES)
+            category, display_message = generator.classify_message(message)
+            commits.append({
+                'repository': f"owner/repo-{i % 3}",
+                'message': message,
+                'category': category,
+                'display_message': display_message,
+            })
+
+        state = generator.empty_state()
+        generator.add_to_state(state, commits)
+        context = generator._build_context('Developer', report_date, state)
+        runs = options['reports']
+
+        start = time.perf_counter()
+        for _ in range(runs):
+            HTML_REPORT.render(context)
+            TEXT_REPORT.render(context)
+        render_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(runs):
+            generator.generate_report(commits, 'Developer', report_date)
+        generate_time = time.perf_counter() - start
+
+        # Re-runs of the same commit set, as retries and manual runs produce
+        RENDER_CACHE.clear()
+        hashed = [dict(commit, sha=f"{i:040x}") for i, commit in enumerate(commits)]
+        start = time.perf_counter()
+        for _ in range(runs):
+            generator.generate_report(hashed, 'Developer', report_date)
+        cached_time = time.perf_counter() - start
+        cache_stats = RENDER_CACHE.stats()
+
+        self.stdout.write(f"Reports: {runs} x {len(commits)} commits (HTML + text)")
+        self.stdout.write(f"Render only: {runs / render_time:,.0f} reports/s")
+        self.stdout.write(self.style.SUCCESS(f"generate_report: {runs / generate_time:,.0f} reports/s"))
+        self.stdout.write(self.style.SUCCESS(
+            f"generate_report, repeated commit set: {runs / cached_time:,.0f} reports/s "
+            f"(hit rate {cache_stats['hit_rate']:.1%})"
+        ))
+
+        # Stored size of one report body, as Report saves it
+        report_data = generator.generate_report(commits, 'Developer', report_date)
+        field = Report._meta.get_field('content_html')
+        plain = sum(len(report_data[kind].encode('utf-8')) for kind in ('html', 'text'))
+        stored = sum(len(field.get_prep_value(report_data[kind])) for kind in ('html', 'text'))
+        start = time.perf_counter()
+        for _ in range(runs):
+            field.to_python(field.get_prep_value(report_data['html']))
+        codec_time = time.perf_counter() - start
+
+        self.stdout.write(f"Stored body: {plain:,} bytes/report plain, {stored:,} compressed")
+        self.stdout.write(self.style.SUCCESS(
+            f"Storage: {1 - stored / plain:.0%} smaller, HTML compress + decompress {codec_time / runs * 1e6:.0f}us"
+        ))
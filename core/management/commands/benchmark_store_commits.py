@@ -0,0 +1,128 @@
+"""Management command to benchmark storing fetched commits"""
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from core.models import UserConfig, GithubRepository, Commit, UserCommit
+from core.services.commit_aggregator import CommitAggregator
+from core.services.commit_filter import NoiseFilter
+from core.services.report_generator import ReportGenerator
+
+MESSAGES = ['fix: crash on login', 'feat: add export page', 'update readme', 'refactor parser', 'add tests for cache']
+
+
+def _reference_store(repo_name: str, commits: list, watchers: list) -> int:
+    """One commit at a time (lookup, insert, then a lookup and insert per watcher), kept to check results"""
+    report_generator = ReportGenerator()
+    linked_count = 0
+
+    for commit_data in commits:
+        with transaction.atomic():
+            commit = Commit.objects.filter(repo_name=repo_name, commit_sha=commit_data['sha']).first()
+            if commit is None:
+                category, display_message = report_generator.classify_message(commit_data['message'])
+                commit = Commit.objects.create(
+                    repo_name=repo_name,
+                    commit_sha=commit_data['sha'],
+                    author=commit_data['author'],
+                    message=commit_data['message'],
+                    category=category,
+                    display_message=display_message,
+                    files_changed=commit_data['files_changed'],
+                    additions=commit_data['additions'],
+                    deletions=commit_data['deletions'],
+                    commit_date=datetime.fromisoformat(commit_data['date'].replace('Z', '+00:00')),
+                )
+
+            for user_config, repository, noise_filter in watchers:
+                if noise_filter.is_noise(commit.message, repo_name):
+                    continue
+                _, created = UserCommit.objects.get_or_create(
+                    user_config=user_config, commit=commit, defaults={'repository': repository}
+                )
+                linked_count += created
+
+    return linked_count
+
+
+class Command(BaseCommand):
+    help = 'Time storing synthetic fetched commits in the configured database against a row-by-row loop'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--commits', type=int, default=10000, help='Number of synthetic commits')
+        parser.add_argument('--watchers', type=int, default=2, help='Users watching the repository')
+
+    def handle(self, *args, **options):
+        run_id = uuid.uuid4().hex[:8]
+        start_date = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+        # Throwaway users and commits, removed again at the end
+        users = [User.objects.create(username=f"benchmark-{run_id}-{i}") for i in range(options['watchers'])]
+        try:
+            timings = {}
+            for label, store in (
+                ('Row-by-row', _reference_store),
+                ('Chunked', CommitAggregator()._store_commits),
+            ):
+                repo_name = f"benchmark/{run_id}-{label.lower()}"
+                watchers = []
+                for user in users:
+                    user_config, _ = UserConfig.objects.get_or_create(
+                        user=user, defaults={'github_username': user.username, 'email': 'benchmark@example.com'}
+                    )
+                    repository = GithubRepository.objects.create(
+                        user_config=user_config, repo_name=repo_name, repo_url=f"https://github.com/{repo_name}"
+                    )
+                    watchers.append((user_config, repository, NoiseFilter.from_settings()))
+
+                commits = [
+                    {
+                        'sha': f"{run_id}{i:032x}",
+                        'author': 'Developer',
+                        'email': 'dev@example.com',
+                        'message': MESSAGES[i % len(MESSAGES)],
+                        'date': (start_date + timedelta(minutes=i)).isoformat(),
+                        'repository': repo_name,
+                        'files_changed': 0,
+                        'additions': i % 50,
+                        'deletions': i % 20,
+                    }
+                    for i in range(options['commits'])
+                ]
+
+                start = time.perf_counter()
+                linked = store(repo_name, commits, watchers)
+                first_time = time.perf_counter() - start
+
+                # The same window fetched again: everything is already stored and linked
+                start = time.perf_counter()
+                relinked = store(repo_name, commits, watchers)
+                again_time = time.perf_counter() - start
+
+                rows = (Commit.objects.filter(repo_name=repo_name).count(),
+                        UserCommit.objects.filter(commit__repo_name=repo_name).count())
+                timings[label] = (first_time, again_time, linked, relinked, rows)
+
+            results = {label: timing[2:] for label, timing in timings.items()}
+            if len(set(results.values())) != 1:
+                raise CommandError(f"Chunked store disagrees with the row-by-row loop: {results}")
+        finally:
+            Commit.objects.filter(repo_name__startswith=f"benchmark/{run_id}-").delete()
+            User.objects.filter(id__in=[user.id for user in users]).delete()
+
+        self.stdout.write(
+            f"Database: {connection.vendor}, {options['commits']} commits, {options['watchers']} watchers"
+        )
+        for label, (first_time, again_time, *_) in timings.items():
+            self.stdout.write(
+                f"{label}: {first_time * 1000:.0f}ms new ({options['commits'] / first_time:,.0f} commits/s), "
+                f"{again_time * 1000:.0f}ms already stored"
+            )
+
+        reference, chunked = timings['Row-by-row'], timings['Chunked']
+        self.stdout.write(self.style.SUCCESS(
+            f"✓ Same rows, {reference[0] / chunked[0]:.1f}x faster new, "
+            f"{reference[1] / chunked[1]:.1f}x faster already stored"
+        ))
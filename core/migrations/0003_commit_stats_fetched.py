@@ -0,0 +1,18 @@
+# Generated by Django 4.2.8 on 2026-10-16 23:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_remove_github_token'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='commit',
+            name='stats_fetched',
+            field=models.BooleanField(default=False, help_text='files_changed/additions/deletions are populated'),
+        ),
+    ]
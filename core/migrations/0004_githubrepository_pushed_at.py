@@ -0,0 +1,18 @@
+# Generated by Django 4.2.8 on 2026-10-16 23:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_commit_stats_fetched'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='githubrepository',
+            name='pushed_at',
+            field=models.DateTimeField(blank=True, help_text='Last push reported by GitHub', null=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.8 on 2026-10-16 23:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_githubrepository_pushed_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userconfig',
+            name='ingestion_mode',
+            field=models.CharField(choices=[('repos', 'Per repository'), ('events', 'Events API')], default='repos', help_text="Fetch commits per repository or from the user's event feed", max_length=20),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.8 on 2026-10-16 23:14
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_userconfig_ingestion_mode'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CommitFilterRule',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('pattern', models.CharField(help_text='Case-insensitive substring of the commit message', max_length=255)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('repository', models.ForeignKey(blank=True, help_text='Leave empty to apply to all repositories', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='filter_rules', to='core.githubrepository')),
+                ('user_config', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='filter_rules', to='core.userconfig')),
+            ],
+            options={
+                'db_table': 'commit_filter_rule',
+                'unique_together': {('user_config', 'repository', 'pattern')},
+            },
+        ),
+    ]
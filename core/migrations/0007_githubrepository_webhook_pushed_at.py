@@ -0,0 +1,18 @@
+# Generated by Django 4.2.8 on 2026-10-16 23:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_commitfilterrule'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='githubrepository',
+            name='webhook_pushed_at',
+            field=models.DateTimeField(blank=True, help_text='Push time of the last ingested push webhook', null=True),
+        ),
+    ]
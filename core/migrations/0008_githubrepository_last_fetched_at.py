@@ -0,0 +1,18 @@
+# Generated by Django 4.2.8 on 2026-10-16 23:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_githubrepository_webhook_pushed_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='githubrepository',
+            name='last_fetched_at',
+            field=models.DateTimeField(blank=True, help_text='Date of the newest commit fetched in the latest complete window fetch', null=True),
+        ),
+    ]
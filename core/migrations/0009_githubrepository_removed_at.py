@@ -0,0 +1,18 @@
+# Generated by Django 4.2.8 on 2026-10-16 23:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_githubrepository_last_fetched_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='githubrepository',
+            name='removed_at',
+            field=models.DateTimeField(blank=True, help_text='When the repo disappeared from the GitHub listing', null=True),
+        ),
+    ]
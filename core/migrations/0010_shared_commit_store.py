@@ -0,0 +1,41 @@
+# Generated by Django 4.2.8 on 2026-10-16 23:23
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_githubrepository_removed_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='githubrepository',
+            name='access_verified_at',
+            field=models.DateTimeField(blank=True, help_text="When the user's own token last completed a fetch of this repo", null=True),
+        ),
+        migrations.AddField(
+            model_name='commit',
+            name='repo_name',
+            field=models.CharField(default='', help_text='Repo name (e.g., owner/repo)', max_length=255),
+            preserve_default=False,
+        ),
+        migrations.CreateModel(
+            name='UserCommit',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('is_processed', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('commit', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='user_links', to='core.commit')),
+                ('repository', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='commit_links', to='core.githubrepository')),
+                ('user_config', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='commit_links', to='core.userconfig')),
+            ],
+            options={
+                'db_table': 'user_commit',
+                'indexes': [models.Index(fields=['user_config', 'is_processed'], name='user_commit_user_co_3106a6_idx')],
+                'unique_together': {('user_config', 'commit')},
+            },
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 4.2.8 on 2026-10-16 23:23
+
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+BATCH_SIZE = 1000
+
+
+def link_existing_commits(apps, schema_editor):
+    """Copy repo names onto commits and turn each per-user commit row into a link"""
+    Commit = apps.get_model('core', 'Commit')
+    GithubRepository = apps.get_model('core', 'GithubRepository')
+    UserCommit = apps.get_model('core', 'UserCommit')
+
+    Commit.objects.update(repo_name=Subquery(
+        GithubRepository.objects.filter(pk=OuterRef('repository_id')).values('repo_name')[:1]
+    ))
+
+    rows = Commit.objects.order_by('id').values_list('id', 'user_config_id', 'repository_id', 'is_processed')
+    links = []
+    for commit_id, user_config_id, repository_id, is_processed in rows.iterator(chunk_size=BATCH_SIZE):
+        links.append(UserCommit(
+            commit_id=commit_id,
+            user_config_id=user_config_id,
+            repository_id=repository_id,
+            is_processed=is_processed,
+        ))
+        if len(links) >= BATCH_SIZE:
+            UserCommit.objects.bulk_create(links)
+            links = []
+    UserCommit.objects.bulk_create(links)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_shared_commit_store'),
+    ]
+
+    operations = [
+        migrations.RunPython(link_existing_commits, migrations.RunPython.noop),
+    ]
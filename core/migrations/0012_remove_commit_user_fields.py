@@ -0,0 +1,37 @@
+# Generated by Django 4.2.8 on 2026-10-16 23:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_link_existing_commits'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='commit',
+            name='commit_user_co_5149c1_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='commit',
+            name='commit_is_proc_778360_idx',
+        ),
+        migrations.RemoveField(
+            model_name='commit',
+            name='is_processed',
+        ),
+        migrations.RemoveField(
+            model_name='commit',
+            name='repository',
+        ),
+        migrations.RemoveField(
+            model_name='commit',
+            name='user_config',
+        ),
+        migrations.AddIndex(
+            model_name='commit',
+            index=models.Index(fields=['repo_name', 'commit_date'], name='commit_repo_na_343924_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 4.2.8 on 2026-10-16 23:25
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0012_remove_commit_user_fields'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BackfillCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('start_date', models.DateField()),
+                ('end_date', models.DateField()),
+                ('fetched_until', models.DateTimeField(blank=True, help_text='Date of the oldest commit stored so far; an interrupted run resumes from there', null=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('repository', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='backfill_checkpoints', to='core.githubrepository')),
+            ],
+            options={
+                'db_table': 'backfill_checkpoint',
+                'unique_together': {('repository', 'start_date', 'end_date')},
+            },
+        ),
+    ]
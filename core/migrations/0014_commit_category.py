@@ -0,0 +1,23 @@
+# Generated by Django 4.2.8 on 2026-10-16 23:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0013_backfillcheckpoint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='commit',
+            name='category',
+            field=models.CharField(choices=[('fix', 'Bug Fixes'), ('feature', 'Features'), ('refactor', 'Refactoring'), ('improve', 'Improvements'), ('test', 'Tests'), ('docs', 'Documentation'), ('general', 'Other Updates')], db_index=True, default='general', max_length=20),
+        ),
+        migrations.AddField(
+            model_name='commit',
+            name='display_message',
+            field=models.TextField(blank=True, default='', help_text='Message with prefixes removed, as shown in reports'),
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 4.2.8 on 2026-10-16 23:29
+
+import re
+from django.db import migrations
+
+BATCH_SIZE = 1000
+
+# Classification as of this migration, copied so that later changes to the
+# report generator cannot change what replaying it produces
+ACTION_VERBS = {
+    'fix': ['fixed', 'fix', 'resolve', 'resolved', 'patch', 'bugfix'],
+    'feature': ['add', 'added', 'implement', 'implemented', 'create', 'created', 'feature'],
+    'refactor': ['refactor', 'refactored', 'restructure', 'reorganize', 'optimize', 'optimized'],
+    'improve': ['improve', 'improved', 'enhance', 'enhance', 'update', 'updated'],
+    'test': ['test', 'tests', 'add test', 'add tests'],
+    'docs': ['doc', 'docs', 'documentation', 'comment', 'readme'],
+}
+PREFIX_PATTERN = re.compile(''.join(
+    f"(?:{re.escape(prefix)}\\s*)?"
+    for prefix in ['feat: ', 'fix: ', 'refactor: ', 'docs: ', 'test: ', 'chore: ', 'style: ']
+))
+
+
+def classify_message(message):
+    """Category and display message of a commit message's first line"""
+    message_lower = message.lower()
+    category = next(
+        (category for category, keywords in ACTION_VERBS.items() if any(keyword in message_lower for keyword in keywords)),
+        'general'
+    )
+
+    prefix_end = PREFIX_PATTERN.match(message_lower).end()
+    if prefix_end:
+        message = message[prefix_end:].rstrip()
+    if message and message[0].islower():
+        message = message[0].upper() + message[1:]
+
+    return category, message
+
+
+def classify_existing_commits(apps, schema_editor):
+    """Fill category and display_message for commits stored before they existed"""
+    Commit = apps.get_model('core', 'Commit')
+
+    # Batches are keyed on id so each one is a bounded index range scan
+    last_id = 0
+    while True:
+        batch = list(Commit.objects.filter(id__gt=last_id).order_by('id').only('id', 'message')[:BATCH_SIZE])
+        if not batch:
+            break
+        last_id = batch[-1].id
+
+        for commit in batch:
+            commit.category, commit.display_message = classify_message(commit.message)
+        Commit.objects.bulk_update(batch, ['category', 'display_message'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0014_commit_category'),
+    ]
+
+    operations = [
+        migrations.RunPython(classify_existing_commits, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.8 on 2026-10-16 23:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0015_classify_existing_commits'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='report',
+            name='state',
+            field=models.JSONField(blank=True, default=dict, help_text='Per-category messages and per-repo counts the content is rendered from'),
+        ),
+    ]
@@ -0,0 +1,87 @@
+# Generated by Django 4.2.8 on 2026-10-16 23:37
+
+import re
+from django.db import migrations
+
+BATCH_SIZE = 500
+
+# Classification as of this migration, copied so that later changes to the
+# report generator cannot change what replaying it produces
+ACTION_VERBS = {
+    'fix': ['fixed', 'fix', 'resolve', 'resolved', 'patch', 'bugfix'],
+    'feature': ['add', 'added', 'implement', 'implemented', 'create', 'created', 'feature'],
+    'refactor': ['refactor', 'refactored', 'restructure', 'reorganize', 'optimize', 'optimized'],
+    'improve': ['improve', 'improved', 'enhance', 'enhance', 'update', 'updated'],
+    'test': ['test', 'tests', 'add test', 'add tests'],
+    'docs': ['doc', 'docs', 'documentation', 'comment', 'readme'],
+}
+PREFIX_PATTERN = re.compile(''.join(
+    f"(?:{re.escape(prefix)}\\s*)?"
+    for prefix in ['feat: ', 'fix: ', 'refactor: ', 'docs: ', 'test: ', 'chore: ', 'style: ']
+))
+
+
+def classify_message(message):
+    """Category and display message of a commit message's first line"""
+    message_lower = message.lower()
+    category = next(
+        (category for category, keywords in ACTION_VERBS.items() if any(keyword in message_lower for keyword in keywords)),
+        'general'
+    )
+
+    prefix_end = PREFIX_PATTERN.match(message_lower).end()
+    if prefix_end:
+        message = message[prefix_end:].rstrip()
+    if message and message[0].islower():
+        message = message[0].upper() + message[1:]
+
+    return category, message
+
+
+def build_state(commits):
+    """Report state (sections and repos in first-seen order) of (repo, message, category, display message) rows"""
+    sections = {}
+    repos = {}
+
+    for repo_name, message, category, display_message in commits:
+        if not (category and display_message):
+            category, display_message = classify_message(message)
+        sections.setdefault(category, []).append(display_message)
+        repos[repo_name] = repos.get(repo_name, 0) + 1
+
+    return {'sections': sections, 'repos': repos, 'commit_count': sum(repos.values())}
+
+
+def build_report_state(apps, schema_editor):
+    """Rebuild the state of existing reports from the commits already folded into them"""
+    Report = apps.get_model('core', 'Report')
+    UserCommit = apps.get_model('core', 'UserCommit')
+
+    last_id = 0
+    while True:
+        batch = list(Report.objects.filter(id__gt=last_id).order_by('id').only('id', 'user_config_id', 'report_date')[:BATCH_SIZE])
+        if not batch:
+            break
+        last_id = batch[-1].id
+
+        for report in batch:
+            links = UserCommit.objects.filter(
+                user_config_id=report.user_config_id,
+                is_processed=True,
+                commit__commit_date__date=report.report_date
+            ).order_by('commit__commit_date').values_list(
+                'commit__repo_name', 'commit__message', 'commit__category', 'commit__display_message'
+            )
+            report.state = build_state(links)
+        Report.objects.bulk_update(batch, ['state'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0016_report_state'),
+    ]
+
+    operations = [
+        migrations.RunPython(build_report_state, migrations.RunPython.noop),
+    ]
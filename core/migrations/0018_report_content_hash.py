@@ -0,0 +1,18 @@
+# Generated by Django 4.2.8 on 2026-10-16 23:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0017_build_report_state'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='report',
+            name='content_hash',
+            field=models.CharField(blank=True, default='', help_text='Hash of the commit shas, developer, date and template version the content was rendered from', max_length=64),
+        ),
+    ]
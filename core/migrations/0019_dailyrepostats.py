@@ -0,0 +1,39 @@
+# Generated by Django 4.2.8 on 2026-10-16 23:40
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0018_report_content_hash'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyRepoStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('repo_name', models.CharField(help_text='Format: owner/repo', max_length=255)),
+                ('date', models.DateField()),
+                ('commit_count', models.IntegerField(default=0)),
+                ('additions', models.IntegerField(default=0)),
+                ('deletions', models.IntegerField(default=0)),
+                ('fix_count', models.IntegerField(default=0)),
+                ('feature_count', models.IntegerField(default=0)),
+                ('refactor_count', models.IntegerField(default=0)),
+                ('improve_count', models.IntegerField(default=0)),
+                ('test_count', models.IntegerField(default=0)),
+                ('docs_count', models.IntegerField(default=0)),
+                ('general_count', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user_config', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='core.userconfig')),
+            ],
+            options={
+                'db_table': 'daily_repo_stats',
+                'indexes': [models.Index(fields=['user_config', 'date'], name='daily_repo__user_co_d1a06c_idx')],
+                'unique_together': {('user_config', 'repo_name', 'date')},
+            },
+        ),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 4.2.8 on 2026-10-16 23:52
+
+from django.db import migrations
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import TruncDate
+
+BATCH_SIZE = 100
+CATEGORIES = ['fix', 'feature', 'refactor', 'improve', 'test', 'docs', 'general']
+
+
+def seed_daily_repo_stats(apps, schema_editor):
+    """Build per-day repository totals from the commits already folded into reports"""
+    UserConfig = apps.get_model('core', 'UserConfig')
+    UserCommit = apps.get_model('core', 'UserCommit')
+    DailyRepoStats = apps.get_model('core', 'DailyRepoStats')
+
+    # Batches of users, each aggregated by the database in one grouped query
+    last_id = 0
+    while True:
+        user_ids = list(
+            UserConfig.objects.filter(id__gt=last_id).order_by('id').values_list('id', flat=True)[:BATCH_SIZE]
+        )
+        if not user_ids:
+            break
+        last_id = user_ids[-1]
+
+        rows = (
+            UserCommit.objects.filter(user_config_id__in=user_ids, is_processed=True)
+            .annotate(day=TruncDate('commit__commit_date'))
+            .values('user_config_id', 'commit__repo_name', 'day')
+            .annotate(
+                commits=Count('id'),
+                lines_added=Sum('commit__additions'),
+                lines_deleted=Sum('commit__deletions'),
+                **{
+                    f"{category}_count": Count('id', filter=Q(commit__category=category))
+                    for category in CATEGORIES
+                }
+            )
+        )
+
+        DailyRepoStats.objects.bulk_create([
+            DailyRepoStats(
+                user_config_id=row['user_config_id'],
+                repo_name=row['commit__repo_name'],
+                date=row['day'],
+                commit_count=row['commits'],
+                additions=row['lines_added'] or 0,
+                deletions=row['lines_deleted'] or 0,
+                **{f"{category}_count": row[f"{category}_count"] for category in CATEGORIES}
+            )
+            for row in rows
+        ], ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0019_dailyrepostats'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_daily_repo_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.8 on 2026-10-17 00:05
+
+import core.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0020_seed_daily_repo_stats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='report',
+            name='content_html_compressed',
+            field=core.fields.CompressedTextField(dictionary_id=1, null=True),
+        ),
+        migrations.AddField(
+            model_name='report',
+            name='content_text_compressed',
+            field=core.fields.CompressedTextField(dictionary_id=1, null=True),
+        ),
+    ]
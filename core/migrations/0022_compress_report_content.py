@@ -0,0 +1,48 @@
+# Generated by Django 4.2.8 on 2026-10-17 00:05
+
+from django.db import migrations
+
+BATCH_SIZE = 500
+
+
+def _copy(apps, source_suffix, target_suffix):
+    """Copy both content columns between their plain and compressed versions, in id batches"""
+    Report = apps.get_model('core', 'Report')
+    fields = [f"content_{kind}{target_suffix}" for kind in ('html', 'text')]
+
+    # Batches are keyed on id so each one is a bounded index range scan
+    last_id = 0
+    while True:
+        batch = list(
+            Report.objects.filter(id__gt=last_id).order_by('id')
+            .only('id', *[f"content_{kind}{source_suffix}" for kind in ('html', 'text')])[:BATCH_SIZE]
+        )
+        if not batch:
+            break
+        last_id = batch[-1].id
+
+        for report in batch:
+            for kind in ('html', 'text'):
+                setattr(report, f"content_{kind}{target_suffix}", getattr(report, f"content_{kind}{source_suffix}"))
+        Report.objects.bulk_update(batch, fields)
+
+
+def compress_report_content(apps, schema_editor):
+    """Store existing report bodies in the compressed columns"""
+    _copy(apps, '', '_compressed')
+
+
+def decompress_report_content(apps, schema_editor):
+    """Restore report bodies to the plain columns"""
+    _copy(apps, '_compressed', '')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0021_report_compressed_content'),
+    ]
+
+    operations = [
+        migrations.RunPython(compress_report_content, decompress_report_content),
+    ]
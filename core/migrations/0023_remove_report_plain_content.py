@@ -0,0 +1,53 @@
+# Generated by Django 4.2.8 on 2026-10-17 00:05
+
+import core.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0022_compress_report_content'),
+    ]
+
+    operations = [
+        # A default lets reversing the removal re-add the columns to existing rows
+        migrations.AlterField(
+            model_name='report',
+            name='content_html',
+            field=models.TextField(default='', help_text='Formatted HTML report'),
+        ),
+        migrations.AlterField(
+            model_name='report',
+            name='content_text',
+            field=models.TextField(default='', help_text='Plain text version of report'),
+        ),
+        migrations.RemoveField(
+            model_name='report',
+            name='content_html',
+        ),
+        migrations.RemoveField(
+            model_name='report',
+            name='content_text',
+        ),
+        migrations.RenameField(
+            model_name='report',
+            old_name='content_html_compressed',
+            new_name='content_html',
+        ),
+        migrations.RenameField(
+            model_name='report',
+            old_name='content_text_compressed',
+            new_name='content_text',
+        ),
+        migrations.AlterField(
+            model_name='report',
+            name='content_html',
+            field=core.fields.CompressedTextField(dictionary_id=1, help_text='Formatted HTML report'),
+        ),
+        migrations.AlterField(
+            model_name='report',
+            name='content_text',
+            field=core.fields.CompressedTextField(dictionary_id=1, help_text='Plain text version of report'),
+        ),
+    ]
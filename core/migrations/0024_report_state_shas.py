@@ -0,0 +1,57 @@
+# Generated by Django 4.2.8 on 2026-10-17 09:12
+
+from django.db import migrations
+
+BATCH_SIZE = 500
+
+
+def add_state_shas(apps, schema_editor):
+    """Record in each report state the commits already folded into it"""
+    Report = apps.get_model('core', 'Report')
+    UserCommit = apps.get_model('core', 'UserCommit')
+
+    last_id = 0
+    while True:
+        batch = list(Report.objects.filter(id__gt=last_id).order_by('id').only('id', 'user_config_id', 'report_date', 'state')[:BATCH_SIZE])
+        if not batch:
+            break
+        last_id = batch[-1].id
+
+        for report in batch:
+            if report.state is None or report.state.get('shas'):
+                continue
+            report.state['shas'] = list(
+                UserCommit.objects.filter(
+                    user_config_id=report.user_config_id,
+                    is_processed=True,
+                    commit__commit_date__date=report.report_date
+                ).order_by('commit__commit_date').values_list('commit__commit_sha', flat=True)
+            )
+        Report.objects.bulk_update(batch, ['state'])
+
+
+def remove_state_shas(apps, schema_editor):
+    Report = apps.get_model('core', 'Report')
+
+    last_id = 0
+    while True:
+        batch = list(Report.objects.filter(id__gt=last_id).order_by('id').only('id', 'state')[:BATCH_SIZE])
+        if not batch:
+            break
+        last_id = batch[-1].id
+
+        for report in batch:
+            if report.state is not None:
+                report.state.pop('shas', None)
+        Report.objects.bulk_update(batch, ['state'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0023_remove_report_plain_content'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_state_shas, remove_state_shas),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.8 on 2026-10-17 00:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0024_report_state_shas'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='githubrepository',
+            name='webhook_head_sha',
+            field=models.CharField(blank=True, default='', help_text='Default branch head after the last ingested push webhook', max_length=40),
+        ),
+        migrations.AlterField(
+            model_name='githubrepository',
+            name='webhook_pushed_at',
+            field=models.DateTimeField(blank=True, help_text='Everything pushed up to this time is stored (by unbroken push webhooks or a full fetch)', null=True),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.8 on 2026-10-17 00:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0025_githubrepository_webhook_head_sha'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='commit',
+            name='commit_sha',
+            field=models.CharField(max_length=255),
+        ),
+        migrations.AlterUniqueTogether(
+            name='commit',
+            unique_together={('repo_name', 'commit_sha')},
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.8 on 2026-10-17 00:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0026_commit_sha_unique_per_repo'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='backfillcheckpoint',
+            name='fetched_until',
+        ),
+        migrations.AddField(
+            model_name='backfillcheckpoint',
+            name='next_page_url',
+            field=models.TextField(blank=True, default='', help_text='First page not stored yet; an interrupted run resumes from there'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.8 on 2026-10-17 00:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0027_backfillcheckpoint_next_page_url'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='githubrepository',
+            name='listed_at',
+            field=models.DateTimeField(blank=True, help_text="When the repo last appeared in the user's GitHub listing", null=True),
+        ),
+    ]
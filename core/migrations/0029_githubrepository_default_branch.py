@@ -0,0 +1,18 @@
+# Generated by Django 4.2.8 on 2026-10-17 00:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0028_githubrepository_listed_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='githubrepository',
+            name='default_branch',
+            field=models.CharField(blank=True, default='', help_text='Default branch reported by GitHub', max_length=255),
+        ),
+    ]
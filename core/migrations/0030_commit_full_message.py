@@ -0,0 +1,23 @@
+# Generated by Django 4.2.8 on 2026-10-17 00:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0029_githubrepository_default_branch'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='commit',
+            name='full_message',
+            field=models.TextField(blank=True, default='', help_text='Complete commit message, matched by filter rules (empty for commits stored before it was kept)'),
+        ),
+        migrations.AlterField(
+            model_name='commitfilterrule',
+            name='pattern',
+            field=models.CharField(help_text='Case-insensitive substring of the full commit message (any line, like GITHUB_COMMIT_FILTER_WORDS)', max_length=255),
+        ),
+    ]
@@ -2,15 +2,27 @@ from django.db import models
 from django.contrib.auth.models import User
 from datetime import datetime, timedelta
 from allauth.socialaccount.models import SocialAccount
+from core.fields import CompressedTextField
 
 
 class UserConfig(models.Model):
     """Store developer's configuration for daily reports"""
+    INGESTION_MODE_CHOICES = [
+        ('repos', 'Per repository'),
+        ('events', 'Events API'),
+    ]
+
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='report_config')
     github_username = models.CharField(max_length=255, help_text="GitHub username")
     email = models.EmailField(help_text="Email to receive daily reports")
     report_time = models.TimeField(default="18:00", help_text="Time to send daily report (HH:MM)")
     timezone = models.CharField(max_length=50, default="UTC", help_text="User's timezone")
+    ingestion_mode = models.CharField(
+        max_length=20,
+        choices=INGESTION_MODE_CHOICES,
+        default='repos',
+        help_text="Fetch commits per repository or from the user's event feed"
+    )
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -40,6 +52,31 @@ class GithubRepository(models.Model):
     repo_name = models.CharField(max_length=255, help_text="Repo name (e.g., owner/repo)")
     repo_url = models.URLField()
     is_monitored = models.BooleanField(default=True)
+    pushed_at = models.DateTimeField(null=True, blank=True, help_text="Last push reported by GitHub")
+    default_branch = models.CharField(max_length=255, blank=True, default='', help_text="Default branch reported by GitHub")
+    webhook_pushed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Everything pushed up to this time is stored (by unbroken push webhooks or a full fetch)"
+    )
+    webhook_head_sha = models.CharField(
+        max_length=40,
+        blank=True,
+        default='',
+        help_text="Default branch head after the last ingested push webhook"
+    )
+    last_fetched_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Date of the newest commit fetched in the latest complete window fetch"
+    )
+    listed_at = models.DateTimeField(null=True, blank=True, help_text="When the repo last appeared in the user's GitHub listing")
+    removed_at = models.DateTimeField(null=True, blank=True, help_text="When the repo disappeared from the GitHub listing")
+    access_verified_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When the user's own token last completed a fetch of this repo"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -50,31 +87,142 @@ class GithubRepository(models.Model):
         return f"{self.user_config.user.username} - {self.repo_name}"
 
 
+class BackfillCheckpoint(models.Model):
+    """Progress of a commit backfill over a date range for one repository"""
+    repository = models.ForeignKey(GithubRepository, on_delete=models.CASCADE, related_name='backfill_checkpoints')
+    start_date = models.DateField()
+    end_date = models.DateField()
+    next_page_url = models.TextField(
+        blank=True,
+        default='',
+        help_text="First page not stored yet; an interrupted run resumes from there"
+    )
+    completed_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'backfill_checkpoint'
+        unique_together = ('repository', 'start_date', 'end_date')
+
+    def __str__(self):
+        return f"{self.repository} - {self.start_date}..{self.end_date}"
+
+
+class CommitFilterRule(models.Model):
+    """Extra noise patterns for a user, optionally limited to one repository"""
+    user_config = models.ForeignKey(UserConfig, on_delete=models.CASCADE, related_name='filter_rules')
+    repository = models.ForeignKey(
+        GithubRepository,
+        on_delete=models.CASCADE,
+        related_name='filter_rules',
+        null=True,
+        blank=True,
+        help_text="Leave empty to apply to all repositories"
+    )
+    pattern = models.CharField(
+        max_length=255,
+        help_text="Case-insensitive substring of the full commit message (any line, like GITHUB_COMMIT_FILTER_WORDS)"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'commit_filter_rule'
+        unique_together = ('user_config', 'repository', 'pattern')
+
+    def __str__(self):
+        scope = self.repository.repo_name if self.repository else 'all repositories'
+        return f"{self.user_config.user.username} - {self.pattern} ({scope})"
+
+
 class Commit(models.Model):
-    """Store fetched GitHub commits"""
-    user_config = models.ForeignKey(UserConfig, on_delete=models.CASCADE, related_name='commits')
-    repository = models.ForeignKey(GithubRepository, on_delete=models.CASCADE, related_name='commits')
-    commit_sha = models.CharField(max_length=255, unique=True)
+    """Store fetched GitHub commits, once per repository for all watching users"""
+    CATEGORY_CHOICES = [
+        ('fix', 'Bug Fixes'),
+        ('feature', 'Features'),
+        ('refactor', 'Refactoring'),
+        ('improve', 'Improvements'),
+        ('test', 'Tests'),
+        ('docs', 'Documentation'),
+        ('general', 'Other Updates'),
+    ]
+
+    repo_name = models.CharField(max_length=255, help_text="Repo name (e.g., owner/repo)")
+    commit_sha = models.CharField(max_length=255)
     author = models.CharField(max_length=255)
     message = models.TextField()
+    full_message = models.TextField(
+        blank=True,
+        default='',
+        help_text="Complete commit message, matched by filter rules (empty for commits stored before it was kept)"
+    )
+    category = models.CharField(max_length=20, choices=CATEGORY_CHOICES, default='general', db_index=True)
+    display_message = models.TextField(blank=True, default='', help_text="Message with prefixes removed, as shown in reports")
     files_changed = models.IntegerField(default=0)
     additions = models.IntegerField(default=0)
     deletions = models.IntegerField(default=0)
+    stats_fetched = models.BooleanField(default=False, help_text="files_changed/additions/deletions are populated")
     commit_date = models.DateTimeField()
     fetched_at = models.DateTimeField(auto_now_add=True)
-    is_processed = models.BooleanField(default=False)
 
     class Meta:
         db_table = 'commit'
+        # Forks share their parent's history, so a SHA is only unique within a repository
+        unique_together = ('repo_name', 'commit_sha')
         indexes = [
-            models.Index(fields=['user_config', 'commit_date']),
-            models.Index(fields=['is_processed', 'commit_date']),
+            models.Index(fields=['repo_name', 'commit_date']),
         ]
 
     def __str__(self):
         return f"{self.author} - {self.message[:50]}"
 
 
+class UserCommit(models.Model):
+    """Link a shared commit to a user watching its repository"""
+    user_config = models.ForeignKey(UserConfig, on_delete=models.CASCADE, related_name='commit_links')
+    repository = models.ForeignKey(GithubRepository, on_delete=models.CASCADE, related_name='commit_links')
+    commit = models.ForeignKey(Commit, on_delete=models.CASCADE, related_name='user_links')
+    is_processed = models.BooleanField(default=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'user_commit'
+        unique_together = ('user_config', 'commit')
+        indexes = [
+            models.Index(fields=['user_config', 'is_processed']),
+        ]
+
+    def __str__(self):
+        return f"{self.user_config.user.username} - {self.commit.commit_sha[:8]}"
+
+
+class DailyRepoStats(models.Model):
+    """Per-day, per-repository commit totals of a user, kept after the commits are cleaned up"""
+    user_config = models.ForeignKey(UserConfig, on_delete=models.CASCADE, related_name='daily_stats')
+    repo_name = models.CharField(max_length=255, help_text="Format: owner/repo")
+    date = models.DateField()
+    commit_count = models.IntegerField(default=0)
+    additions = models.IntegerField(default=0)
+    deletions = models.IntegerField(default=0)
+    fix_count = models.IntegerField(default=0)
+    feature_count = models.IntegerField(default=0)
+    refactor_count = models.IntegerField(default=0)
+    improve_count = models.IntegerField(default=0)
+    test_count = models.IntegerField(default=0)
+    docs_count = models.IntegerField(default=0)
+    general_count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'daily_repo_stats'
+        unique_together = ('user_config', 'repo_name', 'date')
+        indexes = [
+            models.Index(fields=['user_config', 'date']),
+        ]
+
+    def __str__(self):
+        return f"{self.user_config.user.username} - {self.repo_name} - {self.date}"
+
+
 class Report(models.Model):
     """Store generated daily reports"""
     STATUS_CHOICES = [
@@ -87,8 +235,10 @@ class Report(models.Model):
     user_config = models.ForeignKey(UserConfig, on_delete=models.CASCADE, related_name='reports')
     report_date = models.DateField()
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='draft')
-    content_html = models.TextField(help_text="Formatted HTML report")
-    content_text = models.TextField(help_text="Plain text version of report")
+    content_html = CompressedTextField(dictionary_id=1, help_text="Formatted HTML report")
+    content_text = CompressedTextField(dictionary_id=1, help_text="Plain text version of report")
+    state = models.JSONField(default=dict, blank=True, help_text="Per-category messages and per-repo counts the content is rendered from")
+    content_hash = models.CharField(max_length=64, blank=True, default='', help_text="Hash of the commit shas, developer, date and template version the content was rendered from")
     commit_count = models.IntegerField(default=0)
     repo_count = models.IntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
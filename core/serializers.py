@@ -2,14 +2,14 @@
 Django REST Framework Serializers
 """
 from rest_framework import serializers
-from core.models import UserConfig, GithubRepository, Report, Commit
+from core.models import UserConfig, GithubRepository, Report, Commit, CommitFilterRule
 
 
 class GithubRepositorySerializer(serializers.ModelSerializer):
     class Meta:
         model = GithubRepository
-        fields = ['id', 'repo_name', 'repo_url', 'is_monitored', 'created_at']
-        read_only_fields = ['id', 'created_at']
+        fields = ['id', 'repo_name', 'repo_url', 'is_monitored', 'pushed_at', 'removed_at', 'created_at']
+        read_only_fields = ['id', 'pushed_at', 'removed_at', 'created_at']
 
 
 class UserConfigSerializer(serializers.ModelSerializer):
@@ -20,7 +20,7 @@ class UserConfigSerializer(serializers.ModelSerializer):
         model = UserConfig
         fields = [
             'id', 'github_username', 'email',
-            'report_time', 'timezone', 'is_active', 'repositories',
+            'report_time', 'timezone', 'ingestion_mode', 'is_active', 'repositories',
             'github_token', 'created_at', 'updated_at'
         ]
         read_only_fields = ['id', 'github_token', 'created_at', 'updated_at']
@@ -34,6 +34,10 @@ class UserConfigSerializer(serializers.ModelSerializer):
 
 
 class ReportSerializer(serializers.ModelSerializer):
+    # Stored compressed; the model field decodes them to str
+    content_html = serializers.CharField(read_only=True)
+    content_text = serializers.CharField(read_only=True)
+
     class Meta:
         model = Report
         fields = ['id', 'report_date', 'status', 'content_html', 'content_text', 'commit_count', 'repo_count', 'sent_at']
@@ -41,9 +45,48 @@ class ReportSerializer(serializers.ModelSerializer):
 
 
 class CommitSerializer(serializers.ModelSerializer):
-    repository_name = serializers.CharField(source='repository.repo_name', read_only=True)
+    repository_name = serializers.CharField(source='repo_name', read_only=True)
 
     class Meta:
         model = Commit
-        fields = ['id', 'repository_name', 'author', 'message', 'commit_date', 'files_changed', 'additions', 'deletions']
-        read_only_fields = ['id', 'author', 'message', 'commit_date', 'files_changed', 'additions', 'deletions']
+        fields = [
+            'id', 'repository_name', 'author', 'message', 'category', 'display_message',
+            'commit_date', 'files_changed', 'additions', 'deletions'
+        ]
+        read_only_fields = [
+            'id', 'author', 'message', 'category', 'display_message',
+            'commit_date', 'files_changed', 'additions', 'deletions'
+        ]
+
+
+class CommitFilterRuleSerializer(serializers.ModelSerializer):
+    repository_name = serializers.CharField(source='repository.repo_name', read_only=True)
+
+    class Meta:
+        model = CommitFilterRule
+        fields = ['id', 'repository', 'repository_name', 'pattern', 'created_at']
+        read_only_fields = ['id', 'created_at']
+
+    def validate_repository(self, repository):
+        """Only allow rules on the current user's repositories"""
+        if repository and repository.user_config.user != self.context['request'].user:
+            raise serializers.ValidationError('Unknown repository')
+        return repository
+
+    def validate(self, attrs):
+        """Reject a rule the user already has, including a duplicate rule for all repositories"""
+        repository = attrs['repository'] if 'repository' in attrs else getattr(self.instance, 'repository', None)
+        pattern = attrs['pattern'] if 'pattern' in attrs else getattr(self.instance, 'pattern', None)
+
+        # The database constraint cannot catch this for all-repository rules, as NULLs never collide
+        duplicates = CommitFilterRule.objects.filter(
+            user_config__user=self.context['request'].user,
+            repository=repository,
+            pattern=pattern
+        )
+        if self.instance is not None:
+            duplicates = duplicates.exclude(pk=self.instance.pk)
+        if duplicates.exists():
+            raise serializers.ValidationError('This filter rule already exists')
+
+        return attrs
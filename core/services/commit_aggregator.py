@@ -2,129 +2,882 @@
 Commit Aggregation Service
 Handles fetching and storing commits from GitHub
 """
-from datetime import datetime, date
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, date, timedelta
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Tuple
+import requests
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
 from django.utils import timezone
-from core.models import UserConfig, GithubRepository, Commit
+from django.utils.dateparse import parse_datetime
+from core.models import UserConfig, GithubRepository, BackfillCheckpoint, Commit, UserCommit
+from core.services.commit_filter import NoiseFilter
+from core.services.daily_stats import DailyStatsService
 from core.services.github_service import GitHubService
+from core.services.github_graphql_service import GitHubGraphQLService
+from core.services.report_generator import ReportGenerator
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Number of streamed commits held in memory at once while storing
+STORE_CHUNK_SIZE = 500
+
+# (user configuration, repository row, noise filter) of a user to link commits to
+Watcher = Tuple[UserConfig, GithubRepository, NoiseFilter]
+
+
+class _NewestCommit:
+    """Pass-through over a commit stream that remembers the newest commit date"""
+
+    def __init__(self, commits: Iterable[Dict]):
+        self.commits = commits
+        self.date = None
+
+    def __iter__(self) -> Iterator[Dict]:
+        for commit in self.commits:
+            commit_date = parse_datetime(commit['date'])
+            if commit_date and (self.date is None or commit_date > self.date):
+                self.date = commit_date
+            yield commit
+
 
 class CommitAggregator:
     """Service to aggregate and store commits"""
 
-    def aggregate_daily_commits(self, user_config: UserConfig, target_date: date = None) -> int:
+    # Commits are classified once, when they are first stored
+    report_generator = ReportGenerator()
+    daily_stats = DailyStatsService()
+
+    def __init__(self, interactive: bool = False):
+        """
+        Args:
+            interactive: Work done for a user waiting on an API call, allowed
+                to use the GITHUB_RATE_LIMIT_RESERVE part of the token's budget
+        """
+        self.interactive = interactive
+
+    def aggregate_daily_commits(self, user_config: UserConfig, target_date: date = None, full_window: bool = False) -> int:
         """
         Fetch and store daily commits for a user
         
+        Commits are stored once per repository and linked to every user
+        watching it. A repository whose window was fetched completely within
+        GITHUB_SHARED_FETCH_TTL seconds, by any watcher, is not requested
+        again; the user is linked to the stored commits instead. Commits
+        fetched with another user's token are only linked once the user's
+        own token has completed a fetch of the repository.
+        
+        Intraday runs resume each repository from its cursor. The cursor
+        follows author dates, which say nothing about when a commit was
+        pushed, so the finalize run passes full_window to refetch the whole
+        day (cheap, as unchanged pages revalidate against the ETag cache)
+        and only reuses windows that were fetched in full as well.
+        
         Args:
             user_config: User configuration
             target_date: Date to fetch commits for (default: today)
+            full_window: Ignore the cursor and fetch the whole day
             
         Returns:
-            Number of commits fetched and stored
+            Number of commits newly linked to the user
         """
         if target_date is None:
             target_date = date.today()
 
         # Validate GitHub token
-        gh_service = GitHubService(user_config.github_token)
+        gh_service = self._get_github_service(user_config)
         if not gh_service.verify_token():
             logger.error(f"Invalid GitHub token for {user_config.user.username}")
             return 0
 
+        # The shared store only applies the global filter; the user's own rules apply to links
+        noise_filter = NoiseFilter.for_user(user_config)
+        total_commits = 0
+        since = timezone.make_aware(
+            timezone.datetime.combine(target_date, timezone.datetime.min.time())
+        )
+        until = since + timedelta(days=1)
+        watched = list(user_config.repositories.filter(is_monitored=True))
+        if getattr(settings, 'GITHUB_SKIP_DORMANT_REPOS', True):
+            watched = self._skip_dormant_repos(gh_service, user_config, watched, since)
+        shared = self._recently_fetched(watched, since, full_window)
+        repos = [repo for repo in watched if repo.repo_name not in shared]
+        concurrency = getattr(settings, 'GITHUB_FETCH_CONCURRENCY', 8)
+        fetched = None
+        started = timezone.now()
+
+        if not repos:
+            fetched = []
+        elif user_config.ingestion_mode == 'events':
+            # A few event-feed calls, then store
+            fetched = self._fetch_from_events(gh_service, user_config, repos, since, until, full_window)
+        elif isinstance(gh_service, GitHubGraphQLService):
+            # Batched history queries, then store
+            by_repo, complete = gh_service.get_commits_for_repos([repo.repo_name for repo in repos], since)
+            fetched = [(repo, by_repo.get(repo.repo_name, []), repo.repo_name in complete) for repo in repos]
+        elif concurrency > 1 and len(repos) > 1:
+            # Fetch every repository in parallel, storing chunks as the workers hand them over
+            fetched = self._fetch_concurrently(gh_service, repos, since, until, concurrency, full_window)
+
+        if fetched is not None:
+            progress = {}  # repository id -> (links created, newest commit date) over its chunks so far
+            for repo, commits, complete in fetched:
+                commits = _NewestCommit(commits)
+                linked, newest = progress.get(repo.pk, (0, None))
+                linked += self._store_commits(repo.repo_name, commits, [(user_config, repo, noise_filter)])
+                if commits.date and (newest is None or commits.date > newest):
+                    newest = commits.date
+                progress[repo.pk] = (linked, newest)
+
+                if complete is None:
+                    # More chunks of this repository follow
+                    continue
+                if complete:
+                    self._mark_fetched(repo, since, newest, started, full_window)
+                total_commits += linked
+                logger.info(f"Stored {linked} commits from {repo.repo_name}")
+        else:
+            # Fetch commits from each monitored repository, streaming into the database
+            for repo in repos:
+                commits = _NewestCommit(gh_service.iter_daily_commits(
+                    repo.repo_name,
+                    since=since if full_window else self._cursor_since(repo, since, until),
+                    until=until,
+                    raise_errors=True
+                ))
+
+                # Store commits in database
+                try:
+                    stored = self._store_commits(repo.repo_name, commits, [(user_config, repo, noise_filter)])
+                except requests.exceptions.RequestException:
+                    # Already logged; the chunks stored so far stay, the cursor does not move
+                    continue
+
+                self._mark_fetched(repo, since, commits.date, started, full_window)
+                total_commits += stored
+                logger.info(f"Stored {stored} commits from {repo.repo_name}")
+
+        # Pick up what other watchers stored for the window
+        for repo in watched:
+            total_commits += self._link_window(user_config, repo, noise_filter, since, until)
+
+        logger.info(f"Reused {len(shared)} recently fetched repositories for {user_config.user.username}")
+        return total_commits
+
+    def _cursor_since(self, repo: GithubRepository, since: datetime, until: datetime) -> datetime:
+        """
+        Start of the fetch for a repository, resuming from its high-water mark
+        
+        The cursor is shared by every watcher of the repository, so it is
+        only trusted once the user's own token has completed a fetch of it,
+        and only when it lies inside the window being fetched (i.e. it was
+        set by an earlier run over the same window). It is moved back by
+        GITHUB_CURSOR_OVERLAP seconds to pick up commits pushed late with
+        older timestamps; duplicates are dropped on store.
+        """
+        cursor = repo.last_fetched_at
+        if repo.access_verified_at is None or cursor is None or not since <= cursor < until:
+            return since
+
+        overlap = timedelta(seconds=getattr(settings, 'GITHUB_CURSOR_OVERLAP', 3600))
+        return max(since, cursor - overlap)
+
+    def _advance_cursor(self, repo: GithubRepository, newest: datetime | None, started: datetime):
+        """
+        Move the high-water mark of every watcher of a repository forward (never back)
+        
+        Author dates come from the committer's clock, so the mark is capped
+        at the time the fetch started: a future-dated commit must not push
+        it past commits that have yet to be made.
+        """
+        if newest is None:
+            return
+
+        newest = min(newest, started)
+
+        GithubRepository.objects.filter(repo_name=repo.repo_name).filter(
+            Q(last_fetched_at__isnull=True) | Q(last_fetched_at__lt=newest)
+        ).update(last_fetched_at=newest)
+
+    def _window_key(self, repo_name: str, since: datetime, full_window: bool = False) -> str:
+        """Cache key marking a repository's window as recently fetched (from its cursor or in full)"""
+        suffix = ':full' if full_window else ''
+        return f"github:repo-window:{repo_name}:{since.isoformat()}{suffix}"
+
+    def _recently_fetched(self, repos: List[GithubRepository], since: datetime, full_window: bool = False) -> set:
+        """Names of the verified repositories whose window was fetched within GITHUB_SHARED_FETCH_TTL"""
+        keys = {
+            self._window_key(repo.repo_name, since, full_window): repo.repo_name
+            for repo in repos
+            if repo.access_verified_at
+        }
+        return {keys[key] for key in cache.get_many(list(keys))}
+
+    def _mark_fetched(
+        self,
+        repo: GithubRepository,
+        since: datetime,
+        newest: datetime | None,
+        started: datetime,
+        full_window: bool = False
+    ):
+        """Record a complete fetch of a repository's window with the user's own token"""
+        now = timezone.now()
+        GithubRepository.objects.filter(pk=repo.pk).update(access_verified_at=now)
+        repo.access_verified_at = now
+        self._advance_cursor(repo, newest, started)
+
+        if full_window:
+            # Whatever was pushed before the fetch started is stored, including missed webhooks
+            GithubRepository.objects.filter(pk=repo.pk).filter(
+                Q(webhook_pushed_at__isnull=True) | Q(webhook_pushed_at__lt=started)
+            ).update(webhook_pushed_at=started)
+
+        # Other watchers may only rely on the marker once the commits are visible;
+        # a full fetch also stands in for a cursor fetch, not the other way round
+        ttl = getattr(settings, 'GITHUB_SHARED_FETCH_TTL', 900)
+        keys = {self._window_key(repo.repo_name, since, full) for full in {False, full_window}}
+        transaction.on_commit(lambda: cache.set_many({key: now.isoformat() for key in keys}, ttl))
+
+    def backfill_commits(self, user_config: UserConfig, start_date: date, end_date: date) -> int:
+        """
+        Fetch and store commits for a range of days
+        
+        Each monitored repository is fetched as one paginated window over
+        the whole range and streamed into the store chunk by chunk. After
+        every chunk the URL of the next page is checkpointed, so an
+        interrupted run resumes at that page instead of starting over;
+        repositories already completed for the same range are skipped.
+        
+        Args:
+            user_config: User configuration
+            start_date: First day to fetch
+            end_date: Last day to fetch (inclusive)
+            
+        Returns:
+            Number of commits newly linked to the user
+        """
+        gh_service = GitHubService(user_config.github_token, interactive=self.interactive)
+        if not gh_service.verify_token():
+            logger.error(f"Invalid GitHub token for {user_config.user.username}")
+            return 0
+
+        noise_filter = NoiseFilter.for_user(user_config)
+        since = timezone.make_aware(timezone.datetime.combine(start_date, timezone.datetime.min.time()))
+        until = timezone.make_aware(timezone.datetime.combine(end_date, timezone.datetime.min.time())) + timedelta(days=1)
         total_commits = 0
 
-        # Fetch commits from each monitored repository
         for repo in user_config.repositories.filter(is_monitored=True):
-            commits = gh_service.get_daily_commits(repo.repo_name, since=timezone.make_aware(
-                timezone.datetime.combine(target_date, timezone.datetime.min.time())
-            ))
+            checkpoint, _ = BackfillCheckpoint.objects.get_or_create(
+                repository=repo,
+                start_date=start_date,
+                end_date=end_date
+            )
+            if checkpoint.completed_at:
+                continue
+
+            pages = gh_service.iter_commit_pages(repo.repo_name, since, until, page_url=checkpoint.next_page_url)
+            try:
+                stored = self._store_backfill(user_config, repo, noise_filter, pages, checkpoint)
+            except requests.exceptions.RequestException:
+                logger.warning(f"Backfill of {repo.repo_name} interrupted before {checkpoint.next_page_url or 'the first page'}")
+                continue
+
+            now = timezone.now()
+            checkpoint.completed_at = now
+            checkpoint.save(update_fields=['completed_at', 'updated_at'])
+            GithubRepository.objects.filter(pk=repo.pk).update(access_verified_at=now)
+            repo.access_verified_at = now
 
-            # Store commits in database
-            stored = self._store_commits(user_config, repo, commits)
+            stored += self._link_window(user_config, repo, noise_filter, since, until)
             total_commits += stored
-            logger.info(f"Stored {stored} commits from {repo.repo_name}")
+            logger.info(f"Backfilled {stored} commits from {repo.repo_name}")
 
         return total_commits
 
-    def _store_commits(self, user_config: UserConfig, repository: GithubRepository, commits: list) -> int:
+    def _store_backfill(
+        self,
+        user_config: UserConfig,
+        repository: GithubRepository,
+        noise_filter: NoiseFilter,
+        pages: Iterable[Tuple[List[Dict], str | None]],
+        checkpoint: BackfillCheckpoint
+    ) -> int:
+        """Store a backfill stream by whole pages, checkpointing the next page after each committed chunk"""
+        linked_count = 0
+        chunk = []
+
+        for page, next_url in pages:
+            chunk.extend(page)
+            if len(chunk) < STORE_CHUNK_SIZE and next_url:
+                continue
+
+            with transaction.atomic():
+                linked_count += self._store_commit_chunk(
+                    repository.repo_name, chunk, [(user_config, repository, noise_filter)]
+                )
+                checkpoint.next_page_url = next_url or ''
+                checkpoint.save(update_fields=['next_page_url', 'updated_at'])
+            chunk = []
+
+        return linked_count
+
+    def _get_github_service(self, user_config: UserConfig) -> GitHubService:
+        """Build the GitHub backend selected by GITHUB_COMMIT_BACKEND ('rest' or 'graphql')"""
+        if getattr(settings, 'GITHUB_COMMIT_BACKEND', 'rest') == 'graphql':
+            return GitHubGraphQLService(user_config.github_token, interactive=self.interactive)
+
+        return GitHubService(user_config.github_token, interactive=self.interactive)
+
+    def _fetch_from_events(
+        self,
+        gh_service: GitHubService,
+        user_config: UserConfig,
+        repos: List[GithubRepository],
+        since: datetime,
+        until: datetime,
+        full_window: bool = False
+    ) -> List[Tuple[GithubRepository, List[Dict], bool]]:
+        """
+        Collect commits from the user's event feed
+        
+        The number of calls follows the user's activity rather than the
+        repository count; only repositories whose pushes were truncated in
+        the feed get a per-repository fetch.
+        
+        Returns:
+            List of (repository, normalized commits, fetch completed) in the
+            order of repos
+        """
+        by_repo, truncated = gh_service.get_push_event_commits(
+            user_config.github_username,
+            {repo.repo_name: repo.default_branch for repo in repos},
+            since
+        )
+
+        fetched = []
+        for repo in repos:
+            if repo.repo_name in truncated:
+                fetched.append((repo, *self._fetch_repo(gh_service, repo, since, until, full_window)))
+            else:
+                fetched.append((repo, by_repo[repo.repo_name], True))
+
+        logger.info(f"Event feed covered {len(repos) - len(truncated)}/{len(repos)} repositories")
+        return fetched
+
+    def _fetch_concurrently(
+        self,
+        gh_service: GitHubService,
+        repos: List[GithubRepository],
+        since: datetime,
+        until: datetime,
+        concurrency: int,
+        full_window: bool = False
+    ) -> Iterator[Tuple[GithubRepository, List[Dict], bool | None]]:
         """
-        Store fetched commits in the database
+        Fetch commits for several repositories on a bounded thread pool
+        
+        Worker threads only talk to GitHub (every request still goes through
+        the shared rate limiter); all database work stays on the caller's thread.
+        Workers hand their streams over in chunks of STORE_CHUNK_SIZE through
+        a queue holding at most `concurrency` chunks, so memory stays bounded
+        however many commits the repositories have.
         
         Args:
-            user_config: User configuration
-            repository: Repository model instance
-            commits: List of normalized commits
+            gh_service: GitHub service for the user's token
+            repos: Repositories to fetch
+            since: Start of the window to fetch
+            until: End of the window to fetch
+            concurrency: Maximum number of requests in flight
+            full_window: Ignore the repositories' cursors
+            
+        Yields:
+            (repository, chunk of normalized commits, None) while a repository
+            is being fetched, then (repository, last chunk, fetch completed)
+            once it is done; repositories are interleaved
+        """
+        handoff = queue.Queue(maxsize=concurrency)
+        stop = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=min(concurrency, len(repos)))
+        for repo in repos:
+            executor.submit(self._stream_repo, gh_service, repo, since, until, full_window, handoff, stop)
+
+        try:
+            remaining = len(repos)
+            while remaining:
+                repo, chunk, complete = handoff.get()
+                if isinstance(complete, Exception):
+                    raise complete
+                if complete is not None:
+                    remaining -= 1
+                yield repo, chunk, complete
+        finally:
+            # Release workers blocked on a full queue when the caller stops early
+            stop.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _stream_repo(
+        self,
+        gh_service: GitHubService,
+        repo: GithubRepository,
+        since: datetime,
+        until: datetime,
+        full_window: bool,
+        handoff: queue.Queue,
+        stop: threading.Event
+    ):
+        """Worker of _fetch_concurrently: fetch one repository and hand it over chunk by chunk"""
+        def hand_over(chunk: List[Dict], complete) -> bool:
+            while not stop.is_set():
+                try:
+                    handoff.put((repo, chunk, complete), timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        chunk = []
+        try:
+            stream = gh_service.iter_daily_commits(
+                repo.repo_name,
+                since=since if full_window else self._cursor_since(repo, since, until),
+                until=until,
+                raise_errors=True
+            )
+            for commit in stream:
+                if stop.is_set():
+                    return
+                chunk.append(commit)
+                if len(chunk) == STORE_CHUNK_SIZE:
+                    if not hand_over(chunk, None):
+                        return
+                    chunk = []
+        except requests.exceptions.RequestException:
+            # Already logged; what was fetched is kept, the fetch is incomplete
+            hand_over(chunk, False)
+        except Exception as e:
+            # Raised on the caller's thread (e.g. RateLimitExceeded)
+            hand_over(chunk, e)
+        else:
+            hand_over(chunk, True)
+
+    def _fetch_repo(
+        self,
+        gh_service: GitHubService,
+        repo: GithubRepository,
+        since: datetime,
+        until: datetime,
+        full_window: bool = False
+    ) -> Tuple[List[Dict], bool]:
+        """Fetch one repository from its cursor (or in full), keeping partial results on errors"""
+        commits = []
+        stream = gh_service.iter_daily_commits(
+            repo.repo_name,
+            since=since if full_window else self._cursor_since(repo, since, until),
+            until=until,
+            raise_errors=True
+        )
+
+        try:
+            for commit in stream:
+                commits.append(commit)
+        except requests.exceptions.RequestException:
+            return commits, False
+
+        return commits, True
+
+    def _store_commits(self, repo_name: str, commits: Iterable[Dict], watchers: List[Watcher]) -> int:
+        """
+        Store fetched commits once and link them to the watching users
+        
+        Commits are consumed in chunks of STORE_CHUNK_SIZE, so a streamed
+        fetch never has to be materialized in full. Each chunk costs one
+        lookup for known SHAs, one bulk insert and one id lookup, plus one
+        lookup and one bulk insert of links per watcher, in a transaction
+        of its own: no transaction is held open while the stream waits on
+        GitHub, and chunks stored before a fetch error are kept.
+        
+        Args:
+            repo_name: Repository the commits belong to
+            commits: Iterable of normalized commits
+            watchers: (user configuration, repository, noise filter) of each user to link
             
         Returns:
-            Number of commits stored
+            Number of links created
         """
-        stored_count = 0
+        linked_count = 0
+        commits = iter(commits)
+
+        while True:
+            chunk = list(islice(commits, STORE_CHUNK_SIZE))
+            if not chunk:
+                break
+            with transaction.atomic():
+                linked_count += self._store_commit_chunk(repo_name, chunk, watchers)
+
+        return linked_count
 
+    def _store_commit_chunk(self, repo_name: str, commits: list, watchers: List[Watcher]) -> int:
+        """Store one bounded chunk of normalized commits and link it to the watchers"""
+        # Later duplicates within the chunk (e.g. a page boundary shift) are dropped
+        by_sha = {}
         for commit_data in commits:
-            try:
-                # Check if commit already exists
-                if Commit.objects.filter(commit_sha=commit_data['sha']).exists():
-                    continue
+            by_sha.setdefault(commit_data['sha'], commit_data)
+
+        repo_commits = Commit.objects.filter(repo_name=repo_name, commit_sha__in=by_sha.keys())
+        existing = set(repo_commits.values_list('commit_sha', flat=True))
+
+        new_commits = []
+        for sha, commit_data in by_sha.items():
+            if sha in existing:
+                continue
 
+            try:
                 # Parse commit date
                 commit_date = datetime.fromisoformat(commit_data['date'].replace('Z', '+00:00'))
+            except (KeyError, ValueError, AttributeError) as e:
+                logger.error(f"Error storing commit {sha[:8]}: {str(e)}")
+                continue
 
-                # Create commit record
-                commit = Commit.objects.create(
-                    user_config=user_config,
-                    repository=repository,
-                    commit_sha=commit_data['sha'],
-                    author=commit_data['author'],
-                    message=commit_data['message'],
-                    files_changed=commit_data['files_changed'],
-                    additions=commit_data['additions'],
-                    deletions=commit_data['deletions'],
-                    commit_date=commit_date,
-                )
+            category, display_message = self.report_generator.classify_message(commit_data['message'])
+            new_commits.append(Commit(
+                repo_name=repo_name,
+                commit_sha=sha,
+                author=commit_data['author'],
+                message=commit_data['message'],
+                full_message=commit_data.get('full_message', commit_data['message']),
+                category=category,
+                display_message=display_message,
+                files_changed=commit_data['files_changed'],
+                additions=commit_data['additions'],
+                deletions=commit_data['deletions'],
+                stats_fetched=commit_data.get('stats_fetched', False),
+                commit_date=commit_date,
+            ))
 
-                stored_count += 1
-                logger.debug(f"Stored commit {commit.commit_sha[:8]}")
+        # Conflicts can only come from a concurrent writer racing on the same commit
+        Commit.objects.bulk_create(new_commits, batch_size=STORE_CHUNK_SIZE, ignore_conflicts=True)
+        logger.debug(f"Stored {len(new_commits)} commits, skipped {len(existing)} known")
 
-            except Exception as e:
-                logger.error(f"Error storing commit: {str(e)}")
-                continue
+        if not watchers:
+            return 0
+
+        # Per-user rules match the stored messages, as they do when _link_window links stored commits
+        stored = self._filtered_messages(repo_commits)
+        return sum(
+            self._link_commits(user_config, repository, noise_filter, stored)
+            for user_config, repository, noise_filter in watchers
+        )
+
+    def _link_commits(
+        self,
+        user_config: UserConfig,
+        repository: GithubRepository,
+        noise_filter: NoiseFilter,
+        commits: Iterable[Tuple[int, str]]
+    ) -> int:
+        """
+        Link stored commits to a user, skipping the user's noise and existing links
+        
+        Args:
+            user_config: User configuration
+            repository: The user's repository row
+            noise_filter: The user's noise filter
+            commits: (commit id, message to match the rules against) pairs
+            
+        Returns:
+            Number of links created
+        """
+        ids = [
+            commit_id for commit_id, message in commits
+            if not noise_filter.is_noise(message, repository.repo_name)
+        ]
+        linked = set(
+            UserCommit.objects.filter(user_config=user_config, commit_id__in=ids).values_list('commit_id', flat=True)
+        )
 
-        return stored_count
+        links = [
+            UserCommit(user_config=user_config, repository=repository, commit_id=commit_id)
+            for commit_id in ids
+            if commit_id not in linked
+        ]
+        UserCommit.objects.bulk_create(links, batch_size=STORE_CHUNK_SIZE, ignore_conflicts=True)
+        return len(links)
+
+    def _link_window(
+        self,
+        user_config: UserConfig,
+        repository: GithubRepository,
+        noise_filter: NoiseFilter,
+        since: datetime,
+        until: datetime
+    ) -> int:
+        """Link the commits stored for a window by any watcher, once the user's access is verified"""
+        if repository.access_verified_at is None:
+            return 0
+
+        commits = Commit.objects.filter(
+            repo_name=repository.repo_name,
+            commit_date__gte=since,
+            commit_date__lt=until
+        ).exclude(user_links__user_config=user_config)
+
+        with transaction.atomic():
+            return self._link_commits(user_config, repository, noise_filter, self._filtered_messages(commits))
+
+    def _filtered_messages(self, commits) -> List[Tuple[int, str]]:
+        """
+        (commit id, message) pairs for matching filter rules against stored commits
+        
+        Rules see the full message, as the global words do when a commit is
+        fetched; commits stored before full messages were kept fall back to
+        their first line.
+        """
+        return [
+            (commit_id, full_message or message)
+            for commit_id, message, full_message in commits.values_list('id', 'message', 'full_message')
+        ]
+
+    def enrich_commit_stats(self, user_config: UserConfig) -> int:
+        """
+        Fill in real diff stats for commits stored without them
+        
+        The list-commits endpoint never includes files, so each new SHA is
+        looked up individually, at most GITHUB_STATS_CONCURRENCY at a time.
+        
+        Args:
+            user_config: User configuration
+            
+        Returns:
+            Number of commits enriched
+        """
+        pending = Commit.objects.filter(
+            user_links__user_config=user_config,
+            stats_fetched=False
+        ).order_by('id')
+
+        gh_service = GitHubService(user_config.github_token, interactive=self.interactive)
+        concurrency = getattr(settings, 'GITHUB_STATS_CONCURRENCY', 4)
+        enriched = 0
+
+        # Chunks are keyed on id so updated rows never shift the next slice
+        last_id = 0
+        while True:
+            chunk = list(pending.filter(id__gt=last_id)[:STORE_CHUNK_SIZE])
+            if not chunk:
+                break
+            last_id = chunk[-1].id
+
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                results = list(executor.map(
+                    lambda commit: gh_service.get_commit_stats(commit.repo_name, commit.commit_sha),
+                    chunk
+                ))
+
+            updated = []
+            for commit, stats in zip(chunk, results):
+                if stats is None:
+                    continue
+                commit.files_changed = stats['files_changed']
+                commit.additions = stats['additions']
+                commit.deletions = stats['deletions']
+                commit.stats_fetched = True
+                updated.append(commit)
+
+            Commit.objects.bulk_update(updated, ['files_changed', 'additions', 'deletions', 'stats_fetched'])
+            # Days already in a report carry the old diff totals
+            self.daily_stats.refresh_commits([commit.id for commit in updated])
+            enriched += len(updated)
+
+        logger.info(f"Enriched stats for {enriched} commits of {user_config.user.username}")
+        return enriched
 
     def sync_user_repositories(self, user_config: UserConfig) -> int:
         """
         Sync all repositories for a user from GitHub
         
+        Runs as a fixed number of set-based queries in one transaction:
+        existing names are loaded once, new repositories are bulk-inserted,
+        changed pushed_at values are bulk-updated, and repositories no longer
+        listed on GitHub are marked with removed_at. Only repositories seen
+        in an earlier listing can be marked; ones added by hand were never
+        listed and are left alone.
+        
         Args:
             user_config: User configuration
             
         Returns:
             Number of repositories synced
         """
-        gh_service = GitHubService(user_config.github_token)
-        repos = gh_service.get_user_repos(user_config.github_username)
+        gh_service = GitHubService(user_config.github_token, interactive=self.interactive)
+        # A partial listing must not mark the missing rest as removed
+        listed = {
+            repo['name']: repo
+            for repo in gh_service.get_user_repos(user_config.github_username, raise_errors=True)
+        }
 
-        synced = 0
-        for repo_name in repos:
-            try:
-                owner, name = repo_name.split('/')
-                repo_url = f"https://github.com/{repo_name}"
+        existing = {
+            repo.repo_name: repo
+            for repo in user_config.repositories.only(
+                'id', 'user_config', 'repo_name', 'pushed_at', 'default_branch', 'removed_at'
+            )
+        }
 
-                repo, created = GithubRepository.objects.get_or_create(
-                    user_config=user_config,
-                    repo_name=repo_name,
-                    defaults={'repo_url': repo_url, 'is_monitored': True}
-                )
+        now = timezone.now()
+        new_repos = [
+            GithubRepository(
+                user_config=user_config,
+                repo_name=repo_name,
+                repo_url=f"https://github.com/{repo_name}",
+                is_monitored=True,
+                pushed_at=listing['pushed_at'],
+                default_branch=listing['default_branch'],
+                listed_at=now,
+            )
+            for repo_name, listing in listed.items()
+            if repo_name not in existing
+        ]
+
+        changed = []
+        for repo_name, repo in existing.items():
+            listing = listed.get(repo_name)
+            if listing and (
+                repo.pushed_at != listing['pushed_at']
+                or repo.default_branch != listing['default_branch']
+                or repo.removed_at
+            ):
+                repo.pushed_at = listing['pushed_at']
+                repo.default_branch = listing['default_branch']
+                repo.removed_at = None
+                changed.append(repo)
+
+        with transaction.atomic():
+            GithubRepository.objects.bulk_create(new_repos, ignore_conflicts=True)
+            GithubRepository.objects.bulk_update(changed, ['pushed_at', 'default_branch', 'removed_at'])
+            user_config.repositories.filter(repo_name__in=listed.keys()).update(listed_at=now)
+            removed = user_config.repositories.filter(removed_at__isnull=True, listed_at__isnull=False).exclude(
+                repo_name__in=listed.keys()
+            ).update(removed_at=now)
+
+        logger.info(
+            f"Synced repositories for {user_config.user.username}: "
+            f"{len(new_repos)} added, {len(changed)} updated, {removed} removed"
+        )
+        return len(new_repos)
 
-                if created:
-                    synced += 1
-                    logger.info(f"Added repository {repo_name}")
+    def _skip_dormant_repos(
+        self,
+        gh_service: GitHubService,
+        user_config: UserConfig,
+        repos: List[GithubRepository],
+        since: datetime
+    ) -> List[GithubRepository]:
+        """
+        Drop repositories that have nothing new to fetch for the window
+        
+        pushed_at and the default branch are refreshed from the repository
+        listing first (a few paginated calls instead of one commits call per
+        repository). A repository is skipped when its last push predates the window start,
+        or, with GITHUB_WEBHOOKS_ENABLED, when everything up to its last push
+        is already stored: webhook_pushed_at only moves past a full fetch
+        while each push webhook continues from the head of the previous one,
+        so a lost delivery keeps the repository in the reconciliation until
+        a full fetch covers it. Repos missing from the listing, e.g. private
+        ones, are always kept.
+        
+        Returns:
+            Repositories that may have commits in the window
+        """
+        listed = {repo['name']: repo for repo in gh_service.get_user_repos(user_config.github_username)}
+        webhooks_enabled = getattr(settings, 'GITHUB_WEBHOOKS_ENABLED', False)
 
-            except Exception as e:
-                logger.error(f"Error syncing repo {repo_name}: {str(e)}")
+        changed = []
+        for repo in repos:
+            listing = listed.get(repo.repo_name)
+            if listing and (
+                repo.pushed_at != listing['pushed_at'] or repo.default_branch != listing['default_branch']
+            ):
+                repo.pushed_at = listing['pushed_at']
+                repo.default_branch = listing['default_branch']
+                changed.append(repo)
+        GithubRepository.objects.bulk_update(changed, ['pushed_at', 'default_branch'])
+
+        active = []
+        for repo in repos:
+            if repo.repo_name not in listed or repo.pushed_at is None:
+                active.append(repo)
+            elif repo.pushed_at < since:
+                continue
+            elif webhooks_enabled and repo.webhook_pushed_at and repo.webhook_pushed_at >= repo.pushed_at:
                 continue
+            else:
+                active.append(repo)
+
+        logger.info(f"Skipping {len(repos) - len(active)} up-to-date repositories for {user_config.user.username}")
+        return active
+
+    def ingest_push(
+        self,
+        repo_name: str,
+        push_commits: List[Dict],
+        pushed_at: datetime,
+        before: str = '',
+        after: str = ''
+    ) -> int:
+        """
+        Store the commits of a push webhook once for all watching users
+        
+        Commits are linked to every active watcher whose access to the
+        repository is verified; the others pick them up from the store on
+        their next fetch. A push that starts from the head the previous
+        webhook left is known to miss nothing, so the reconciliation pass
+        can skip the repository; any other push means a delivery may have
+        been lost, and the repository is reconciled again.
+        
+        Args:
+            repo_name: Repository the push belongs to
+            push_commits: `commits` list of the push payload
+            pushed_at: Push time
+            before: Branch head before the push
+            after: Branch head after the push
+            
+        Returns:
+            Number of links created
+        """
+        repositories = list(GithubRepository.objects.filter(
+            repo_name=repo_name,
+            is_monitored=True,
+            user_config__is_active=True
+        ).select_related('user_config'))
+        if not repositories:
+            return 0
+
+        # Normalizing a payload makes no requests; any watcher's token will do
+        gh_service = GitHubService(repositories[0].user_config.github_token)
+        commits = gh_service.normalize_push_commits(push_commits, repo_name, pushed_at.isoformat())
+        verified = [repository for repository in repositories if repository.access_verified_at]
+        watchers = [
+            (repository.user_config, repository, NoiseFilter.for_user(repository.user_config))
+            for repository in verified
+        ]
+
+        with transaction.atomic():
+            stored = self._store_commits(repo_name, commits, watchers)
+
+            # The reconciliation pass can skip the repo until a newer push shows up,
+            # unless this push does not follow on from the last one delivered
+            verified_rows = GithubRepository.objects.filter(pk__in=[repository.pk for repository in verified])
+            unbroken = verified_rows.filter(webhook_pushed_at__isnull=False, webhook_head_sha=before).exclude(webhook_head_sha='')
+            unbroken.filter(webhook_pushed_at__lt=pushed_at).update(webhook_pushed_at=pushed_at)
+            verified_rows.exclude(pk__in=unbroken.values('pk')).update(webhook_pushed_at=None)
+            verified_rows.update(webhook_head_sha=after)
+            verified_rows.filter(Q(pushed_at__isnull=True) | Q(pushed_at__lt=pushed_at)).update(pushed_at=pushed_at)
 
-        return synced
+        logger.info(f"Linked {stored} pushed commits from {repo_name} to {len(verified)} watchers")
+        return stored
@@ -0,0 +1,176 @@
+"""
+Commit Analytics Service
+Activity heatmaps, per-repository churn and daily trends computed with NumPy
+"""
+from datetime import date, datetime, time, timedelta, tzinfo
+from operator import itemgetter
+from typing import Dict, List, Sequence, Tuple
+import numpy as np
+from pytz import timezone as pytz_timezone
+from core.models import UserCommit, UserConfig
+import logging
+
+logger = logging.getLogger(__name__)
+
+SECONDS_PER_DAY = 86400
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+class CommitAnalytics:
+    """
+    Summarize a user's commits over a date range
+
+    Rows are loaded once with values_list and read into integer column
+    arrays; the user's timezone, the heatmap, churn and daily series are all
+    array arithmetic, bincounts or cumulative sums instead of loops over rows.
+    """
+
+    # Longest range accepted, in days
+    max_days = 366
+
+    def summarize(self, user_config: UserConfig, start_date: date, end_date: date, window: int = 7) -> Dict:
+        """
+        Build the analytics for a user
+
+        Args:
+            user_config: User configuration
+            start_date: First day, inclusive, in the user's timezone
+            end_date: Last day, inclusive, in the user's timezone
+            window: Days in the trailing rolling averages
+
+        Returns:
+            Dictionary with the commit count, a 7x24 weekday/hour heatmap
+            (Monday first), per-repository churn (highest first) and a daily
+            series with rolling averages
+
+        Raises:
+            ValueError: If the range is empty, longer than max_days, or window < 1
+        """
+        if end_date < start_date or (end_date - start_date).days >= self.max_days:
+            raise ValueError(f"Date range must cover 1 to {self.max_days} days")
+        if window < 1:
+            raise ValueError("window must be at least 1")
+
+        user_tz = pytz_timezone(user_config.timezone)
+        rows = UserCommit.objects.filter(
+            user_config=user_config,
+            commit__commit_date__gte=user_tz.localize(datetime.combine(start_date, time.min)),
+            commit__commit_date__lt=user_tz.localize(datetime.combine(end_date + timedelta(days=1), time.min)),
+        ).values_list('commit__commit_date', 'commit__repo_name', 'commit__additions', 'commit__deletions')
+
+        result = self.compute(self.to_columns(rows, user_tz), start_date, end_date, window)
+        result['timezone'] = user_config.timezone
+        return result
+
+    def to_columns(self, rows: Sequence[Tuple], user_tz: tzinfo) -> Dict:
+        """
+        Turn (commit_date, repository, additions, deletions) rows into arrays
+
+        Each column is read straight into an array with fromiter. Dates
+        become epoch seconds shifted to local time, from which the ISO
+        weekday, hour and day ordinal are plain integer arithmetic;
+        repositories become codes into the sorted list of names. Nothing
+        downstream touches Python objects per row.
+        """
+        count = len(rows)
+
+        def column(index: int, convert=None) -> np.ndarray:
+            values = map(itemgetter(index), rows)
+            return np.fromiter(map(convert, values) if convert else values, np.int64, count=count)
+
+        timestamps = column(0, datetime.timestamp)
+        local = timestamps + self._utc_offsets(timestamps, user_tz)
+        days = local // SECONDS_PER_DAY
+
+        repositories = list(map(itemgetter(1), rows))
+        names = sorted(set(repositories))
+        codes = dict(zip(names, range(len(names))))
+
+        return {
+            'weekday': (days + 3) % 7 + 1,  # 1970-01-01 was a Thursday
+            'hour': local % SECONDS_PER_DAY // 3600,
+            'day': days + EPOCH_ORDINAL,
+            'repository': np.fromiter(map(codes.__getitem__, repositories), np.int64, count=count),
+            'names': names,
+            'additions': column(2),
+            'deletions': column(3),
+        }
+
+    def _utc_offsets(self, timestamps: np.ndarray, user_tz: tzinfo) -> np.ndarray:
+        """
+        UTC offset in seconds of user_tz at each timestamp, to the hour
+
+        The timezone is asked once per UTC day, plus once per hour on the
+        days whose offset changes (DST transitions), rather than per row.
+        """
+        if not len(timestamps):
+            return timestamps
+
+        def offset(timestamp: int) -> int:
+            return int(datetime.fromtimestamp(timestamp, user_tz).utcoffset().total_seconds())
+
+        first_day = int(timestamps.min()) // SECONDS_PER_DAY
+        day_count = int(timestamps.max()) // SECONDS_PER_DAY - first_day + 1
+        midnights = np.array([offset((first_day + i) * SECONDS_PER_DAY) for i in range(day_count + 1)])
+
+        hourly = np.repeat(midnights[:-1], 24)
+        for day in np.flatnonzero(midnights[:-1] != midnights[1:]):
+            base = (first_day + int(day)) * SECONDS_PER_DAY
+            hourly[day * 24:(day + 1) * 24] = [offset(base + hour * 3600) for hour in range(24)]
+
+        return hourly[timestamps // 3600 - first_day * 24]
+
+    def compute(self, columns: Dict, start_date: date, end_date: date, window: int) -> Dict:
+        """Aggregate the arrays from to_columns into the analytics payload"""
+        churn = columns['additions'] + columns['deletions']
+
+        # Weekday/hour heatmap: one bincount over the flattened 7x24 grid
+        heatmap = np.bincount((columns['weekday'] - 1) * 24 + columns['hour'], minlength=7 * 24).reshape(7, 24)
+
+        # Per-repository totals: weighted bincounts over the name codes
+        names, codes = columns['names'], columns['repository']
+        repo_commits = np.bincount(codes, minlength=len(names))
+        repo_additions = np.bincount(codes, weights=columns['additions'], minlength=len(names)).astype(np.int64)
+        repo_deletions = np.bincount(codes, weights=columns['deletions'], minlength=len(names)).astype(np.int64)
+        repo_churn = repo_additions + repo_deletions
+        # Names are sorted, so a stable sort keeps them as the tie-breaker
+        order = np.argsort(-repo_churn, kind='stable')
+
+        # Daily series over every day of the range, including quiet ones
+        day_count = (end_date - start_date).days + 1
+        offsets = columns['day'] - start_date.toordinal()
+        daily_commits = np.bincount(offsets, minlength=day_count)
+        daily_churn = np.bincount(offsets, weights=churn, minlength=day_count).astype(np.int64)
+        days = np.arange(np.datetime64(start_date, 'D'), np.datetime64(end_date, 'D') + 1)
+
+        return {
+            'start_date': start_date.isoformat(),
+            'end_date': end_date.isoformat(),
+            'commit_count': int(len(churn)),
+            'heatmap': heatmap.tolist(),
+            'repositories': [
+                {
+                    'repository': names[i],
+                    'commit_count': int(repo_commits[i]),
+                    'additions': int(repo_additions[i]),
+                    'deletions': int(repo_deletions[i]),
+                    'churn': int(repo_churn[i]),
+                }
+                for i in order
+            ],
+            'daily': {
+                'window': window,
+                'dates': days.astype(str).tolist(),
+                'commit_count': daily_commits.tolist(),
+                'churn': daily_churn.tolist(),
+                'commit_count_avg': self._rolling_mean(daily_commits, window),
+                'churn_avg': self._rolling_mean(daily_churn, window),
+            },
+        }
+
+    def _rolling_mean(self, values: np.ndarray, window: int) -> List[float]:
+        """Trailing mean over up to window values, from one cumulative sum"""
+        sums = np.concatenate(([0], np.cumsum(values)))
+        ends = np.arange(1, len(values) + 1)
+        starts = np.maximum(ends - window, 0)
+        return np.round((sums[ends] - sums[starts]) / (ends - starts), 2).tolist()
@@ -0,0 +1,88 @@
+"""
+Commit Noise Filter
+Compiled matchers for global, per-user and per-repository filter rules
+"""
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, Tuple
+from django.conf import settings
+from core.models import UserConfig, CommitFilterRule
+
+
+@lru_cache(maxsize=256)
+def compile_patterns(patterns: Tuple[str, ...]) -> re.Pattern | None:
+    """
+    Compile a rule set into one case-insensitive alternation
+
+    The cache is keyed by the rules themselves, so editing a rule simply
+    produces a new key and stale matchers age out of the LRU.
+
+    Args:
+        patterns: Sorted, de-duplicated substrings to match
+
+    Returns:
+        Compiled regex, or None for an empty rule set
+    """
+    if not patterns:
+        return None
+
+    # Longest first, so overlapping literals don't shadow each other
+    alternatives = sorted(patterns, key=len, reverse=True)
+    return re.compile('|'.join(re.escape(pattern) for pattern in alternatives), re.IGNORECASE)
+
+
+def _rule_key(patterns: Iterable[str]) -> Tuple[str, ...]:
+    return tuple(sorted({pattern for pattern in patterns if pattern}))
+
+
+class NoiseFilter:
+    """Decide whether a commit message is noise, at constant cost per message"""
+
+    def __init__(self, patterns: Iterable[str] = (), repo_patterns: Dict[str, Iterable[str]] = None):
+        """
+        Args:
+            patterns: Substrings that mark a commit as noise in every repository
+            repo_patterns: Extra substrings per repository (owner/repo format)
+        """
+        patterns = list(patterns)
+        self._matcher = compile_patterns(_rule_key(patterns))
+        self._repo_matchers = {
+            repo: compile_patterns(_rule_key(patterns + list(extra)))
+            for repo, extra in (repo_patterns or {}).items()
+        }
+
+    @classmethod
+    def from_settings(cls) -> 'NoiseFilter':
+        """Filter with only the global GITHUB_COMMIT_FILTER_WORDS"""
+        return cls(settings.GITHUB_COMMIT_FILTER_WORDS)
+
+    @classmethod
+    def for_user(cls, user_config: UserConfig) -> 'NoiseFilter':
+        """Filter combining the global words with the user's own rules"""
+        patterns = list(settings.GITHUB_COMMIT_FILTER_WORDS)
+        repo_patterns = {}
+
+        rules = CommitFilterRule.objects.filter(user_config=user_config).values_list(
+            'repository__repo_name', 'pattern'
+        )
+        for repo_name, pattern in rules:
+            if repo_name is None:
+                patterns.append(pattern)
+            else:
+                repo_patterns.setdefault(repo_name, []).append(pattern)
+
+        return cls(patterns, repo_patterns)
+
+    def is_noise(self, message: str, repo: str = None) -> bool:
+        """
+        Check if a commit message matches any rule
+
+        Args:
+            message: Commit message
+            repo: Repository the commit belongs to, for per-repository rules
+
+        Returns:
+            True if commit is noise, False otherwise
+        """
+        matcher = self._repo_matchers.get(repo, self._matcher)
+        return matcher is not None and matcher.search(message) is not None
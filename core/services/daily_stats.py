@@ -0,0 +1,159 @@
+"""
+Daily Stats Service
+Keeps per-day repository totals and builds weekly/monthly rollups from them
+"""
+import calendar
+from datetime import date, timedelta
+from typing import Dict, Iterable, Tuple
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import TruncDate
+from core.models import Commit, UserCommit, UserConfig, DailyRepoStats
+import logging
+
+logger = logging.getLogger(__name__)
+
+# DailyRepoStats column for each commit category
+CATEGORY_FIELDS = {category: f"{category}_count" for category, _ in Commit.CATEGORY_CHOICES}
+TOTAL_FIELDS = ['commit_count', 'additions', 'deletions', *CATEGORY_FIELDS.values()]
+
+
+class DailyStatsService:
+    """
+    Maintain DailyRepoStats and summarize it
+
+    A day's rows are recomputed from the commits folded into its report, so
+    refreshing is idempotent and picks up diff stats filled in later.
+    Rollups read only the stats table, never Commit, so they stay cheap and
+    keep working after old commits are cleaned up.
+    """
+
+    def refresh_day(self, user_config: UserConfig, report_date: date) -> int:
+        """
+        Recompute a user's per-repository totals for one day
+
+        Args:
+            user_config: User configuration
+            report_date: Day to recompute
+
+        Returns:
+            Number of repository rows written
+        """
+        return self._refresh(user_config.id, report_date)
+
+    def refresh_commits(self, commit_ids: Iterable[int]) -> int:
+        """
+        Recompute every user-day that includes one of the given commits
+
+        Used after diff stats are filled in, since a shared commit counts
+        towards each watcher's totals.
+
+        Returns:
+            Number of repository rows written
+        """
+        user_days = (
+            UserCommit.objects.filter(commit_id__in=list(commit_ids), is_processed=True)
+            .annotate(day=TruncDate('commit__commit_date'))
+            .values_list('user_config_id', 'day')
+            .distinct()
+        )
+        return sum(self._refresh(user_config_id, day) for user_config_id, day in user_days)
+
+    def _refresh(self, user_config_id: int, report_date: date) -> int:
+        """Aggregate one user-day from its processed links and upsert the rows"""
+        rows = (
+            UserCommit.objects.filter(
+                user_config_id=user_config_id,
+                is_processed=True,
+                commit__commit_date__date=report_date
+            )
+            .values('commit__repo_name')
+            .annotate(
+                commits=Count('id'),
+                lines_added=Sum('commit__additions'),
+                lines_deleted=Sum('commit__deletions'),
+                **{
+                    field: Count('id', filter=Q(commit__category=category))
+                    for category, field in CATEGORY_FIELDS.items()
+                }
+            )
+        )
+
+        stats = [
+            DailyRepoStats(
+                user_config_id=user_config_id,
+                repo_name=row['commit__repo_name'],
+                date=report_date,
+                commit_count=row['commits'],
+                additions=row['lines_added'] or 0,
+                deletions=row['lines_deleted'] or 0,
+                **{field: row[field] for field in CATEGORY_FIELDS.values()}
+            )
+            for row in rows
+        ]
+
+        DailyRepoStats.objects.bulk_create(
+            stats,
+            update_conflicts=True,
+            unique_fields=['user_config', 'repo_name', 'date'],
+            update_fields=[*TOTAL_FIELDS, 'updated_at'],
+        )
+        return len(stats)
+
+    def period_bounds(self, period: str, day: date) -> Tuple[date, date]:
+        """
+        First and last day of the week (Monday to Sunday) or month containing day
+
+        Raises:
+            ValueError: If period is not 'week' or 'month'
+        """
+        if period == 'week':
+            start = day - timedelta(days=day.weekday())
+            return start, start + timedelta(days=6)
+        if period == 'month':
+            return day.replace(day=1), day.replace(day=calendar.monthrange(day.year, day.month)[1])
+        raise ValueError(f"Unknown rollup period: {period}")
+
+    def rollup(self, user_config: UserConfig, start_date: date, end_date: date) -> Dict:
+        """
+        Summarize a user's activity over a date range
+
+        Args:
+            user_config: User configuration
+            start_date: First day, inclusive
+            end_date: Last day, inclusive
+
+        Returns:
+            Dictionary with the totals, per-category counts, per-repository
+            totals (busiest first) and per-day commit counts
+        """
+        stats = DailyRepoStats.objects.filter(user_config=user_config, date__range=(start_date, end_date))
+
+        totals = stats.aggregate(**{f"total_{field}": Sum(field) for field in TOTAL_FIELDS})
+        repositories = (
+            stats.values('repo_name')
+            .annotate(commits=Sum('commit_count'), lines_added=Sum('additions'), lines_deleted=Sum('deletions'))
+            .order_by('-commits', 'repo_name')
+        )
+        days = stats.values('date').annotate(commits=Sum('commit_count')).order_by('date')
+
+        return {
+            'start_date': start_date.isoformat(),
+            'end_date': end_date.isoformat(),
+            'commit_count': totals['total_commit_count'] or 0,
+            'additions': totals['total_additions'] or 0,
+            'deletions': totals['total_deletions'] or 0,
+            'categories': {
+                category: totals[f"total_{field}"] or 0
+                for category, field in CATEGORY_FIELDS.items()
+            },
+            'repositories': [
+                {
+                    'repository': row['repo_name'],
+                    'commit_count': row['commits'],
+                    'additions': row['lines_added'],
+                    'deletions': row['lines_deleted'],
+                }
+                for row in repositories
+            ],
+            'days': [{'date': row['date'].isoformat(), 'commit_count': row['commits']} for row in days],
+        }
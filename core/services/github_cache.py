@@ -0,0 +1,93 @@
+"""
+GitHub Response Cache
+Stores ETag/Last-Modified validators and bodies for conditional requests
+"""
+import hashlib
+import json
+from typing import Any, Dict
+from django.conf import settings
+from django.core.cache import caches
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def token_fingerprint(github_token: str) -> str:
+    """Stable, non-reversible identity for a GitHub token (never store the token itself)"""
+    return hashlib.sha256((github_token or '').encode()).hexdigest()[:16]
+
+
+class ETagCache:
+    """
+    Conditional-request store shared by all workers through the Django cache
+
+    Entries are keyed by URL, query parameters and token identity, so two
+    users never see each other's private payloads.
+    """
+
+    KEY_PREFIX = 'github:etag'
+    HITS_KEY = 'github:etag:stats:hits'
+    MISSES_KEY = 'github:etag:stats:misses'
+
+    def __init__(self, cache_alias: str = 'default', ttl: int = None):
+        self.cache = caches[cache_alias]
+        self.ttl = ttl if ttl is not None else getattr(settings, 'GITHUB_ETAG_CACHE_TTL', 7 * 24 * 3600)
+
+    def make_key(self, url: str, params: Dict = None, github_token: str = None) -> str:
+        """Build the cache key for a request"""
+        raw = json.dumps([url, sorted((params or {}).items()), token_fingerprint(github_token)], default=str)
+        return f"{self.KEY_PREFIX}:{hashlib.sha256(raw.encode()).hexdigest()}"
+
+    def get(self, key: str) -> Dict | None:
+        """
+        Look up a cached response
+
+        Returns:
+            Dict with etag, last_modified, body and next_url, or None
+        """
+        try:
+            return self.cache.get(key)
+        except Exception as e:
+            logger.warning(f"ETag cache unavailable: {str(e)}")
+            return None
+
+    def set(self, key: str, etag: str | None, last_modified: str | None, body: Any, next_url: str | None):
+        """Store a response body along with its validators"""
+        if not etag and not last_modified:
+            return
+
+        try:
+            self.cache.set(key, {
+                'etag': etag,
+                'last_modified': last_modified,
+                'body': body,
+                'next_url': next_url,
+            }, self.ttl)
+        except Exception as e:
+            logger.warning(f"ETag cache unavailable: {str(e)}")
+
+    def record_hit(self):
+        self._incr(self.HITS_KEY)
+
+    def record_miss(self):
+        self._incr(self.MISSES_KEY)
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters accumulated across all workers"""
+        try:
+            counters = self.cache.get_many([self.HITS_KEY, self.MISSES_KEY])
+        except Exception as e:
+            logger.warning(f"ETag cache unavailable: {str(e)}")
+            counters = {}
+
+        return {
+            'hits': counters.get(self.HITS_KEY, 0),
+            'misses': counters.get(self.MISSES_KEY, 0),
+        }
+
+    def _incr(self, key: str):
+        try:
+            self.cache.add(key, 0, None)
+            self.cache.incr(key)
+        except Exception as e:
+            logger.warning(f"ETag cache unavailable: {str(e)}")
@@ -0,0 +1,184 @@
+"""
+GitHub GraphQL Integration Service
+Fetches commit history for many repositories per request
+"""
+import requests
+from datetime import datetime, timedelta
+from typing import Any, List, Dict, Set, Tuple
+from django.conf import settings
+from core.services.commit_filter import NoiseFilter
+from core.services.github_service import GitHubService
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class GitHubGraphQLService(GitHubService):
+    """
+    GitHub service backend that batches commit history through GraphQL
+
+    One query asks for the default-branch history of up to
+    GITHUB_GRAPHQL_BATCH_SIZE repositories, so the number of requests
+    depends on how many repositories are watched divided by the batch size
+    rather than on the repository count itself. Diff stats come back inline.
+    """
+
+    HISTORY_FIELDS = """
+        defaultBranchRef {
+            target {
+                ... on Commit {
+                    history(first: 100, since: $since, until: $until, after: $cursor%(i)d) {
+                        pageInfo { hasNextPage endCursor }
+                        nodes {
+                            oid
+                            message
+                            url
+                            additions
+                            deletions
+                            changedFilesIfAvailable
+                            author { name email date }
+                        }
+                    }
+                }
+            }
+        }
+    """
+
+    def __init__(self, github_token: str, noise_filter: NoiseFilter = None, interactive: bool = False):
+        super().__init__(github_token, noise_filter, interactive)
+        self.graphql_url = f"{self.base_url}/graphql"
+        self.batch_size = getattr(settings, 'GITHUB_GRAPHQL_BATCH_SIZE', 20)
+
+    def get_commits_for_repos(
+        self,
+        repos: List[str],
+        since: datetime = None
+    ) -> Tuple[Dict[str, List[Dict]], Set[str]]:
+        """
+        Fetch a day of commits for several repositories
+
+        Repositories with more than one page of history are carried over to
+        the next query with their cursor until every history is exhausted.
+
+        Args:
+            repos: Repositories in format 'owner/repo'
+            since: Datetime to fetch commits from (default: today at 00:00)
+
+        Returns:
+            Tuple of (dict mapping each repository to its normalized commits,
+            set of repositories whose history was read to the end without
+            an error)
+        """
+        if since is None:
+            since = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+
+        until = since + timedelta(days=1)
+
+        results = {repo: [] for repo in repos}
+        complete = set()
+        pending = {repo: None for repo in repos}  # repo -> history cursor
+
+        while pending:
+            batch = list(pending.items())[:self.batch_size]
+
+            try:
+                data = self._query_history(batch, since, until)
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Error fetching commit history for {len(batch)} repos: {str(e)}")
+                for repo, _ in batch:
+                    del pending[repo]
+                continue
+
+            for i, (repo, _) in enumerate(batch):
+                history = self._extract_history(data.get(f"r{i}"))
+
+                if history is None:
+                    del pending[repo]
+                    continue
+
+                for node in history['nodes']:
+                    normalized = self._normalize_graphql_commit(node, repo)
+                    if normalized:  # Only include non-noise commits
+                        results[repo].append(normalized)
+
+                if history['pageInfo']['hasNextPage']:
+                    pending[repo] = history['pageInfo']['endCursor']
+                else:
+                    complete.add(repo)
+                    del pending[repo]
+
+        logger.info(f"Fetched {sum(len(c) for c in results.values())} commits from {len(repos)} repos")
+        return results, complete
+
+    def _query_history(self, batch: List[tuple], since: datetime, until: datetime) -> Dict:
+        """Run one batched history query; aliases r0..rN follow the batch order"""
+        declarations = ['$since: GitTimestamp!', '$until: GitTimestamp!']
+        selections = []
+        variables = {'since': since.isoformat(), 'until': until.isoformat()}
+
+        for i, (repo, cursor) in enumerate(batch):
+            owner, name = repo.split('/', 1)
+            declarations += [f"$owner{i}: String!", f"$name{i}: String!", f"$cursor{i}: String"]
+            selections.append(
+                f"r{i}: repository(owner: $owner{i}, name: $name{i}) {{{self.HISTORY_FIELDS % {'i': i}}}}"
+            )
+            variables.update({f"owner{i}": owner, f"name{i}": name, f"cursor{i}": cursor})
+
+        query = f"query({', '.join(declarations)}) {{ {' '.join(selections)} }}"
+        return self._graphql(query, variables)
+
+    def _graphql(self, query: str, variables: Dict) -> Dict[str, Any]:
+        """
+        Send a GraphQL query
+
+        Returns:
+            The `data` object; per-repository errors (e.g. no access) are
+            logged and leave that alias null
+
+        Raises:
+            requests.exceptions.RequestException: On network or HTTP errors
+        """
+        response = self._request('POST', self.graphql_url, json={'query': query, 'variables': variables})
+        response.raise_for_status()
+        body = response.json()
+
+        for error in body.get('errors') or []:
+            logger.warning(f"GraphQL error: {error.get('message')}")
+
+        return body.get('data') or {}
+
+    def _extract_history(self, repository: Dict | None) -> Dict | None:
+        """Return the history connection of a repository result, if any"""
+        try:
+            return repository['defaultBranchRef']['target']['history']
+        except (KeyError, TypeError):
+            return None
+
+    def _normalize_graphql_commit(self, node: Dict, repo: str) -> Dict | None:
+        """
+        Normalize a GraphQL commit node into the same shape as _normalize_commit
+
+        Args:
+            node: Commit node from the history connection
+            repo: Repository name
+
+        Returns:
+            Normalized commit dict or None if it's a noise commit
+        """
+        try:
+            return self._build_commit(
+                repo,
+                sha=node['oid'],
+                message=node['message'],
+                author_name=node['author']['name'],
+                author_email=node['author']['email'],
+                date=node['author']['date'],
+                url=node['url'],
+                files_changed=node.get('changedFilesIfAvailable') or 0,
+                additions=node.get('additions') or 0,
+                deletions=node.get('deletions') or 0,
+                stats_fetched=True,
+            )
+        except (KeyError, TypeError) as e:
+            logger.warning(f"Error normalizing commit: {str(e)}")
+            return None
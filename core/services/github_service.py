@@ -2,41 +2,124 @@
 GitHub API Integration Service
 Handles fetching commits from GitHub repositories
 """
+import os
+import random
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timedelta
-from typing import List, Dict
+from typing import Any, List, Dict, Iterator, Set, Tuple
 from django.conf import settings
+from django.core.cache import cache
+from django.utils.dateparse import parse_datetime
+from core.services.commit_filter import NoiseFilter
+from core.services.github_cache import ETagCache, token_fingerprint
+from core.services.rate_limiter import GitHubRateLimiter, RateLimitExceeded
 import logging
 
 logger = logging.getLogger(__name__)
 
+# GitHub never returns more than this many events for a user
+EVENTS_API_MAX = 300
+
+_session = None
+_session_pid = None
+_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """
+    Return the per-process pooled HTTP session
+    
+    Keep-alive connections to api.github.com are reused by every
+    GitHubService instance, so only the first request pays the TCP+TLS
+    handshake. A new session is built after fork (e.g. in Celery children).
+    """
+    global _session, _session_pid
+
+    if _session is None or _session_pid != os.getpid():
+        with _session_lock:
+            if _session is None or _session_pid != os.getpid():
+                pool_size = getattr(settings, 'GITHUB_HTTP_POOL_SIZE', 10)
+                adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+                session = requests.Session()
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                _session, _session_pid = session, os.getpid()
+
+    return _session
+
 
 class GitHubService:
     """Service to interact with GitHub API"""
 
-    def __init__(self, github_token: str):
+    def __init__(self, github_token: str, noise_filter: NoiseFilter = None, interactive: bool = False):
+        """
+        Args:
+            github_token: OAuth token of the user
+            noise_filter: Filter for noise commits (default: the global words)
+            interactive: Requests serve a user waiting on an API call and may
+                use the GITHUB_RATE_LIMIT_RESERVE part of the budget
+        """
         self.github_token = github_token
+        self.interactive = interactive
+        self.noise_filter = noise_filter or NoiseFilter.from_settings()
         self.base_url = settings.GITHUB_API_BASE
         self.headers = {
             'Authorization': f'token {github_token}',
             'Accept': 'application/vnd.github.v3+json'
         }
+        self.etag_cache = ETagCache()
+        self.session = get_http_session()
+        self.rate_limiter = GitHubRateLimiter()
 
-    def get_daily_commits(self, repo: str, since: datetime = None) -> List[Dict]:
+    def get_daily_commits(
+        self,
+        repo: str,
+        since: datetime = None,
+        until: datetime = None,
+        raise_errors: bool = False
+    ) -> List[Dict]:
         """
         Fetch commits from a repository for today (or specified date)
         
         Args:
             repo: Repository in format 'owner/repo'
             since: Datetime to fetch commits from (default: today at 00:00)
+            until: End of the window (default: 24h after since)
+            raise_errors: Raise on request errors instead of returning what
+                was fetched so far
             
         Returns:
             List of commit dictionaries with relevant metadata
         """
+        return list(self.iter_daily_commits(repo, since=since, until=until, raise_errors=raise_errors))
+
+    def iter_daily_commits(
+        self,
+        repo: str,
+        since: datetime = None,
+        until: datetime = None,
+        raise_errors: bool = False
+    ) -> Iterator[Dict]:
+        """
+        Stream normalized commits for a day, following pagination
+        
+        Args:
+            repo: Repository in format 'owner/repo'
+            since: Datetime to fetch commits from (default: today at 00:00)
+            until: End of the window (default: 24h after since)
+            raise_errors: Raise on request errors instead of ending the stream
+            
+        Yields:
+            Normalized commit dictionaries, one page at a time
+        """
         if since is None:
             since = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
         
-        until = since + timedelta(days=1)
+        if until is None:
+            until = since + timedelta(days=1)
         
         url = f"{self.base_url}/repos/{repo}/commits"
         params = {
@@ -45,24 +128,401 @@ class GitHubService:
             'per_page': 100,
         }
         
+        fetched = 0
+        pages = self._paginate(url, params, description=f"commits from {repo}", raise_errors=raise_errors)
+        for commit in pages:
+            normalized = self._normalize_commit(commit, repo)
+            if normalized:  # Only include non-noise commits
+                fetched += 1
+                yield normalized
+        
+        logger.info(f"Fetched {fetched} commits from {repo}")
+
+    def iter_commit_pages(
+        self,
+        repo: str,
+        since: datetime,
+        until: datetime,
+        page_url: str = None
+    ) -> Iterator[Tuple[List[Dict], str | None]]:
+        """
+        Stream a window's normalized commits page by page, with each next page URL
+        
+        Lets a long fetch record where it got to and later continue from
+        that page, rather than from a commit date: history is listed in
+        topological order, so dates are not monotonic across pages.
+        
+        Args:
+            repo: Repository in format 'owner/repo'
+            since: Start of the window
+            until: End of the window
+            page_url: Page to continue from, as yielded by an earlier call
+                (default: the first page)
+            
+        Yields:
+            Tuple of (non-noise commits of the page, next page URL or None)
+            
+        Raises:
+            requests.exceptions.RequestException: On request errors
+        """
+        url, params = page_url, None
+        if not page_url:
+            url = f"{self.base_url}/repos/{repo}/commits"
+            params = {
+                'since': since.isoformat(),
+                'until': until.isoformat(),
+                'per_page': 100,
+            }
+        
+        pages = self._paginate_pages(url, params, description=f"commits from {repo}", raise_errors=True)
+        for page, next_url in pages:
+            normalized = (self._normalize_commit(commit, repo) for commit in page)
+            yield [commit for commit in normalized if commit], next_url
+
+    def _paginate(
+        self,
+        url: str,
+        params: Dict = None,
+        description: str = None,
+        raise_errors: bool = False
+    ) -> Iterator[Dict]:
+        """
+        Yield items from a list endpoint, following `Link: rel="next"` headers
+        
+        Args:
+            url: First page URL
+            params: Query parameters for the first page (later pages carry
+                them in the next link)
+            description: What is being fetched, for error logging
+            raise_errors: Re-raise request errors after logging them, so
+                callers can tell a partial listing from a complete one
+            
+        Yields:
+            Raw items from each page
+        """
+        for page, _ in self._paginate_pages(url, params, description, raise_errors):
+            yield from page
+
+    def _paginate_pages(
+        self,
+        url: str,
+        params: Dict = None,
+        description: str = None,
+        raise_errors: bool = False
+    ) -> Iterator[Tuple[List[Any], str | None]]:
+        """
+        Yield each page of a list endpoint with the URL of the page after it
+        
+        Same arguments as _paginate.
+        """
+        while url:
+            try:
+                page, next_url = self._get_json(url, params)
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Error fetching {description or url}: {str(e)}")
+                if raise_errors:
+                    raise
+                return
+            
+            yield page, next_url
+            
+            url = next_url
+            params = None
+
+    def _get_json(self, url: str, params: Dict = None) -> Tuple[Any, str | None]:
+        """
+        GET a JSON resource, revalidating against the shared ETag cache
+        
+        A 304 answer does not count against the rate limit, so cached bodies
+        are sent with If-None-Match/If-Modified-Since and reused when unchanged.
+        
+        Args:
+            url: Resource URL
+            params: Query parameters
+            
+        Returns:
+            Tuple of (decoded JSON body, next page URL or None)
+            
+        Raises:
+            requests.exceptions.RequestException: On network or HTTP errors
+        """
+        cache_key = self.etag_cache.make_key(url, params, self.github_token)
+        cached = self.etag_cache.get(cache_key)
+        
+        headers = dict(self.headers)
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        
+        response = self._request('GET', url, headers=headers, params=params)
+        
+        if response.status_code == 304 and cached:
+            self.etag_cache.record_hit()
+            return cached['body'], cached['next_url']
+        
+        response.raise_for_status()
+        body = response.json()
+        next_url = response.links.get('next', {}).get('url')
+        
+        self.etag_cache.record_miss()
+        self.etag_cache.set(
+            cache_key,
+            response.headers.get('ETag'),
+            response.headers.get('Last-Modified'),
+            body,
+            next_url,
+        )
+        return body, next_url
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict = None,
+        params: Dict = None,
+        json: Dict = None,
+        timeout: int = 10
+    ) -> requests.Response:
+        """
+        Send a request over the pooled session, retrying transient failures
+        
+        Connection errors, 5xx and secondary-rate-limit responses are retried
+        up to GITHUB_HTTP_MAX_RETRIES times with jittered exponential backoff
+        (or the server's Retry-After, when given). Every attempt draws from
+        the token's shared rate-limit budget first; a 304 gives it back, as
+        GitHub does not count revalidations.
+        
+        Returns:
+            The final response; HTTP errors are left to the caller
+            
+        Raises:
+            requests.exceptions.RequestException: When the last attempt fails
+                at the network level
+            RateLimitExceeded: When the token's primary rate limit is used up
+        """
+        max_retries = getattr(settings, 'GITHUB_HTTP_MAX_RETRIES', 3)
+        resource = 'graphql' if url.endswith('/graphql') else 'core'
+        
+        for attempt in range(max_retries + 1):
+            self.rate_limiter.acquire(self.github_token, resource, self.interactive)
+            try:
+                response = self.session.request(
+                    method, url,
+                    headers=headers or self.headers,
+                    params=params,
+                    json=json,
+                    timeout=timeout,
+                )
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if attempt == max_retries:
+                    raise
+                delay = self._backoff_delay(attempt)
+                logger.warning(f"{method} {url} failed ({str(e)}), retrying in {delay:.1f}s")
+            else:
+                self.rate_limiter.update_from_headers(self.github_token, response.headers)
+                if response.status_code == 304:
+                    self.rate_limiter.release(self.github_token, resource)
+                if response.status_code == 401:
+                    cache.delete(self._token_cache_key())
+                self._check_rate_limit(response)
+                if attempt == max_retries or not self._is_retryable(response):
+                    return response
+                delay = self._backoff_delay(attempt, response)
+                logger.warning(f"{method} {url} returned {response.status_code}, retrying in {delay:.1f}s")
+            
+            time.sleep(delay)
+
+    def _check_rate_limit(self, response: requests.Response):
+        """Raise if a response reports the primary rate limit as exhausted"""
+        if response.status_code in (403, 429) and response.headers.get('X-RateLimit-Remaining') == '0':
+            reset = int(response.headers.get('X-RateLimit-Reset', 0))
+            raise RateLimitExceeded(reset - time.time())
+
+    def _is_retryable(self, response: requests.Response) -> bool:
+        """Check if a response is a transient server error or secondary rate limit"""
+        if response.status_code >= 500 or response.status_code == 429:
+            return True
+        
+        if response.status_code == 403:
+            return 'Retry-After' in response.headers or 'secondary rate limit' in response.text.lower()
+        
+        return False
+
+    def _backoff_delay(self, attempt: int, response: requests.Response = None) -> float:
+        """Seconds to wait before the next attempt (full jitter, capped)"""
+        max_delay = getattr(settings, 'GITHUB_HTTP_BACKOFF_MAX', 60)
+        
+        if response is not None and response.headers.get('Retry-After', '').isdigit():
+            return min(float(response.headers['Retry-After']), max_delay)
+        
+        base = getattr(settings, 'GITHUB_HTTP_BACKOFF_BASE', 1.0)
+        return random.uniform(0, min(max_delay, base * 2 ** attempt))
+
+    def get_push_event_commits(
+        self,
+        username: str,
+        repos: Dict[str, str],
+        since: datetime
+    ) -> Tuple[Dict[str, List[Dict]], Set[str]]:
+        """
+        Find a day's commits across all repositories from the user's events
+        
+        Only pushes to each repository's default branch count, as with push
+        webhooks. PushEvent payloads list at most 20 commits and the feed
+        itself is capped, so repositories whose pushes could not be read in
+        full, or whose default branch is not known yet, are reported back
+        for a per-repository fetch. Commits are dated by the push time,
+        since payloads carry no commit timestamps. If the feed cannot be
+        read to the end, every repository is reported back.
+        
+        Args:
+            username: GitHub username
+            repos: Default branch of each repository to collect (owner/repo format)
+            since: Start of the 24h window
+            
+        Returns:
+            Tuple of (dict mapping each repository read in full to its
+            normalized commits, set of repositories that need a
+            per-repository fetch)
+        """
+        until = since + timedelta(days=1)
+        url = f"{self.base_url}/users/{username}/events"
+        
+        commits = {repo: [] for repo in repos}
+        truncated = {repo for repo, default_branch in repos.items() if not default_branch}
+        seen_events = 0
+        reached_start = False
+        
+        events = self._paginate(url, {'per_page': 100}, description=f"events for {username}", raise_errors=True)
         try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
-            response.raise_for_status()
-            commits = response.json()
+            for event in events:
+                seen_events += 1
+                created_at = parse_datetime(event['created_at'])
+                
+                # Events are newest first
+                if created_at < since:
+                    reached_start = True
+                    break
+                
+                repo = event.get('repo', {}).get('name')
+                if event.get('type') != 'PushEvent' or repo not in repos or created_at >= until:
+                    continue
+                
+                payload = event.get('payload', {})
+                if payload.get('ref') != f"refs/heads/{repos[repo]}":
+                    continue
+                
+                push_commits = payload.get('commits')
+                if push_commits is None or payload.get('size', len(push_commits)) > len(push_commits):
+                    truncated.add(repo)
+                    continue
+                
+                for push_commit in push_commits:
+                    normalized = self._normalize_push_commit(push_commit, repo, event['created_at'])
+                    if normalized:  # Only include non-noise commits
+                        commits[repo].append(normalized)
+        except requests.exceptions.RequestException:
+            # Already logged; a partial feed says nothing about what it did not reach
+            return {}, set(repos)
+
+        if not reached_start and seen_events >= EVENTS_API_MAX:
+            # The feed ran out before the window start; nothing here is complete
+            logger.info(f"Event feed for {username} does not reach {since.isoformat()}")
+            truncated = set(repos)
+        
+        return {repo: found for repo, found in commits.items() if repo not in truncated}, truncated
+
+    def normalize_push_commits(self, push_commits: List[Dict], repo: str, pushed_at: str) -> List[Dict]:
+        """
+        Normalize the commits of a push payload, dropping noise
+        
+        Args:
+            push_commits: `commits` list of a PushEvent or push webhook
+            repo: Repository name
+            pushed_at: Push time (ISO 8601)
+            
+        Returns:
+            List of normalized commit dicts
+        """
+        normalized = (self._normalize_push_commit(commit, repo, pushed_at) for commit in push_commits)
+        return [commit for commit in normalized if commit]
+
+    def _normalize_push_commit(self, push_commit: Dict, repo: str, pushed_at: str) -> Dict | None:
+        """
+        Normalize a commit from a push payload (events API or push webhook)
+        
+        Args:
+            push_commit: Commit entry of the push payload
+            repo: Repository name
+            pushed_at: Push time, used when the entry has no timestamp
             
-            # Filter and normalize commits
-            normalized_commits = []
-            for commit in commits:
-                normalized = self._normalize_commit(commit, repo)
-                if normalized:  # Only include non-noise commits
-                    normalized_commits.append(normalized)
+        Returns:
+            Normalized commit dict or None if it's a noise commit
+        """
+        try:
+            sha = push_commit.get('id') or push_commit['sha']
             
-            logger.info(f"Fetched {len(normalized_commits)} commits from {repo}")
-            return normalized_commits
+            return self._build_commit(
+                repo,
+                sha=sha,
+                message=push_commit['message'],
+                author_name=push_commit['author']['name'],
+                author_email=push_commit['author']['email'],
+                date=push_commit.get('timestamp') or pushed_at,
+                url=f"https://github.com/{repo}/commit/{sha}",
+            )
+        except (KeyError, TypeError) as e:
+            logger.warning(f"Error normalizing push commit: {str(e)}")
+            return None
+
+    def get_commit_stats(self, repo: str, sha: str) -> Dict | None:
+        """
+        Get diff stats for a single commit
+        
+        Commits are immutable, so results are cached by SHA with no expiry
+        and each commit is only ever requested once. A commit that can never
+        be read (4xx other than 401/403/429, e.g. a deleted repository or a
+        rewritten history) gets zero stats, so it is not requested again.
+        
+        Args:
+            repo: Repository in format 'owner/repo'
+            sha: Commit SHA
             
+        Returns:
+            Dict with files_changed, additions and deletions, or None on a
+            transient error
+        """
+        cache_key = f"github:commit-stats:{repo}:{sha}"
+        stats = cache.get(cache_key)
+        if stats is not None:
+            return stats
+        
+        url = f"{self.base_url}/repos/{repo}/commits/{sha}"
+        
+        try:
+            response = self._request('GET', url)
+            response.raise_for_status()
+            commit = response.json()
+        except requests.exceptions.HTTPError as e:
+            status_code = e.response.status_code
+            if 400 <= status_code < 500 and status_code not in (401, 403, 429):
+                logger.warning(f"Stats for {repo}@{sha[:8]} unavailable ({status_code}), recording none")
+                return {'files_changed': 0, 'additions': 0, 'deletions': 0}
+            logger.error(f"Error fetching stats for {repo}@{sha[:8]}: {str(e)}")
+            return None
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error fetching commits from {repo}: {str(e)}")
-            return []
+            logger.error(f"Error fetching stats for {repo}@{sha[:8]}: {str(e)}")
+            return None
+        
+        stats = {
+            'files_changed': len(commit.get('files', [])),
+            'additions': commit.get('stats', {}).get('additions', 0),
+            'deletions': commit.get('stats', {}).get('deletions', 0),
+        }
+        cache.set(cache_key, stats, None)
+        return stats
 
     def _normalize_commit(self, github_commit: Dict, repo: str) -> Dict | None:
         """
@@ -76,81 +536,141 @@ class GitHubService:
             Normalized commit dict or None if it's a noise commit
         """
         try:
-            message = github_commit['commit']['message']
-            
-            # Filter noise commits
-            if self._is_noise_commit(message):
-                return None
-            
-            return {
-                'sha': github_commit['sha'],
-                'author': github_commit['commit']['author']['name'],
-                'email': github_commit['commit']['author']['email'],
-                'message': message.split('\n')[0],  # First line only
-                'full_message': message,
-                'date': github_commit['commit']['author']['date'],
-                'url': github_commit['html_url'],
-                'repository': repo,
-                'files_changed': len(github_commit.get('files', [])),
-                'additions': sum(f.get('additions', 0) for f in github_commit.get('files', [])),
-                'deletions': sum(f.get('deletions', 0) for f in github_commit.get('files', [])),
-            }
+            files = github_commit.get('files', [])
+            
+            return self._build_commit(
+                repo,
+                sha=github_commit['sha'],
+                message=github_commit['commit']['message'],
+                author_name=github_commit['commit']['author']['name'],
+                author_email=github_commit['commit']['author']['email'],
+                date=github_commit['commit']['author']['date'],
+                url=github_commit['html_url'],
+                files_changed=len(files),
+                additions=sum(f.get('additions', 0) for f in files),
+                deletions=sum(f.get('deletions', 0) for f in files),
+                stats_fetched='files' in github_commit,
+            )
         except (KeyError, IndexError) as e:
             logger.warning(f"Error normalizing commit: {str(e)}")
             return None
 
-    def _is_noise_commit(self, message: str) -> bool:
+    def _build_commit(
+        self,
+        repo: str,
+        sha: str,
+        message: str,
+        author_name: str,
+        author_email: str,
+        date: str,
+        url: str,
+        files_changed: int = 0,
+        additions: int = 0,
+        deletions: int = 0,
+        stats_fetched: bool = False
+    ) -> Dict | None:
+        """
+        Build the normalized commit dict shared by every ingestion source
+        
+        stats_fetched tells whether the diff stats are real or still need
+        to be filled in by the enrichment stage.
+        
+        Returns:
+            Normalized commit dict or None if it's a noise commit
+        """
+        # Filter noise commits
+        if self._is_noise_commit(message, repo):
+            return None
+        
+        return {
+            'sha': sha,
+            'author': author_name,
+            'email': author_email,
+            'message': message.split('\n')[0],  # First line only
+            'full_message': message,
+            'date': date,
+            'url': url,
+            'repository': repo,
+            'files_changed': files_changed,
+            'additions': additions,
+            'deletions': deletions,
+            'stats_fetched': stats_fetched,
+        }
+
+    def _is_noise_commit(self, message: str, repo: str = None) -> bool:
         """
         Check if a commit message is noise (should be filtered)
         
         Args:
             message: Commit message
+            repo: Repository name, for per-repository rules
             
         Returns:
             True if commit is noise, False otherwise
         """
-        message_lower = message.lower()
-        noise_patterns = settings.GITHUB_COMMIT_FILTER_WORDS
-        
-        return any(pattern.lower() in message_lower for pattern in noise_patterns)
+        return self.noise_filter.is_noise(message, repo)
 
-    def get_user_repos(self, username: str) -> List[str]:
+    def get_user_repos(self, username: str, raise_errors: bool = False) -> List[Dict]:
         """
-        Get all repositories for a GitHub user
+        Get all repositories for a GitHub user, following pagination
+        
+        Listed through the authenticated /user/repos endpoint, so private
+        repositories the user owns or collaborates on are included; the
+        public /users/{username}/repos listing leaves them out.
         
         Args:
-            username: GitHub username
+            username: GitHub username (the token's owner)
+            raise_errors: Raise on request errors instead of returning a
+                partial listing
             
         Returns:
-            List of repository names (owner/repo format)
+            List of dicts with the repository name (owner/repo format), its
+            last push time (pushed_at, datetime or None) and default branch
         """
-        url = f"{self.base_url}/users/{username}/repos"
-        params = {'per_page': 100, 'type': 'owner,collaborator'}
+        url = f"{self.base_url}/user/repos"
+        params = {'per_page': 100, 'affiliation': 'owner,collaborator'}
         
-        try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
-            response.raise_for_status()
-            repos = response.json()
-            
-            return [f"{repo['owner']['login']}/{repo['name']}" for repo in repos]
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error fetching repos for {username}: {str(e)}")
-            return []
+        return [
+            {
+                'name': f"{repo['owner']['login']}/{repo['name']}",
+                'pushed_at': parse_datetime(repo['pushed_at']) if repo.get('pushed_at') else None,
+                'default_branch': repo.get('default_branch') or '',
+            }
+            for repo in self._paginate(url, params, description=f"repos for {username}", raise_errors=raise_errors)
+        ]
 
-    def verify_token(self) -> bool:
+    def verify_token(self, use_cache: bool = True) -> bool:
         """
         Verify if GitHub token is valid
         
+        The result is cached per token for GITHUB_TOKEN_VERIFY_TTL seconds
+        and dropped as soon as any request with the token gets a 401.
+        
+        Args:
+            use_cache: Set to False to force a fresh check
+            
         Returns:
             True if token is valid, False otherwise
         """
+        if use_cache:
+            is_valid = cache.get(self._token_cache_key())
+            if is_valid is not None:
+                return is_valid
+        
         url = f"{self.base_url}/user"
         
         try:
-            print("I got here")
-            response = requests.get(url, headers=self.headers, timeout=50)
-            print("JSON Content:", response.json())
-            return response.status_code == 200
+            response = self._request('GET', url)
         except requests.exceptions.RequestException:
             return False
+        
+        is_valid = response.status_code == 200
+        
+        # Only definitive answers are cached, never transient failures
+        if response.status_code in (200, 401):
+            cache.set(self._token_cache_key(), is_valid, getattr(settings, 'GITHUB_TOKEN_VERIFY_TTL', 600))
+        
+        return is_valid
+
+    def _token_cache_key(self) -> str:
+        return f"github:token-valid:{token_fingerprint(self.github_token)}"
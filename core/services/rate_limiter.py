@@ -0,0 +1,184 @@
+"""
+GitHub Rate Limiter
+Token bucket per OAuth token, shared by all workers through Redis
+"""
+import time
+from typing import Dict, Mapping
+import redis
+from django.conf import settings
+from core.services.github_cache import token_fingerprint
+import logging
+
+logger = logging.getLogger(__name__)
+
+_redis_client = None
+
+
+def get_redis_client() -> redis.Redis:
+    """Return the shared Redis client (connections are pooled per process)"""
+    global _redis_client
+
+    if _redis_client is None:
+        _redis_client = redis.Redis.from_url(settings.REDIS_URL, socket_timeout=5)
+
+    return _redis_client
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a token has no budget left and the wait is too long to block on"""
+
+    def __init__(self, retry_after: int, message: str = None):
+        self.retry_after = max(int(retry_after), 1)
+        super().__init__(message or f"GitHub rate limit exhausted, retry in {self.retry_after}s")
+
+
+class GitHubRateLimiter:
+    """
+    Token bucket tracking each token's GitHub budget
+
+    The bucket is refilled from X-RateLimit-* response headers and drained
+    by one token per request, atomically in Redis, so all Celery workers
+    using the same OAuth token see a single budget. Each GitHub resource
+    (core, graphql, ...) has its own bucket, like the API itself. Requests
+    GitHub does not charge for (304 revalidations) hand their token back,
+    and the last GITHUB_RATE_LIMIT_RESERVE tokens are only given out to
+    interactive requests.
+    """
+
+    KEY_PREFIX = 'github:ratelimit'
+
+    # Take one token unless the bucket is down to the reserve; otherwise
+    # return the seconds until the window resets. Unknown budgets are allowed.
+    ACQUIRE_SCRIPT = """
+    local remaining = tonumber(redis.call('HGET', KEYS[1], 'remaining'))
+    local reset = tonumber(redis.call('HGET', KEYS[1], 'reset'))
+    local now = tonumber(ARGV[1])
+    local reserve = tonumber(ARGV[2])
+    if remaining == nil or reset == nil then
+        return 0
+    end
+    if reset <= now then
+        redis.call('DEL', KEYS[1])
+        return 0
+    end
+    if remaining > reserve then
+        redis.call('HINCRBY', KEYS[1], 'remaining', -1)
+        return 0
+    end
+    return reset - now
+    """
+
+    # Give back a token taken for a request that turned out to be free,
+    # never beyond the limit of the current window
+    RELEASE_SCRIPT = """
+    local remaining = tonumber(redis.call('HGET', KEYS[1], 'remaining'))
+    local limit = tonumber(redis.call('HGET', KEYS[1], 'limit'))
+    if remaining == nil or limit == nil or remaining >= limit then
+        return 0
+    end
+    redis.call('HINCRBY', KEYS[1], 'remaining', 1)
+    return 1
+    """
+
+    # Responses can arrive out of order, so within one window only ever
+    # lower the remaining count; a new reset time starts a new window.
+    UPDATE_SCRIPT = """
+    local remaining = tonumber(ARGV[1])
+    local reset = tonumber(ARGV[2])
+    local current_reset = tonumber(redis.call('HGET', KEYS[1], 'reset'))
+    local current_remaining = tonumber(redis.call('HGET', KEYS[1], 'remaining'))
+    if current_reset == reset and current_remaining ~= nil and current_remaining < remaining then
+        remaining = current_remaining
+    end
+    redis.call('HSET', KEYS[1], 'remaining', remaining, 'reset', reset, 'limit', ARGV[3])
+    redis.call('EXPIREAT', KEYS[1], reset + 60)
+    return remaining
+    """
+
+    def __init__(self, redis_client: redis.Redis = None):
+        self.redis = redis_client or get_redis_client()
+        self.reserve = getattr(settings, 'GITHUB_RATE_LIMIT_RESERVE', 50)
+        self.max_wait = getattr(settings, 'GITHUB_RATE_LIMIT_MAX_WAIT', 30)
+
+    def _key(self, github_token: str, resource: str) -> str:
+        return f"{self.KEY_PREFIX}:{token_fingerprint(github_token)}:{resource}"
+
+    def acquire(self, github_token: str, resource: str = 'core', interactive: bool = False):
+        """
+        Take one request from the token's budget, waiting if needed
+        
+        Short waits (up to GITHUB_RATE_LIMIT_MAX_WAIT seconds) are slept
+        through; longer ones raise so the caller can reschedule.
+        
+        Args:
+            github_token: Token the request is made with
+            resource: GitHub rate-limit resource
+            interactive: The request serves a user waiting on an API call,
+                so it may dip into the reserve
+        
+        Raises:
+            RateLimitExceeded: If the budget resets too far in the future
+        """
+        while True:
+            try:
+                wait = int(self.redis.eval(
+                    self.ACQUIRE_SCRIPT, 1, self._key(github_token, resource),
+                    int(time.time()), 0 if interactive else self.reserve
+                ))
+            except redis.exceptions.RedisError as e:
+                logger.warning(f"Rate limiter unavailable, proceeding without it: {str(e)}")
+                return
+
+            if wait <= 0:
+                return
+
+            if wait > self.max_wait:
+                raise RateLimitExceeded(wait)
+
+            logger.info(f"GitHub {resource} budget exhausted, waiting {wait}s")
+            time.sleep(wait)
+
+    def release(self, github_token: str, resource: str = 'core'):
+        """Return the token taken for a request GitHub did not charge for"""
+        try:
+            self.redis.eval(self.RELEASE_SCRIPT, 1, self._key(github_token, resource))
+        except redis.exceptions.RedisError as e:
+            logger.warning(f"Rate limiter unavailable, token not returned: {str(e)}")
+
+    def update_from_headers(self, github_token: str, headers: Mapping[str, str]):
+        """Record the budget reported by a GitHub response"""
+        try:
+            remaining = int(headers['X-RateLimit-Remaining'])
+            reset = int(headers['X-RateLimit-Reset'])
+            limit = int(headers.get('X-RateLimit-Limit', remaining))
+        except (KeyError, ValueError):
+            return
+
+        resource = headers.get('X-RateLimit-Resource', 'core')
+
+        try:
+            self.redis.eval(
+                self.UPDATE_SCRIPT, 1, self._key(github_token, resource),
+                remaining, reset, limit
+            )
+        except redis.exceptions.RedisError as e:
+            logger.warning(f"Rate limiter unavailable, budget not recorded: {str(e)}")
+
+    def get_budget(self, github_token: str, resource: str = 'core') -> Dict | None:
+        """
+        Current budget for a token, for monitoring
+        
+        Returns:
+            Dict with remaining, limit and reset (epoch seconds), or None if
+            no response has been seen in the current window
+        """
+        try:
+            state = self.redis.hgetall(self._key(github_token, resource))
+        except redis.exceptions.RedisError as e:
+            logger.warning(f"Rate limiter unavailable: {str(e)}")
+            return None
+
+        if not state:
+            return None
+
+        return {key.decode(): int(value) for key, value in state.items()}
@@ -0,0 +1,93 @@
+"""
+Report Render Cache
+Reuses rendered reports for a commit set that was already rendered in this process
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Dict, Iterable
+from django.conf import settings
+from core.services.report_templates import TEMPLATE_VERSION
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(commit_shas: Iterable[str], developer_name: str, report_date: date) -> str:
+    """
+    Identity of a rendered report
+
+    Covers everything the output depends on: the commits (order-insensitive),
+    the developer, the date and the layout files.
+    """
+    raw = '\n'.join([TEMPLATE_VERSION, developer_name, report_date.isoformat(), *sorted(commit_shas)])
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+class RenderCache:
+    """
+    Least-recently-used store of rendered reports, local to the process
+
+    Entries expire REPORT_RENDER_CACHE_TTL seconds after they were stored,
+    and the oldest are evicted beyond REPORT_RENDER_CACHE_SIZE entries.
+    Rendered pages are large and cheap to rebuild, so they are not worth a
+    round trip to the shared cache.
+    """
+
+    def __init__(self, max_size: int = None, ttl: int = None):
+        self.max_size = max_size if max_size is not None else getattr(settings, 'REPORT_RENDER_CACHE_SIZE', 256)
+        self.ttl = ttl if ttl is not None else getattr(settings, 'REPORT_RENDER_CACHE_TTL', 3600)
+        self._entries = OrderedDict()  # key -> (expires_at, report_data)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Dict | None:
+        """Return the rendered report stored under key, if still fresh"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def set(self, key: str, report_data: Dict):
+        """Store a rendered report, evicting the least recently used beyond max_size"""
+        if self.max_size <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, report_data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop every entry and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict:
+        """Return this process's counters and hit rate"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._entries),
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+
+RENDER_CACHE = RenderCache()
@@ -0,0 +1,136 @@
+"""
+Report Builder Service
+Keeps each day's report up to date as commits are linked to a user
+"""
+from datetime import date
+from typing import Dict, List
+from django.db import transaction
+from django.db.models.functions import TruncDate
+from core.models import UserConfig, UserCommit, Report
+from core.services.daily_stats import DailyStatsService
+from core.services.render_cache import content_hash
+from core.services.report_generator import ReportGenerator
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ReportBuilder:
+    """Fold newly linked commits into the reports of their days"""
+
+    def __init__(self):
+        self.report_generator = ReportGenerator()
+        self.daily_stats = DailyStatsService()
+
+    def apply_pending(self, user_config: UserConfig) -> int:
+        """
+        Add every commit linked to a user since the last call to its day's report
+        
+        Links not yet folded into a report are the unprocessed ones. Each
+        affected day's report is created if needed, its state updated, and
+        its content re-rendered once, and the day's DailyRepoStats rows are
+        recomputed; days without new commits are untouched. Links to commits
+        the state already holds (stored again after cleanup) are only marked
+        processed.
+        
+        Args:
+            user_config: User configuration
+            
+        Returns:
+            Number of reports created or updated
+        """
+        days = (
+            UserCommit.objects.filter(user_config=user_config, is_processed=False)
+            .annotate(day=TruncDate('commit__commit_date'))
+            .values_list('day', flat=True)
+            .distinct()
+        )
+
+        updated = 0
+        for report_date in sorted(days):
+            if self._apply_day(user_config, report_date):
+                updated += 1
+
+        return updated
+
+    def _apply_day(self, user_config: UserConfig, report_date: date) -> bool:
+        """Fold one day's unprocessed links into its report, under a row lock"""
+        with transaction.atomic():
+            report, created = Report.objects.select_for_update().get_or_create(
+                user_config=user_config,
+                report_date=report_date,
+                defaults={'state': self.report_generator.empty_state(), 'status': 'draft'}
+            )
+
+            # Read after taking the lock, so concurrent runs never apply a link twice
+            links = list(
+                UserCommit.objects.filter(
+                    user_config=user_config,
+                    is_processed=False,
+                    commit__commit_date__date=report_date
+                ).order_by('commit__commit_date').values(
+                    'id',
+                    'commit__commit_sha',
+                    'commit__repo_name',
+                    'commit__message',
+                    'commit__category',
+                    'commit__display_message',
+                )
+            )
+
+            if not links:
+                return False
+
+            state = report.state or self.report_generator.empty_state()
+            changed = self.report_generator.add_to_state(state, self._as_commits(links))
+            UserCommit.objects.filter(id__in=[link['id'] for link in links]).update(is_processed=True)
+            if not changed:
+                return False
+
+            self._render(report, state, user_config)
+            self.daily_stats.refresh_day(user_config, report_date)
+
+        logger.info(
+            f"{'Created' if created else 'Updated'} report for {user_config.user.username} "
+            f"on {report_date} with {len(links)} commits"
+        )
+        return True
+
+    def _as_commits(self, links: List[Dict]) -> List[Dict]:
+        """Shape link rows like the commit dicts ReportGenerator takes"""
+        return [
+            {
+                'sha': link['commit__commit_sha'],
+                'repository': link['commit__repo_name'],
+                'message': link['commit__message'],
+                'category': link['commit__category'],
+                'display_message': link['commit__display_message'],
+            }
+            for link in links
+        ]
+
+    def _render(self, report: Report, state: Dict, user_config: UserConfig):
+        """
+        Re-render a report from its state and save it
+        
+        The content columns are only written when the content hash (the
+        state's commit shas, developer, date and template version) differs
+        from the stored one.
+        """
+        developer_name = user_config.user.get_full_name() or user_config.user.username
+        key = content_hash(state['shas'], developer_name, report.report_date)
+
+        report.state = state
+        if key == report.content_hash:
+            report.save(update_fields=['state'])
+            return
+
+        report_data = self.report_generator.render_state(state, developer_name, report.report_date, key)
+        report.content_html = report_data['html']
+        report.content_text = report_data['text']
+        report.content_hash = key
+        report.commit_count = report_data['commit_count']
+        report.repo_count = report_data['repo_count']
+        report.save(update_fields=[
+            'state', 'content_html', 'content_text', 'content_hash', 'commit_count', 'repo_count'
+        ])
@@ -2,103 +2,227 @@
 Report Generation Service
 Transforms raw commits into human-readable daily reports
 """
-from typing import List, Dict
+from typing import List, Dict, Tuple
 from datetime import datetime, date
-from collections import defaultdict
+from core.services.render_cache import RENDER_CACHE, content_hash
+from core.services.report_templates import HTML_REPORT, TEXT_REPORT
 import re
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def _compile_keywords(action_verbs: Dict[str, List[str]]) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+    """
+    Reduce each category to the keywords no other keyword of it contains
+    
+    A message containing 'fixed' also contains 'fix', so checking 'fix'
+    alone gives the same answer with fewer scans.
+    """
+    compiled = []
+    for category, keywords in action_verbs.items():
+        keywords = list(dict.fromkeys(keywords))
+        compiled.append((category, tuple(
+            keyword for keyword in keywords
+            if not any(other != keyword and other in keyword for other in keywords)
+        )))
+    return tuple(compiled)
+
+
+def _compile_prefixes(prefixes: List[str]) -> re.Pattern:
+    """
+    Match the run of prefixes removed one after another, in order
+    
+    Each prefix may be followed by the whitespace that stripping the
+    remainder would drop.
+    """
+    return re.compile(''.join(f"(?:{re.escape(prefix)}\\s*)?" for prefix in prefixes))
+
+
 class ReportGenerator:
     """Generate formatted reports from commits"""
 
-    def __init__(self):
-        self.action_verbs = {
-            'fix': ['fixed', 'fix', 'resolve', 'resolved', 'patch', 'bugfix'],
-            'feature': ['add', 'added', 'implement', 'implemented', 'create', 'created', 'feature'],
-            'refactor': ['refactor', 'refactored', 'restructure', 'reorganize', 'optimize', 'optimized'],
-            'improve': ['improve', 'improved', 'enhance', 'enhance', 'update', 'updated'],
-            'test': ['test', 'tests', 'add test', 'add tests'],
-            'docs': ['doc', 'docs', 'documentation', 'comment', 'readme'],
-        }
+    # Checked in order; the first category with a keyword in the message wins
+    action_verbs = {
+        'fix': ['fixed', 'fix', 'resolve', 'resolved', 'patch', 'bugfix'],
+        'feature': ['add', 'added', 'implement', 'implemented', 'create', 'created', 'feature'],
+        'refactor': ['refactor', 'refactored', 'restructure', 'reorganize', 'optimize', 'optimized'],
+        'improve': ['improve', 'improved', 'enhance', 'enhance', 'update', 'updated'],
+        'test': ['test', 'tests', 'add test', 'add tests'],
+        'docs': ['doc', 'docs', 'documentation', 'comment', 'readme'],
+    }
+
+    # Conventional commit prefixes, removed in order
+    prefixes = ['feat: ', 'fix: ', 'refactor: ', 'docs: ', 'test: ', 'chore: ', 'style: ']
+
+    # Report sections, in display order
+    category_order = ['fix', 'feature', 'refactor', 'improve', 'test', 'docs', 'general']
+    category_labels = {
+        'fix': '🐛 Bug Fixes',
+        'feature': '✨ Features',
+        'refactor': '♻️ Refactoring',
+        'improve': '⚡ Improvements',
+        'test': '🧪 Tests',
+        'docs': '📚 Documentation',
+        'general': '📝 Other Updates',
+    }
+
+    # Built once per process from the tables above
+    _category_keywords = _compile_keywords(action_verbs)
+    _prefix_pattern = _compile_prefixes(prefixes)
 
     def generate_report(self, commits: List[Dict], developer_name: str, report_date: date) -> Dict:
         """
         Generate a formatted report from commits
         
+        Output for a commit set rendered before in this process is reused
+        when every commit carries its sha.
+        
         Args:
             commits: List of normalized commits
             developer_name: Developer's name
             report_date: Date of the report
             
         Returns:
-            Dictionary with html and text versions of report
+            Dictionary with html and text versions of report, plus the
+            content_hash they were cached under (None without shas)
         """
-        # Group commits by repository
-        repo_groups = defaultdict(list)
-        for commit in commits:
-            repo_groups[commit['repository']].append(commit)
-
-        # Classify and enhance commits
-        categorized = self._categorize_commits(commits)
-
-        # Generate HTML report
-        html_content = self._generate_html_report(
-            developer_name,
-            report_date,
-            categorized,
-            repo_groups
-        )
-
-        # Generate text report
-        text_content = self._generate_text_report(
-            developer_name,
-            report_date,
-            categorized,
-            repo_groups
-        )
+        shas = [commit.get('sha') for commit in commits]
+        key = content_hash(shas, developer_name, report_date) if all(shas) else None
 
-        return {
-            'html': html_content,
-            'text': text_content,
-            'commit_count': len(commits),
-            'repo_count': len(repo_groups),
-        }
+        cached = RENDER_CACHE.get(key) if key else None
+        if cached is not None:
+            return dict(cached)
+
+        state = self.empty_state()
+        self.add_to_state(state, commits)
+        return self._render(state, developer_name, report_date, key)
 
-    def _categorize_commits(self, commits: List[Dict]) -> Dict[str, List[str]]:
-        """Categorize commits by action type"""
-        categorized = defaultdict(list)
+    def empty_state(self) -> Dict:
+        """
+        Structured state of a report with no commits
+        
+        sections maps each category to its display messages, repos maps each
+        repository to its commit count; both keep first-seen order. shas
+        lists the commits folded in, so one stored again (e.g. re-fetched
+        after cleanup) is not counted twice.
+        """
+        return {'sections': {}, 'repos': {}, 'commit_count': 0, 'shas': []}
+
+    def add_to_state(self, state: Dict, commits: List[Dict]) -> bool:
+        """
+        Fold commits into a report state in place
+        
+        Args:
+            state: State from empty_state or a stored report
+            commits: Commits with repository and message, plus category and
+                display_message when they were classified at ingest; commits
+                with a sha already in the state are skipped
+            
+        Returns:
+            True if the state changed
+        """
+        sections = state['sections']
+        repos = state['repos']
+        shas = state['shas']
+        seen = set(shas)
+        added = 0
 
         for commit in commits:
-            message = commit['message']
-            enhanced_message = self._enhance_message(message)
-            category = self._classify_commit(message)
-            categorized[category].append(enhanced_message)
+            sha = commit.get('sha')
+            if sha:
+                if sha in seen:
+                    continue
+                seen.add(sha)
+                shas.append(sha)
+
+            # Commits classified at ingest carry their result
+            if commit.get('category') and commit.get('display_message'):
+                category, enhanced_message = commit['category'], commit['display_message']
+            else:
+                category, enhanced_message = self.classify_message(commit['message'])
+            sections.setdefault(category, []).append(enhanced_message)
+            repos[commit['repository']] = repos.get(commit['repository'], 0) + 1
+            added += 1
+
+        state['commit_count'] += added
+        return bool(added)
+
+    def render_state(self, state: Dict, developer_name: str, report_date: date, key: str = None) -> Dict:
+        """
+        Render a report state
+        
+        Args:
+            state: Report state
+            developer_name: Developer's name
+            report_date: Date of the report
+            key: content_hash of the commits in state; when given, the render
+                cache is consulted and filled under it
+        
+        Returns:
+            Dictionary with html and text versions of report
+        """
+        if key:
+            cached = RENDER_CACHE.get(key)
+            if cached is not None:
+                return dict(cached)
+
+        return self._render(state, developer_name, report_date, key)
+
+    def _render(self, state: Dict, developer_name: str, report_date: date, key: str | None) -> Dict:
+        """Render a report state and store the result under key, if any"""
+        # Render both versions from one context; HTML output is autoescaped
+        context = self._build_context(developer_name, report_date, state)
+
+        report_data = {
+            'html': HTML_REPORT.render(context),
+            'text': TEXT_REPORT.render(context),
+            'commit_count': state['commit_count'],
+            'repo_count': len(state['repos']),
+            'content_hash': key,
+        }
+        if key:
+            RENDER_CACHE.set(key, report_data)
+        return dict(report_data)
 
-        return dict(categorized)
+    def classify_message(self, message: str) -> Tuple[str, str]:
+        """
+        Classify a commit message and clean it up, lowercasing it only once
+        
+        Args:
+            message: First line of the commit message
+            
+        Returns:
+            Tuple of (category, display message)
+        """
+        message_lower = message.lower()
+        return self._classify_commit(message, message_lower), self._enhance_message(message, message_lower)
 
-    def _classify_commit(self, message: str) -> str:
+    def _classify_commit(self, message: str, message_lower: str = None) -> str:
         """Classify commit into a category"""
-        message_lower = message.lower()
+        if message_lower is None:
+            message_lower = message.lower()
 
-        for category, keywords in self.action_verbs.items():
-            if any(keyword in message_lower for keyword in keywords):
-                return category
+        for category, keywords in self._category_keywords:
+            for keyword in keywords:
+                if keyword in message_lower:
+                    return category
 
         return 'general'
 
-    def _enhance_message(self, message: str) -> str:
+    def _enhance_message(self, message: str, message_lower: str = None) -> str:
         """
         Enhance commit message for readability
         Remove common prefixes and capitalize properly
         """
-        # Remove common prefixes
-        prefixes = ['feat: ', 'fix: ', 'refactor: ', 'docs: ', 'test: ', 'chore: ', 'style: ']
-        for prefix in prefixes:
-            if message.lower().startswith(prefix):
-                message = message[len(prefix):].strip()
+        if message_lower is None:
+            message_lower = message.lower()
+
+        # Remove common prefixes; the prefixes are ASCII, so offsets in the
+        # lowercased message hold in the original
+        prefix_end = self._prefix_pattern.match(message_lower).end()
+        if prefix_end:
+            message = message[prefix_end:].rstrip()
 
         # Capitalize first letter if not already
         if message and message[0].islower():
@@ -106,121 +230,17 @@ class ReportGenerator:
 
         return message
 
-    def _generate_html_report(
-        self,
-        developer: str,
-        report_date: date,
-        categorized: Dict,
-        repo_groups: Dict
-    ) -> str:
-        """Generate HTML formatted report"""
-        date_str = report_date.strftime('%d %b %Y')
-        total_commits = sum(len(msgs) for msgs in categorized.values())
-
-        html = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <style>
-        body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif; line-height: 1.6; max-width: 600px; margin: 0 auto; padding: 20px; color: #333; }}
-        h1 {{ color: #2c3e50; border-bottom: 3px solid #3498db; padding-bottom: 10px; }}
-        h2 {{ color: #34495e; margin-top: 20px; margin-bottom: 10px; font-size: 16px; }}
-        ul {{ margin: 10px 0; padding-left: 20px; }}
-        li {{ margin: 5px 0; }}
-        .category {{ margin: 15px 0; }}
-        .footer {{ margin-top: 30px; padding-top: 10px; border-top: 1px solid #ecf0f1; font-size: 12px; color: #7f8c8d; }}
-        .stats {{ background: #ecf0f1; padding: 10px; border-radius: 5px; margin: 15px 0; }}
-        .repo-list {{ font-size: 13px; color: #7f8c8d; }}
-    </style>
-</head>
-<body>
-    <h1>📊 Daily Work Report</h1>
-    <p><strong>{developer}</strong> • {date_str}</p>
-"""
-
-        # Category sections
-        category_labels = {
-            'fix': '🐛 Bug Fixes',
-            'feature': '✨ Features',
-            'refactor': '♻️ Refactoring',
-            'improve': '⚡ Improvements',
-            'test': '🧪 Tests',
-            'docs': '📚 Documentation',
-            'general': '📝 Other Updates',
-        }
-
-        for category in ['fix', 'feature', 'refactor', 'improve', 'test', 'docs', 'general']:
-            if category in categorized and categorized[category]:
-                html += f"""
-    <div class="category">
-        <h2>{category_labels.get(category, category)}</h2>
-        <ul>
-"""
-                for msg in categorized[category]:
-                    html += f"            <li>{msg}</li>\n"
-
-                html += """        </ul>
-    </div>
-"""
-
-        # Statistics
-        html += f"""
-    <div class="stats">
-        <strong>Summary:</strong><br>
-        Total Commits: {total_commits}<br>
-        Repositories: {', '.join(repo_groups.keys())}
-    </div>
-
-    <div class="footer">
-        <p>Generated by ReportForMe • Automated Daily Report</p>
-    </div>
-</body>
-</html>
-"""
-        return html
-
-    def _generate_text_report(
-        self,
-        developer: str,
-        report_date: date,
-        categorized: Dict,
-        repo_groups: Dict
-    ) -> str:
-        """Generate plain text formatted report"""
-        date_str = report_date.strftime('%d %b %Y')
-        total_commits = sum(len(msgs) for msgs in categorized.values())
-
-        text = f"""
-DAILY WORK REPORT — {date_str}
-Developer: {developer}
-{'=' * 60}
-
-"""
-
-        category_labels = {
-            'fix': '🐛 BUG FIXES',
-            'feature': '✨ FEATURES',
-            'refactor': '♻️ REFACTORING',
-            'improve': '⚡ IMPROVEMENTS',
-            'test': '🧪 TESTS',
-            'docs': '📚 DOCUMENTATION',
-            'general': '📝 OTHER UPDATES',
+    def _build_context(self, developer: str, report_date: date, state: Dict) -> Dict:
+        """Structured context shared by the HTML and text templates"""
+        sections = state['sections']
+        return {
+            'developer': developer,
+            'date_str': report_date.strftime('%d %b %Y'),
+            'sections': [
+                {'label': self.category_labels[category], 'messages': sections[category]}
+                for category in self.category_order
+                if sections.get(category)
+            ],
+            'total_commits': state['commit_count'],
+            'repositories': list(state['repos']),
         }
-
-        for category in ['fix', 'feature', 'refactor', 'improve', 'test', 'docs', 'general']:
-            if category in categorized and categorized[category]:
-                text += f"\n{category_labels.get(category, category)}\n"
-                text += "-" * 40 + "\n"
-                for msg in categorized[category]:
-                    text += f"• {msg}\n"
-
-        text += f"""
-{'=' * 60}
-SUMMARY
-Total Commits: {total_commits}
-Repositories: {', '.join(repo_groups.keys())}
-
-Generated by ReportForMe
-"""
-        return text
@@ -0,0 +1,114 @@
+"""
+Report Templates
+Loads the daily report layouts once per process and renders them from a structured context
+"""
+import hashlib
+import html
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Tuple
+
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent / 'templates' / 'core' / 'reports'
+
+
+def _read(name: str) -> str:
+    """Read a layout file"""
+    return (TEMPLATE_DIR / name).read_text(encoding='utf-8')
+
+
+def _template_version() -> str:
+    """Digest of every layout file, so cached renders expire with a template change"""
+    digest = hashlib.sha256()
+    for path in sorted(TEMPLATE_DIR.glob('daily*')):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:12]
+
+
+class _Fragment:
+    """
+    A layout file split once into literal text and $name placeholders
+    
+    Rendering joins the literals with the given values; nothing is parsed
+    per call, and braces in the file (e.g. CSS) need no escaping.
+    """
+
+    def __init__(self, text: str):
+        parts = re.split(r'\$(\w+)', text)
+        self.head = parts[0]
+        self.fields = list(zip(parts[1::2], parts[2::2]))
+
+    def __call__(self, **values: str) -> str:
+        out = [self.head]
+        for name, literal in self.fields:
+            out.append(values[name])
+            out.append(literal)
+        return ''.join(out)
+
+
+@lru_cache(maxsize=None)
+def _compile(name: str) -> _Fragment:
+    """Load and split a layout file once per process"""
+    return _Fragment(_read(name))
+
+
+@lru_cache(maxsize=None)
+def _compile_item(name: str) -> Tuple[str, str]:
+    """Split a list item layout around its single $message placeholder"""
+    head, tail = _read(name).split('$message')
+    return head, tail
+
+
+class ReportTemplate:
+    """
+    Daily report layout in one output format
+    
+    A layout is three files: the page, one category section and one list
+    item. Lists are rendered with joins rather than repeated concatenation,
+    and every value taken from the context goes through the format's escape
+    function.
+    """
+
+    def __init__(self, extension: str, escape: Callable[[str], str]):
+        self.page = _compile(f"daily.{extension}")
+        self.section = _compile(f"daily_section.{extension}")
+        self.item_head, self.item_tail = _compile_item(f"daily_item.{extension}")
+        self.escape = escape
+
+    def render(self, context: Dict) -> str:
+        """
+        Render a report
+        
+        Args:
+            context: developer, date_str, total_commits, repositories (list)
+                and sections (list of {'label', 'messages'})
+            
+        Returns:
+            The rendered document
+        """
+        escape = self.escape
+        head, tail = self.item_head, self.item_tail
+        # Items are one join per section: head + msg1 + tail + head + msg2 + tail ...
+        separator = tail + head
+        sections = ''.join([
+            self.section(
+                label=escape(section['label']),
+                label_upper=escape(section['label'].upper()),
+                items=head + separator.join(map(escape, section['messages'])) + tail,
+            )
+            for section in context['sections']
+        ])
+
+        return self.page(
+            developer=escape(context['developer']),
+            date_str=escape(context['date_str']),
+            sections=sections,
+            total_commits=str(context['total_commits']),
+            repositories=escape(', '.join(context['repositories'])),
+        )
+
+
+TEMPLATE_VERSION = _template_version()
+HTML_REPORT = ReportTemplate('html', html.escape)
+TEXT_REPORT = ReportTemplate('txt', str)
@@ -3,87 +3,171 @@ Celery tasks for scheduled report generation and delivery
 """
 from celery import shared_task
 from django.utils import timezone
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from pytz import timezone as pytz_timezone
 from core.models import UserConfig, Report, Commit
 from core.services.commit_aggregator import CommitAggregator
-from core.services.report_generator import ReportGenerator
+from core.services.github_cache import ETagCache
+from core.services.render_cache import RENDER_CACHE
+from core.services.report_builder import ReportBuilder
 from core.services.email_service import EmailService
+from core.services.rate_limiter import RateLimitExceeded
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+@shared_task
+def generate_daily_reports():
+    """
+    Finalize daily reports for all active users
+    Scheduled to run every day; queues one finalize_daily_report per user for
+    today, so one user's failure or exhausted token only delays that user
+    """
+    target_date = date.today()
+    user_config_ids = list(UserConfig.objects.filter(is_active=True).values_list('id', flat=True))
+
+    for user_config_id in user_config_ids:
+        finalize_daily_report.delay(user_config_id, target_date.isoformat())
+
+    return {
+        'status': 'success',
+        'users_queued': len(user_config_ids),
+        'report_date': target_date.isoformat(),
+        # Conditional-request hits and misses accumulated by all workers
+        'etag_cache': ETagCache().stats(),
+        'timestamp': timezone.now().isoformat()
+    }
+
+
 @shared_task(bind=True, max_retries=3)
-def generate_daily_reports(self):
+def finalize_daily_report(self, user_config_id: int, report_date: str):
     """
-    Generate daily reports for all active users
-    Scheduled to run every day
+    Finalize one user's daily report
+    Reports are kept up to date as commits land, so this only catches up on
+    missed pushes and folds in what is pending. The date is fixed when the
+    task is queued, so a retry after midnight still finalizes the right day
     """
-    active_users = UserConfig.objects.filter(is_active=True)
-    reports_generated = 0
+    report_date = date.fromisoformat(report_date)
 
-    for user_config in active_users:
-        try:
-            # Fetch commits
-            aggregator = CommitAggregator()
-            commit_count = aggregator.aggregate_daily_commits(user_config)
-
-            if commit_count == 0:
-                logger.info(f"No commits for {user_config.user.username} today")
-                continue
-
-            # Get today's commits
-            today = date.today()
-            commits = Commit.objects.filter(
-                user_config=user_config,
-                commit_date__date=today,
-                is_processed=False
-            ).values()
-
-            if not commits.exists():
-                logger.info(f"No unprocessed commits for {user_config.user.username}")
-                continue
-
-            # Generate report
-            report_generator = ReportGenerator()
-            report_data = report_generator.generate_report(
-                list(commits),
-                user_config.user.get_full_name() or user_config.user.username,
-                today
-            )
-
-            # Create report
-            report, created = Report.objects.get_or_create(
-                user_config=user_config,
-                report_date=today,
-                defaults={
-                    'content_html': report_data['html'],
-                    'content_text': report_data['text'],
-                    'commit_count': report_data['commit_count'],
-                    'repo_count': report_data['repo_count'],
-                    'status': 'draft'
-                }
-            )
-
-            if created:
-                # Mark commits as processed
-                Commit.objects.filter(
-                    user_config=user_config,
-                    commit_date__date=today
-                ).update(is_processed=True)
+    try:
+        user_config = UserConfig.objects.get(id=user_config_id)
+    except UserConfig.DoesNotExist:
+        logger.warning(f"UserConfig {user_config_id} no longer exists, skipping daily report")
+        return {'status': 'skipped', 'reports_generated': 0}
 
-                logger.info(f"Generated report for {user_config.user.username}")
-                reports_generated += 1
+    try:
+        # Fetch the whole day, regardless of the cursor, to reconcile late pushes
+        commit_count = CommitAggregator().aggregate_daily_commits(user_config, report_date, full_window=True)
 
-        except Exception as e:
-            logger.error(f"Error generating report for {user_config.user.username}: {str(e)}")
-            # Retry up to 3 times
-            raise self.retry(exc=e, countdown=300)
+        if commit_count == 0:
+            logger.info(f"No new commits for {user_config.user.username} on {report_date}")
+        else:
+            # Diff stats are filled in off the critical path
+            enrich_commit_stats.delay(user_config.id)
+
+        reports_generated = ReportBuilder().apply_pending(user_config)
+
+    except RateLimitExceeded as e:
+        logger.warning(f"GitHub budget exhausted for {user_config.user.username}: {str(e)}")
+        # Resume once the token's budget resets instead of burning retries
+        raise self.retry(exc=e, countdown=e.retry_after)
+
+    except Exception as e:
+        logger.error(f"Error generating report for {user_config.user.username}: {str(e)}")
+        # Retry up to 3 times
+        raise self.retry(exc=e, countdown=300)
 
     return {
         'status': 'success',
         'reports_generated': reports_generated,
+        'render_cache': RENDER_CACHE.stats(),
+        'timestamp': timezone.now().isoformat()
+    }
+
+
+@shared_task(bind=True, max_retries=3)
+def backfill_commits(self, user_config_id: int, start_date: str, end_date: str, generate_reports: bool = False):
+    """
+    Fetch commits for a range of days, optionally folding them into reports now
+    Queued by the backfill_commits management command; safe to re-run, as
+    completed repositories are skipped and interrupted ones resume. Without
+    generate_reports the commits reach their reports at the next finalize
+    """
+    start_date = date.fromisoformat(start_date)
+    end_date = date.fromisoformat(end_date)
+    user_config = UserConfig.objects.get(id=user_config_id)
+
+    try:
+        commit_count = CommitAggregator().backfill_commits(user_config, start_date, end_date)
+    except RateLimitExceeded as e:
+        raise self.retry(exc=e, countdown=e.retry_after)
+
+    if commit_count:
+        enrich_commit_stats.delay(user_config.id)
+
+    reports_generated = 0
+    if generate_reports:
+        reports_generated = ReportBuilder().apply_pending(user_config)
+
+    return {
+        'status': 'success',
+        'backfilled_commits': commit_count,
+        'reports_generated': reports_generated,
+        'timestamp': timezone.now().isoformat()
+    }
+
+
+@shared_task(bind=True, max_retries=3)
+def enrich_commit_stats(self, user_config_id: int):
+    """
+    Fetch files_changed/additions/deletions for newly stored commits
+    Queued after each aggregation run
+    """
+    try:
+        user_config = UserConfig.objects.get(id=user_config_id)
+    except UserConfig.DoesNotExist:
+        logger.warning(f"UserConfig {user_config_id} no longer exists, skipping stats enrichment")
+        return {'status': 'skipped', 'enriched_commits': 0}
+
+    try:
+        enriched = CommitAggregator().enrich_commit_stats(user_config)
+    except RateLimitExceeded as e:
+        raise self.retry(exc=e, countdown=e.retry_after)
+
+    return {
+        'status': 'success',
+        'enriched_commits': enriched,
+        'timestamp': timezone.now().isoformat()
+    }
+
+
+@shared_task(bind=True, max_retries=3)
+def ingest_push_commits(self, repo_name: str, push_commits: list, pushed_at: str, before: str = '', after: str = ''):
+    """
+    Store commits delivered by a GitHub push webhook
+    Queued by the webhook endpoint for every push to a default branch
+    """
+    pushed_at = datetime.fromisoformat(pushed_at)
+
+    try:
+        stored = CommitAggregator().ingest_push(repo_name, push_commits, pushed_at, before, after)
+
+        # Fold the new commits into each watcher's report right away
+        user_configs = UserConfig.objects.filter(
+            commit_links__is_processed=False,
+            commit_links__commit__repo_name=repo_name
+        ).distinct()
+        report_builder = ReportBuilder()
+        for user_config in user_configs:
+            report_builder.apply_pending(user_config)
+    except Exception as e:
+        logger.error(f"Error ingesting push for {repo_name}: {str(e)}")
+        raise self.retry(exc=e, countdown=60)
+
+    return {
+        'status': 'success',
+        'stored_commits': stored,
         'timestamp': timezone.now().isoformat()
     }
 
@@ -151,7 +235,6 @@ def cleanup_old_commits():
     Clean up old commits older than 30 days
     Scheduled to run daily
     """
-    from datetime import timedelta
     cutoff_date = timezone.now() - timedelta(days=30)
 
     deleted_count, _ = Commit.objects.filter(
@@ -1,3 +1,178 @@
-from django.test import TestCase
+import hashlib
+import hmac
+import json
+from datetime import datetime, timezone as dt_timezone
+from unittest import mock
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from core.models import UserConfig, GithubRepository, CommitFilterRule, Commit, UserCommit
+from core.services.commit_aggregator import CommitAggregator
+from core.services.commit_filter import NoiseFilter
 
-# Create your tests here.
+SINCE = datetime(2026, 10, 16, tzinfo=dt_timezone.utc)
+UNTIL = datetime(2026, 10, 17, tzinfo=dt_timezone.utc)
+
+
+def normalized_commit(sha: str, message: str, repo: str = 'owner/repo') -> dict:
+    """A commit shaped like GitHubService output"""
+    return {
+        'sha': sha,
+        'author': 'Dev',
+        'email': 'dev@example.com',
+        'message': message.split('\n')[0],
+        'full_message': message,
+        'date': '2026-10-16T10:00:00Z',
+        'url': f'https://github.com/{repo}/commit/{sha}',
+        'repository': repo,
+        'files_changed': 0,
+        'additions': 0,
+        'deletions': 0,
+        'stats_fetched': False,
+    }
+
+
+class SharedCommitStoreTests(TestCase):
+    """Commits are stored once per repository and linked to each watcher"""
+
+    def setUp(self):
+        self.aggregator = CommitAggregator()
+        self.watchers = []
+        for username in ('alice', 'bob'):
+            user = User.objects.create(username=username)
+            user_config = UserConfig.objects.create(user=user, github_username=username, email=f'{username}@example.com')
+            repository = GithubRepository.objects.create(
+                user_config=user_config,
+                repo_name='owner/repo',
+                repo_url='https://github.com/owner/repo',
+                access_verified_at=timezone.now()
+            )
+            self.watchers.append((user_config, repository))
+
+    def store(self, commits: list, watcher: tuple, repo_name: str = 'owner/repo') -> int:
+        user_config, repository = watcher
+        return self.aggregator._store_commits(
+            repo_name, commits, [(user_config, repository, NoiseFilter.for_user(user_config))]
+        )
+
+    def link_window(self, watcher: tuple) -> int:
+        user_config, repository = watcher
+        return self.aggregator._link_window(
+            user_config, repository, NoiseFilter.for_user(user_config), SINCE, UNTIL
+        )
+
+    def test_commit_is_stored_once_for_all_watchers(self):
+        commits = [normalized_commit('a' * 40, 'add page')]
+
+        self.assertEqual(self.store(commits, self.watchers[0]), 1)
+        self.assertEqual(self.link_window(self.watchers[1]), 1)
+        self.assertEqual(self.store(commits, self.watchers[1]), 0)
+
+        self.assertEqual(Commit.objects.count(), 1)
+        self.assertEqual(UserCommit.objects.count(), 2)
+
+    def test_window_is_not_linked_before_access_is_verified(self):
+        self.store([normalized_commit('a' * 40, 'add page')], self.watchers[0])
+        user_config, repository = self.watchers[1]
+        repository.access_verified_at = None
+
+        self.assertEqual(self.link_window((user_config, repository)), 0)
+        self.assertFalse(UserCommit.objects.filter(user_config=user_config).exists())
+
+    def test_forks_keep_their_own_copy_of_a_shared_sha(self):
+        user_config, _ = self.watchers[0]
+        fork = GithubRepository.objects.create(
+            user_config=user_config,
+            repo_name='fork/repo',
+            repo_url='https://github.com/fork/repo',
+            access_verified_at=timezone.now()
+        )
+
+        self.store([normalized_commit('a' * 40, 'add page')], self.watchers[0])
+        linked = self.store([normalized_commit('a' * 40, 'add page', repo='fork/repo')], (user_config, fork), 'fork/repo')
+
+        self.assertEqual(linked, 1)
+        self.assertEqual(
+            sorted(Commit.objects.values_list('repo_name', flat=True)),
+            ['fork/repo', 'owner/repo']
+        )
+        self.assertEqual(UserCommit.objects.get(repository=fork).commit.repo_name, 'fork/repo')
+
+    def test_user_rules_match_the_full_message_when_storing_and_linking(self):
+        for user_config, _ in self.watchers:
+            CommitFilterRule.objects.create(user_config=user_config, pattern='wip')
+            CommitFilterRule.objects.create(user_config=user_config, pattern='co-authored-by')
+        commits = [
+            normalized_commit('a' * 40, 'wip: half done'),
+            normalized_commit('b' * 40, 'add page\n\nCo-authored-by: Someone'),
+            normalized_commit('c' * 40, 'add form'),
+        ]
+
+        stored_links = self.store(commits, self.watchers[0])
+        window_links = self.link_window(self.watchers[1])
+
+        self.assertEqual(stored_links, window_links)
+        for user_config, _ in self.watchers:
+            self.assertEqual(
+                list(UserCommit.objects.filter(user_config=user_config).values_list('commit__commit_sha', flat=True)),
+                ['c' * 40]
+            )
+
+
+@override_settings(GITHUB_WEBHOOK_SECRET='webhook-secret')
+class GithubWebhookTests(TestCase):
+    """Only signed pushes to the default branch are queued for ingestion"""
+
+    def push_payload(self, ref: str = 'refs/heads/main') -> bytes:
+        return json.dumps({
+            'ref': ref,
+            'before': 'a' * 40,
+            'after': 'b' * 40,
+            'repository': {'full_name': 'owner/repo', 'default_branch': 'main', 'pushed_at': 1792195200},
+            'commits': [{'id': 'b' * 40, 'message': 'add page', 'author': {'name': 'Dev', 'email': 'dev@example.com'}}],
+        }).encode()
+
+    def post(self, body: bytes, signature: str | None = None, event: str = 'push'):
+        headers = {'HTTP_X_GITHUB_EVENT': event}
+        if signature is not None:
+            headers['HTTP_X_HUB_SIGNATURE_256'] = signature
+        return self.client.post(reverse('github-webhook'), body, content_type='application/json', **headers)
+
+    def sign(self, body: bytes) -> str:
+        return 'sha256=' + hmac.new(b'webhook-secret', body, hashlib.sha256).hexdigest()
+
+    @mock.patch('core.webhook_views.ingest_push_commits')
+    def test_missing_or_bad_signature_is_rejected(self, ingest):
+        body = self.push_payload()
+
+        self.assertEqual(self.post(body).status_code, 403)
+        self.assertEqual(self.post(body, signature='sha256=' + '0' * 64).status_code, 403)
+        self.assertEqual(self.post(body, signature=self.sign(body + b' ')).status_code, 403)
+        ingest.delay.assert_not_called()
+
+    @mock.patch('core.webhook_views.ingest_push_commits')
+    def test_push_to_another_branch_is_ignored(self, ingest):
+        body = self.push_payload(ref='refs/heads/feature')
+
+        response = self.post(body, signature=self.sign(body))
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.json(), {'status': 'ignored', 'ref': 'refs/heads/feature'})
+        ingest.delay.assert_not_called()
+
+    @mock.patch('core.webhook_views.ingest_push_commits')
+    def test_signed_default_branch_push_is_queued(self, ingest):
+        body = self.push_payload()
+
+        response = self.post(body, signature=self.sign(body))
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.json()['status'], 'queued')
+        ingest.delay.assert_called_once_with(
+            'owner/repo',
+            json.loads(body)['commits'],
+            datetime.fromtimestamp(1792195200, tz=dt_timezone.utc).isoformat(),
+            'a' * 40,
+            'b' * 40
+        )
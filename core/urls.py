@@ -4,7 +4,7 @@ URL Router for API endpoints
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from core.views import (
-    UserConfigViewSet, ReportViewSet, CommitViewSet, GithubRepositoryViewSet
+    UserConfigViewSet, ReportViewSet, CommitViewSet, GithubRepositoryViewSet, CommitFilterRuleViewSet
 )
 from core.oauth_views import (
     github_login,
@@ -14,12 +14,14 @@ from core.oauth_views import (
     logout_user,
     oauth_callback_status,
 )
+from core.webhook_views import github_webhook
 
 router = DefaultRouter()
 router.register(r'users', UserConfigViewSet, basename='user-config')
 router.register(r'reports', ReportViewSet, basename='report')
 router.register(r'commits', CommitViewSet, basename='commit')
 router.register(r'repositories', GithubRepositoryViewSet, basename='repository')
+router.register(r'filter-rules', CommitFilterRuleViewSet, basename='filter-rule')
 
 urlpatterns = [
     path('api/', include(router.urls)),
@@ -30,4 +32,6 @@ urlpatterns = [
     path('api/auth/complete-registration/', complete_github_registration, name='complete-registration'),
     path('api/auth/sync-token/', sync_github_token, name='sync-token'),
     path('api/auth/logout/', logout_user, name='logout'),
+    # Webhooks
+    path('api/webhooks/github/', github_webhook, name='github-webhook'),
 ]
@@ -6,12 +6,20 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django.utils import timezone
-from datetime import date
-from core.models import UserConfig, Report, GithubRepository, Commit
-from core.serializers import UserConfigSerializer, ReportSerializer, CommitSerializer, GithubRepositorySerializer
+from django.utils.dateparse import parse_date
+from datetime import date, timedelta
+from core.models import UserConfig, Report, GithubRepository, Commit, CommitFilterRule
+from core.serializers import (
+    UserConfigSerializer, ReportSerializer, CommitSerializer, GithubRepositorySerializer, CommitFilterRuleSerializer
+)
 from core.services.github_service import GitHubService
 from core.services.commit_aggregator import CommitAggregator
+from core.services.report_builder import ReportBuilder
+from core.services.daily_stats import DailyStatsService
+from core.services.commit_analytics import CommitAnalytics
 from core.services.email_service import EmailService
+from core.services.rate_limiter import GitHubRateLimiter, RateLimitExceeded
+from core.tasks import enrich_commit_stats
 import logging
 
 logger = logging.getLogger(__name__)
@@ -38,19 +46,35 @@ class UserConfigViewSet(viewsets.ModelViewSet):
                 'message': 'No GitHub token found'
             })
 
-        gh_service = GitHubService(user_config.github_token)
-        is_valid = gh_service.verify_token()
+        gh_service = GitHubService(user_config.github_token, interactive=True)
+        try:
+            is_valid = gh_service.verify_token(use_cache=False)
+        except RateLimitExceeded as e:
+            return self._rate_limited(e)
 
         return Response({
             'token_valid': is_valid,
             'message': 'GitHub token is valid' if is_valid else 'GitHub token is invalid'
         })
 
+    @action(detail=True, methods=['get'])
+    def rate_limit(self, request, pk=None):
+        """Get the current GitHub API budget for the user's token"""
+        user_config = self.get_object()
+        if user_config.github_token is None:
+            return Response({'message': 'No GitHub token found'}, status=status.HTTP_404_NOT_FOUND)
+
+        rate_limiter = GitHubRateLimiter()
+        return Response({
+            resource: rate_limiter.get_budget(user_config.github_token, resource)
+            for resource in ('core', 'graphql')
+        })
+
     @action(detail=True, methods=['post'])
     def sync_repositories(self, request, pk=None):
         """Sync all GitHub repositories for user"""
         user_config = self.get_object()
-        aggregator = CommitAggregator()
+        aggregator = CommitAggregator(interactive=True)
 
         try:
             synced_count = aggregator.sync_user_repositories(user_config)
@@ -58,6 +82,8 @@ class UserConfigViewSet(viewsets.ModelViewSet):
                 'status': 'success',
                 'repositories_synced': synced_count
             })
+        except RateLimitExceeded as e:
+            return self._rate_limited(e)
         except Exception as e:
             logger.error(f"Error syncing repositories: {str(e)}")
             return Response(
@@ -69,14 +95,20 @@ class UserConfigViewSet(viewsets.ModelViewSet):
     def fetch_daily_commits(self, request, pk=None):
         """Manually fetch commits for today"""
         user_config = self.get_object()
-        aggregator = CommitAggregator()
+        aggregator = CommitAggregator(interactive=True)
 
         try:
             commit_count = aggregator.aggregate_daily_commits(user_config)
+            if commit_count:
+                enrich_commit_stats.delay(user_config.id)
+            reports_updated = ReportBuilder().apply_pending(user_config)
             return Response({
                 'status': 'success',
-                'commits_fetched': commit_count
+                'commits_fetched': commit_count,
+                'reports_updated': reports_updated
             })
+        except RateLimitExceeded as e:
+            return self._rate_limited(e)
         except Exception as e:
             logger.error(f"Error fetching commits: {str(e)}")
             return Response(
@@ -102,6 +134,14 @@ class UserConfigViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+    def _rate_limited(self, exc: RateLimitExceeded) -> Response:
+        """Response for requests refused because the GitHub budget is used up"""
+        return Response(
+            {'error': str(exc), 'retry_after': exc.retry_after},
+            status=status.HTTP_429_TOO_MANY_REQUESTS,
+            headers={'Retry-After': str(exc.retry_after)}
+        )
+
 
 class ReportViewSet(viewsets.ReadOnlyModelViewSet):
     """
@@ -138,6 +178,39 @@ class ReportViewSet(viewsets.ReadOnlyModelViewSet):
         serializer = self.get_serializer(reports, many=True)
         return Response(serializer.data)
 
+    @action(detail=False, methods=['get'])
+    def rollup(self, request):
+        """
+        Get a weekly or monthly summary
+
+        Query params: period ('week' or 'month', default 'week') and date
+        (YYYY-MM-DD, default today) picking the week or month to summarize.
+        Built from the daily stats table, so it covers days whose commits
+        have already been cleaned up.
+        """
+        try:
+            day = parse_date(request.query_params['date']) if 'date' in request.query_params else date.today()
+        except ValueError:
+            day = None
+        if day is None:
+            return Response({'message': 'date must be YYYY-MM-DD'}, status=status.HTTP_400_BAD_REQUEST)
+
+        daily_stats = DailyStatsService()
+        try:
+            start_date, end_date = daily_stats.period_bounds(request.query_params.get('period', 'week'), day)
+        except ValueError:
+            return Response({'message': "period must be 'week' or 'month'"}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            user_config = request.user.report_config
+        except UserConfig.DoesNotExist:
+            return Response(
+                {'error': 'User config not found. Please complete registration.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        return Response(daily_stats.rollup(user_config, start_date, end_date))
+
 
 class CommitViewSet(viewsets.ReadOnlyModelViewSet):
     """
@@ -147,11 +220,17 @@ class CommitViewSet(viewsets.ReadOnlyModelViewSet):
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
-        """Only return commits for the current user"""
-        return Commit.objects.filter(
-            user_config__user=self.request.user
+        """Only return commits for the current user, optionally of one ?category="""
+        commits = Commit.objects.filter(
+            user_links__user_config__user=self.request.user
         ).order_by('-commit_date')
 
+        category = self.request.query_params.get('category')
+        if category:
+            commits = commits.filter(category=category)
+
+        return commits
+
     @action(detail=False, methods=['get'])
     def today(self, request):
         """Get today's commits"""
@@ -160,6 +239,35 @@ class CommitViewSet(viewsets.ReadOnlyModelViewSet):
         serializer = self.get_serializer(commits, many=True)
         return Response(serializer.data)
 
+    @action(detail=False, methods=['get'])
+    def analytics(self, request):
+        """
+        Get activity analytics for a date range
+
+        Query params: start and end (YYYY-MM-DD, default the last 30 days)
+        and window (days in the rolling averages, default 7).
+        """
+        try:
+            end_date = parse_date(request.query_params['end']) if 'end' in request.query_params else date.today()
+            if end_date is None:
+                raise ValueError("end must be YYYY-MM-DD")
+            start_date = (
+                parse_date(request.query_params['start']) if 'start' in request.query_params
+                else end_date - timedelta(days=29)
+            )
+            if start_date is None:
+                raise ValueError("start must be YYYY-MM-DD")
+            window = int(request.query_params.get('window', 7))
+
+            return Response(CommitAnalytics().summarize(request.user.report_config, start_date, end_date, window))
+        except ValueError as e:
+            return Response({'message': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except UserConfig.DoesNotExist:
+            return Response(
+                {'error': 'User config not found. Please complete registration.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
 
 class GithubRepositoryViewSet(viewsets.ModelViewSet):
     """
@@ -185,3 +293,31 @@ class GithubRepositoryViewSet(viewsets.ModelViewSet):
             'repo_name': repo.repo_name,
             'is_monitored': repo.is_monitored
         })
+
+
+class CommitFilterRuleViewSet(viewsets.ModelViewSet):
+    """
+    API endpoints for managing commit noise filter rules
+    """
+    serializer_class = CommitFilterRuleSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        """Only return rules for the current user"""
+        return CommitFilterRule.objects.filter(
+            user_config__user=self.request.user
+        ).select_related('repository')
+
+    def create(self, request, *args, **kwargs):
+        """Create a rule, once the user has completed registration"""
+        try:
+            return super().create(request, *args, **kwargs)
+        except UserConfig.DoesNotExist:
+            return Response(
+                {'error': 'User config not found. Please complete registration.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+    def perform_create(self, serializer):
+        """Attach new rules to the current user's config"""
+        serializer.save(user_config=self.request.user.report_config)
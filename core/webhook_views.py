@@ -0,0 +1,83 @@
+"""
+GitHub Webhook Views
+Receives push webhooks so commits are ingested as soon as they land
+"""
+import hashlib
+import hmac
+import json
+from datetime import datetime, timezone as dt_timezone
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.decorators import api_view, authentication_classes, permission_classes
+from rest_framework.permissions import AllowAny
+from django.conf import settings
+from core.tasks import ingest_push_commits
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _valid_signature(request) -> bool:
+    """Check X-Hub-Signature-256 against GITHUB_WEBHOOK_SECRET"""
+    secret = getattr(settings, 'GITHUB_WEBHOOK_SECRET', '')
+    if not secret:
+        return False
+
+    expected = 'sha256=' + hmac.new(secret.encode(), request.body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, request.headers.get('X-Hub-Signature-256', ''))
+
+
+@api_view(['POST'])
+@authentication_classes([])
+@permission_classes([AllowAny])
+def github_webhook(request):
+    """
+    Accept GitHub push webhooks
+    Endpoint: POST /api/webhooks/github/
+
+    The signature is verified against the raw body before anything else.
+    Reports cover the default branch only, so pushes to other refs are
+    ignored; accepted pushes are queued for ingestion and acknowledged
+    immediately.
+    """
+    if not _valid_signature(request):
+        logger.warning("Rejected GitHub webhook with invalid signature")
+        return Response({'error': 'Invalid signature'}, status=status.HTTP_403_FORBIDDEN)
+
+    event = request.headers.get('X-GitHub-Event')
+
+    if event == 'ping':
+        return Response({'status': 'pong'})
+
+    if event != 'push':
+        return Response({'status': 'ignored', 'event': event}, status=status.HTTP_202_ACCEPTED)
+
+    try:
+        payload = json.loads(request.body)
+        repo_name = payload['repository']['full_name']
+        ref = payload['ref']
+        default_branch = payload['repository']['default_branch']
+        push_commits = payload.get('commits', [])
+        pushed_at = payload['repository'].get('pushed_at')
+    except (ValueError, KeyError, TypeError) as e:
+        return Response({'error': f'Malformed push payload: {str(e)}'}, status=status.HTTP_400_BAD_REQUEST)
+
+    if ref != f'refs/heads/{default_branch}':
+        return Response({'status': 'ignored', 'ref': ref}, status=status.HTTP_202_ACCEPTED)
+
+    # Push payloads report pushed_at as a unix timestamp
+    if isinstance(pushed_at, (int, float)):
+        pushed_at = datetime.fromtimestamp(pushed_at, tz=dt_timezone.utc)
+    else:
+        pushed_at = datetime.now(tz=dt_timezone.utc)
+
+    # Queued even without commits, so the branch head the next push starts from is known
+    ingest_push_commits.delay(
+        repo_name, push_commits, pushed_at.isoformat(), payload.get('before', ''), payload.get('after', '')
+    )
+
+    return Response({
+        'status': 'queued',
+        'repository': repo_name,
+        'commits': len(push_commits)
+    }, status=status.HTTP_202_ACCEPTED)
@@ -133,6 +133,16 @@ STATIC_URL = 'static/'
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Cache Configuration (shared by web and Celery workers)
+REDIS_URL = os.environ.get('REDIS_URL', 'redis://localhost:6379/0')
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': REDIS_URL,
+        'KEY_PREFIX': 'reportforme',
+    }
+}
+
 # Celery Configuration
 CELERY_BROKER_URL = 'redis://localhost:6379/0'
 CELERY_RESULT_BACKEND = 'redis://localhost:6379/0'
@@ -201,6 +211,27 @@ DEFAULT_FROM_EMAIL = 'ReportForMe <noreply@reportforme.com>'
 # GitHub Configuration
 GITHUB_API_BASE = 'https://api.github.com'
 GITHUB_COMMIT_FILTER_WORDS = ['Merge pull request', 'merge branch', 'Bump version', 'bump version']
+GITHUB_ETAG_CACHE_TTL = 7 * 24 * 3600  # Seconds to keep conditional-request bodies
+GITHUB_HTTP_POOL_SIZE = 10  # Keep-alive connections per worker process
+GITHUB_HTTP_MAX_RETRIES = 3  # Retries for 5xx / secondary rate limit responses
+GITHUB_HTTP_BACKOFF_BASE = 1.0  # Seconds, doubled on each retry (with jitter)
+GITHUB_HTTP_BACKOFF_MAX = 60  # Upper bound for a single backoff wait
+GITHUB_RATE_LIMIT_RESERVE = 50  # Requests per token only API views (token check, manual sync/fetch) may use
+GITHUB_RATE_LIMIT_MAX_WAIT = 30  # Longest a worker sleeps for budget before rescheduling
+GITHUB_FETCH_CONCURRENCY = 8  # Repositories fetched in parallel per user (1 = sequential)
+GITHUB_COMMIT_BACKEND = 'rest'  # 'rest' (one call per repo) or 'graphql' (batched history queries)
+GITHUB_GRAPHQL_BATCH_SIZE = 20  # Repositories per GraphQL history query
+GITHUB_STATS_CONCURRENCY = 4  # Parallel per-commit stats lookups during enrichment
+GITHUB_TOKEN_VERIFY_TTL = 600  # Seconds a token validity check is reused
+GITHUB_SKIP_DORMANT_REPOS = True  # Skip repos whose pushed_at predates the fetch window
+GITHUB_CURSOR_OVERLAP = 3600  # Seconds re-fetched before a repo's high-water mark
+GITHUB_SHARED_FETCH_TTL = 900  # Seconds a completed repo window fetch is reused for other watchers
+GITHUB_WEBHOOK_SECRET = os.environ.get('GITHUB_WEBHOOK_SECRET', '')
+GITHUB_WEBHOOKS_ENABLED = os.environ.get('GITHUB_WEBHOOKS_ENABLED') == 'True'  # Reconcile only repos with missed pushes
+
+# Report Configuration
+REPORT_RENDER_CACHE_SIZE = 256  # Rendered reports kept per process (0 disables the cache)
+REPORT_RENDER_CACHE_TTL = 3600  # Seconds a rendered report is reused for the same commit set
 
 
 SPECTACULAR_SETTINGS = {